@@ -1,3 +1,14 @@
 from django.contrib import admin
+from .models import AttendanceDailyRollup, AttendanceMonthlyRollup
 
-# Register your models here.
+
+@admin.register(AttendanceDailyRollup)
+class AttendanceDailyRollupAdmin(admin.ModelAdmin):
+    list_display = ("date", "department", "status", "count")
+    list_filter = ("status", "department")
+
+
+@admin.register(AttendanceMonthlyRollup)
+class AttendanceMonthlyRollupAdmin(admin.ModelAdmin):
+    list_display = ("month", "department", "status", "count")
+    list_filter = ("status", "department")
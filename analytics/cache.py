@@ -0,0 +1,164 @@
+"""
+Versioned caching for the analytics endpoints.
+
+Every cached payload key embeds a global "analytics version". Writes to
+Employee, Department or Attendance bump that version (see analytics/signals.py),
+once per transaction after it commits, which makes every older entry
+unreachable at once; stale entries simply age out via ANALYTICS_CACHE_TIMEOUT.
+Hit/miss counters are kept in the same cache.
+
+The version only works if every worker sees the same one, so caching needs a
+shared backend (CACHE_URL, e.g. Redis or a file cache). With a per-process
+backend (the default local memory cache) a bump would only reach the worker
+that made the write, so the endpoints are computed on every request instead
+and answer ``X-Cache: BYPASS``.
+
+The views are async; the ``a*`` helpers use Django's async cache API, while
+the sync ones serve signal handlers and the cache-stats view.
+"""
+
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.core.cache import caches
+from django.db import transaction
+from django.http import JsonResponse
+
+VERSION_KEY = "analytics:version"
+HITS_KEY = "analytics:stats:hits"
+MISSES_KEY = "analytics:stats:misses"
+
+# Backends whose entries are private to one process
+PROCESS_LOCAL_BACKENDS = (
+    "django.core.cache.backends.locmem.LocMemCache",
+    "django.core.cache.backends.dummy.DummyCache",
+)
+
+
+def _alias():
+    return getattr(settings, "ANALYTICS_CACHE_ALIAS", "default")
+
+
+def get_cache():
+    return caches[_alias()]
+
+
+def enabled():
+    """True when the analytics cache is shared by all workers."""
+    return settings.CACHES[_alias()]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
+
+
+def get_version():
+    cache = get_cache()
+    version = cache.get(VERSION_KEY)
+    if version is None:
+        # Seed with a clock value so an evicted counter never reuses old keys.
+        cache.add(VERSION_KEY, time.time_ns(), timeout=None)
+        version = cache.get(VERSION_KEY)
+    return version
+
+
+def bump_version():
+    if not enabled():
+        return
+    cache = get_cache()
+    try:
+        cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, time.time_ns(), timeout=None)
+
+
+def bump_version_on_commit():
+    """Bump the version once the current transaction commits, at most once per transaction."""
+    pending = transaction.get_connection().run_on_commit
+    if not any(func is bump_version for _, func, _ in pending):
+        transaction.on_commit(bump_version)
+
+
+def _count(key):
+    cache = get_cache()
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 0, timeout=None)
+        cache.incr(key)
+
+
+def stats():
+    if not enabled():
+        return {"enabled": False, "hits": 0, "misses": 0, "version": None}
+    cache = get_cache()
+    return {
+        "enabled": True,
+        "hits": cache.get(HITS_KEY, 0),
+        "misses": cache.get(MISSES_KEY, 0),
+        "version": get_version(),
+    }
+
+
+async def aget_version():
+    cache = get_cache()
+    version = await cache.aget(VERSION_KEY)
+    if version is None:
+        await cache.aadd(VERSION_KEY, time.time_ns(), timeout=None)
+        version = await cache.aget(VERSION_KEY)
+    return version
+
+
+async def _acount(key):
+    cache = get_cache()
+    try:
+        await cache.aincr(key)
+    except ValueError:
+        await cache.aadd(key, 0, timeout=None)
+        await cache.aincr(key)
+
+
+async def aget_or_build(name, build, vary=None):
+    """
+    Return ``(payload, state)`` for cache entry ``name``.
+
+    ``build`` is a coroutine function producing the payload on a miss; ``vary``
+    is an extra key component (e.g. today's date). ``state`` is HIT, MISS, or
+    BYPASS when the cache is not shared (see above).
+    """
+    if not enabled():
+        return await build(), "BYPASS"
+    cache = get_cache()
+    key = f"analytics:{name}:v{await aget_version()}"
+    if vary is not None:
+        key = f"{key}:{vary}"
+
+    payload = await cache.aget(key)
+    if payload is not None:
+        await _acount(HITS_KEY)
+        return payload, "HIT"
+
+    await _acount(MISSES_KEY)
+    payload = await build()
+    await cache.aset(key, payload, getattr(settings, "ANALYTICS_CACHE_TIMEOUT", 300))
+    return payload, "MISS"
+
+
+def cached_payload(name, vary=None):
+    """
+    Cache the dict returned by an async analytics view and serve it as JSON.
+
+    ``vary(request)`` may return an extra key component, e.g. today's date for
+    views whose result depends on the calendar. The response carries an
+    ``X-Cache: HIT|MISS|BYPASS`` header.
+    """
+    def decorator(view):
+        @wraps(view)
+        async def wrapper(request, *args, **kwargs):
+            payload, state = await aget_or_build(
+                name,
+                lambda: view(request, *args, **kwargs),
+                vary(request) if vary is not None else None,
+            )
+            response = JsonResponse(payload)
+            response["X-Cache"] = state
+            return response
+        return wrapper
+    return decorator
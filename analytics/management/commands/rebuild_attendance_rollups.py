@@ -0,0 +1,13 @@
+from django.core.management.base import BaseCommand
+
+from analytics import rollups
+
+
+class Command(BaseCommand):
+    help = "Rebuild the daily and monthly attendance rollup tables from raw attendance."
+
+    def handle(self, *args, **options):
+        daily, monthly = rollups.rebuild()
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Attendance rollups rebuilt: {daily} daily rows, {monthly} monthly rows."
+        ))
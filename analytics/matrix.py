@@ -0,0 +1,152 @@
+"""
+Vectorized attendance analytics over a dense employee × day matrix.
+
+load() builds an int8 NumPy matrix (one row per employee, one column per
+day, 0 = no record, 1 = Present, 2 = Absent, 3 = Late) for a department and
+date range in one values_list pass over the packed AttendanceCalendar, which
+already stores those 2-bit codes per employee-month: a year costs 12 rows
+per employee instead of ~260 attendance records, and the bits are unpacked
+with array shifts. metrics() then derives, without Python loops over days:
+
+- absenteeism rate per employee (absent days / recorded days)
+- longest late streak per employee, counted over recorded days, so weekends
+  and other unrecorded days neither extend nor break a streak
+- per weekday: recorded, present, absent and late counts and absence rate
+
+NumPy is an optional dependency; ``available()`` is False without it and the
+endpoint answers 501.
+"""
+
+from calendar import monthrange
+from datetime import timedelta
+
+from attendance.calendar import CODES
+from attendance.models import Attendance, AttendanceCalendar
+from employees.models import Employee
+
+try:
+    import numpy as np
+except ImportError:  # optional dependency
+    np = None
+
+# Same codes as the packed calendar (attendance/calendar.py)
+NONE = 0
+PRESENT = CODES[Attendance.STATUS_PRESENT]
+ABSENT = CODES[Attendance.STATUS_ABSENT]
+LATE = CODES[Attendance.STATUS_LATE]
+WEEKDAYS = ["Mon", "Tue", "Wed", "Thu", "Fri", "Sat", "Sun"]
+
+
+def available():
+    return np is not None
+
+
+def load(department_id, start, end):
+    """Return (employees, matrix) for ``start``..``end`` inclusive; employees are (id, name) rows."""
+    employees = list(Employee.objects
+                     .filter(department_id=department_id)
+                     .order_by("name", "id")
+                     .values_list("id", "name"))
+    days = (end - start).days + 1
+    matrix = np.zeros((len(employees), days), dtype=np.int8)
+
+    months = list(AttendanceCalendar.objects
+                  .filter(employee__department_id=department_id,
+                          month__gte=start.replace(day=1), month__lte=end)
+                  .values_list("employee_id", "month", "days"))
+    if not months:
+        return employees, matrix
+
+    row_of = {pk: i for i, (pk, _) in enumerate(employees)}
+    employee_ids, firsts, packed = zip(*months)
+    rows = np.array([row_of[pk] for pk in employee_ids])
+    offsets = np.array([(first - start).days for first in firsts])
+    lengths = np.array([monthrange(first.year, first.month)[1] for first in firsts])
+
+    # Unpack every month at once: day d of a month sits in bits 2d..2d+1
+    day = np.arange(31)
+    codes = (np.array(packed, dtype=np.int64)[:, None] >> (2 * day)) & 3
+    cols = offsets[:, None] + day
+    keep = (day < lengths[:, None]) & (cols >= 0) & (cols < days)
+    matrix[np.broadcast_to(rows[:, None], cols.shape)[keep], cols[keep]] = codes[keep]
+    return employees, matrix
+
+
+def _rate(numerator, denominator):
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rate = np.round(numerator / denominator, 4)
+    return [None if np.isnan(value) else float(value) for value in rate]
+
+
+def longest_streaks(matrix, code=LATE):
+    """Longest run of ``code`` per row, ignoring NONE cells."""
+    hits = matrix == code
+    # A recorded cell with another status ends a run; a sentinel column ends the last one.
+    breaks = np.concatenate([(matrix != NONE) & ~hits, np.ones((len(matrix), 1), dtype=bool)], axis=1)
+    cumulative = np.concatenate([np.cumsum(hits, axis=1), hits.sum(axis=1, keepdims=True)], axis=1)
+    break_rows, break_cols = np.nonzero(breaks)
+    totals = cumulative[break_rows, break_cols]
+    # hits before each break minus hits before the previous break in the same row
+    previous = np.concatenate([[0], totals[:-1]])
+    previous[np.concatenate([[True], break_rows[1:] != break_rows[:-1]])] = 0
+    longest = np.zeros(len(matrix), dtype=np.int64)
+    np.maximum.at(longest, break_rows, totals - previous)
+    return longest
+
+
+def metrics(employees, matrix, start):
+    """JSON-ready metrics for a loaded matrix whose first column is ``start``."""
+    recorded = (matrix != NONE).sum(axis=1)
+    absent = (matrix == ABSENT).sum(axis=1)
+    late = (matrix == LATE).sum(axis=1)
+    streaks = longest_streaks(matrix)
+
+    weekday = (start.weekday() + np.arange(matrix.shape[1])) % 7
+    weekday_cells = np.broadcast_to(weekday, matrix.shape)
+    by_status = {
+        code: np.bincount(weekday_cells[matrix == code], minlength=7)
+        for code in (PRESENT, ABSENT, LATE)
+    }
+    weekday_recorded = by_status[PRESENT] + by_status[ABSENT] + by_status[LATE]
+
+    return {
+        "employees": [
+            {
+                "id": pk,
+                "name": name,
+                "recorded_days": int(recorded[i]),
+                "absent_days": int(absent[i]),
+                "late_days": int(late[i]),
+                "absenteeism_rate": rate,
+                "longest_late_streak": int(streaks[i]),
+            }
+            for i, ((pk, name), rate) in enumerate(zip(employees, _rate(absent, recorded)))
+        ],
+        "weekdays": [
+            {
+                "weekday": WEEKDAYS[d],
+                "recorded": int(weekday_recorded[d]),
+                "present": int(by_status[PRESENT][d]),
+                "absent": int(by_status[ABSENT][d]),
+                "late": int(by_status[LATE][d]),
+                "absence_rate": rate,
+            }
+            for d, rate in enumerate(_rate(by_status[ABSENT], weekday_recorded))
+        ],
+        "absenteeism_rate": _rate(absent.sum(keepdims=True), recorded.sum(keepdims=True))[0],
+    }
+
+
+def department_report(department_id, start, end):
+    employees, matrix = load(department_id, start, end)
+    return {
+        "department": department_id,
+        "start": start.isoformat(),
+        "end": end.isoformat(),
+        "days": matrix.shape[1],
+        **metrics(employees, matrix, start),
+    }
+
+
+def default_range(today, days=90):
+    return today - timedelta(days=days - 1), today
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:07
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('departments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceDailyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField()),
+                ('status', models.CharField(max_length=10)),
+                ('count', models.IntegerField(default=0)),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_daily_rollups', to='departments.department')),
+            ],
+            options={
+                'verbose_name': 'Daily Attendance Rollup',
+                'verbose_name_plural': 'Daily Attendance Rollups',
+                'ordering': ['-date'],
+                'constraints': [models.UniqueConstraint(fields=('date', 'department', 'status'), name='uniq_attendance_daily_rollup')],
+            },
+        ),
+        migrations.CreateModel(
+            name='AttendanceMonthlyRollup',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month.')),
+                ('status', models.CharField(max_length=10)),
+                ('count', models.IntegerField(default=0)),
+                ('department', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_monthly_rollups', to='departments.department')),
+            ],
+            options={
+                'verbose_name': 'Monthly Attendance Rollup',
+                'verbose_name_plural': 'Monthly Attendance Rollups',
+                'ordering': ['-month'],
+                'constraints': [models.UniqueConstraint(fields=('month', 'department', 'status'), name='uniq_attendance_monthly_rollup')],
+            },
+        ),
+    ]
@@ -0,0 +1,41 @@
+from django.db import migrations
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+
+
+def populate(apps, schema_editor):
+    Attendance = apps.get_model("attendance", "Attendance")
+    Daily = apps.get_model("analytics", "AttendanceDailyRollup")
+    Monthly = apps.get_model("analytics", "AttendanceMonthlyRollup")
+
+    rows = (Attendance.objects
+            .values("date", "employee__department_id", "status")
+            .annotate(total=Count("id"))
+            .order_by())
+    Daily.objects.bulk_create(
+        [Daily(date=r["date"], department_id=r["employee__department_id"], status=r["status"], count=r["total"])
+         for r in rows],
+        batch_size=1000,
+    )
+    rows = (Daily.objects
+            .annotate(month=TruncMonth("date"))
+            .values("month", "department_id", "status")
+            .annotate(total=Sum("count"))
+            .order_by())
+    Monthly.objects.bulk_create(
+        [Monthly(month=r["month"], department_id=r["department_id"], status=r["status"], count=r["total"])
+         for r in rows],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("analytics", "0001_initial"),
+        ("attendance", "0002_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,58 @@
+"""
+Pre-aggregated attendance counts for the analytics endpoints.
+
+Rows are kept in sync with attendance.Attendance by the receivers in
+analytics/signals.py and can be rebuilt from scratch with
+``python manage.py rebuild_attendance_rollups``.
+"""
+
 from django.db import models
+from departments.models import Department
+
+
+class AttendanceDailyRollup(models.Model):
+    """Number of attendance records per day, department and status."""
+
+    date = models.DateField()
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        related_name="attendance_daily_rollups",
+    )
+    status = models.CharField(max_length=10)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["date", "department", "status"], name="uniq_attendance_daily_rollup"),
+        ]
+        ordering = ["-date"]
+        verbose_name = "Daily Attendance Rollup"
+        verbose_name_plural = "Daily Attendance Rollups"
+
+    def __str__(self):
+        return f"{self.date} • {self.department_id} • {self.status}: {self.count}"
+
+
+class AttendanceMonthlyRollup(models.Model):
+    """Number of attendance records per month, department and status."""
+
+    month = models.DateField(help_text="First day of the month.")
+    department = models.ForeignKey(
+        Department,
+        on_delete=models.CASCADE,
+        related_name="attendance_monthly_rollups",
+    )
+    status = models.CharField(max_length=10)
+    count = models.IntegerField(default=0)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["month", "department", "status"], name="uniq_attendance_monthly_rollup"),
+        ]
+        ordering = ["-month"]
+        verbose_name = "Monthly Attendance Rollup"
+        verbose_name_plural = "Monthly Attendance Rollups"
 
-# Create your models here.
+    def __str__(self):
+        return f"{self.month:%Y-%m} • {self.department_id} • {self.status}: {self.count}"
@@ -0,0 +1,151 @@
+"""
+Maintenance of the attendance rollup tables.
+
+- apply_deltas(): incremental +/- updates, used for single-row writes
+- refresh_dates(): recompute a date range (optionally for some departments)
+  from the raw table, used after bulk loads and deletes
+- rebuild(): recompute everything still in the live attendance table
+
+Months moved out by ``partition_attendance`` are no longer in the live table,
+so rebuild() keeps the rollup rows before the oldest live month.
+"""
+
+from collections import Counter
+from datetime import timedelta
+
+from django.db import IntegrityError, transaction
+from django.db.models import Count, F, Sum
+from django.db.models.functions import TruncMonth
+
+from attendance.models import Attendance
+from .models import AttendanceDailyRollup, AttendanceMonthlyRollup
+
+
+def month_of(day):
+    return day.replace(day=1)
+
+
+def _next_month(month):
+    return (month.replace(day=28) + timedelta(days=4)).replace(day=1)
+
+
+def _bump(model, period_field, period, department_id, status, delta):
+    """Add ``delta`` to one rollup row, creating it on first increment."""
+    lookup = {period_field: period, "department_id": department_id, "status": status}
+    if model.objects.filter(**lookup).update(count=F("count") + delta) or delta < 0:
+        return
+    try:
+        with transaction.atomic():
+            model.objects.create(count=delta, **lookup)
+    except IntegrityError:
+        # Another writer created the row first; fall back to the increment.
+        model.objects.filter(**lookup).update(count=F("count") + delta)
+
+
+def apply_deltas(deltas):
+    """
+    Apply a mapping of (date, department_id, status) -> delta.
+
+    Deltas are merged per key first, so moving a record between two days of
+    the same month leaves the monthly row untouched unless the status changed.
+    """
+    daily = Counter()
+    monthly = Counter()
+    for (day, department_id, status), delta in deltas.items():
+        daily[(day, department_id, status)] += delta
+        monthly[(month_of(day), department_id, status)] += delta
+
+    with transaction.atomic():
+        for (day, department_id, status), delta in daily.items():
+            if delta:
+                _bump(AttendanceDailyRollup, "date", day, department_id, status, delta)
+        for (month, department_id, status), delta in monthly.items():
+            if delta:
+                _bump(AttendanceMonthlyRollup, "month", month, department_id, status, delta)
+
+
+def _daily_rows(queryset):
+    return [
+        AttendanceDailyRollup(
+            date=row["date"],
+            department_id=row["employee__department_id"],
+            status=row["status"],
+            count=row["total"],
+        )
+        for row in (queryset
+                    .values("date", "employee__department_id", "status")
+                    .annotate(total=Count("id"))
+                    .order_by())
+    ]
+
+
+def _refresh_months(first=None, last=None, department_ids=None):
+    """Recompute monthly rows for the months ``first``..``last`` (all if omitted)."""
+    monthly = AttendanceMonthlyRollup.objects.all()
+    daily = AttendanceDailyRollup.objects.all()
+    if first is not None:
+        monthly = monthly.filter(month__gte=month_of(first), month__lte=month_of(last))
+        daily = daily.filter(date__gte=month_of(first), date__lt=_next_month(last))
+    if department_ids is not None:
+        monthly = monthly.filter(department_id__in=department_ids)
+        daily = daily.filter(department_id__in=department_ids)
+    monthly.delete()
+    rows = (daily
+            .annotate(month=TruncMonth("date"))
+            .values("month", "department_id", "status")
+            .annotate(total=Sum("count"))
+            .order_by())
+    AttendanceMonthlyRollup.objects.bulk_create(
+        [
+            AttendanceMonthlyRollup(
+                month=row["month"],
+                department_id=row["department_id"],
+                status=row["status"],
+                count=row["total"],
+            )
+            for row in rows
+        ],
+        batch_size=1000,
+    )
+
+
+@transaction.atomic
+def refresh_dates(dates, department_ids=None):
+    """
+    Recompute the daily rows spanning ``dates`` and the months containing them.
+
+    With ``department_ids`` only those departments' rows are recomputed, which
+    is all a write limited to their employees can change.
+    """
+    dates = list(dates)
+    if not dates or (department_ids is not None and not department_ids):
+        return
+    if department_ids is not None:
+        department_ids = list(department_ids)
+    first, last = min(dates), max(dates)
+    daily = AttendanceDailyRollup.objects.filter(date__range=(first, last))
+    rows = Attendance.objects.filter(date__range=(first, last))
+    if department_ids is not None:
+        daily = daily.filter(department_id__in=department_ids)
+        rows = rows.filter(employee__department_id__in=department_ids)
+    daily.delete()
+    AttendanceDailyRollup.objects.bulk_create(_daily_rows(rows), batch_size=1000)
+    _refresh_months(first, last, department_ids)
+
+
+@transaction.atomic
+def rebuild():
+    """Recompute both rollup tables from the raw attendance table (archived months are kept)."""
+    first = Attendance.objects.order_by("date").values_list("date", flat=True).first()
+    daily = AttendanceDailyRollup.objects.all()
+    if first is not None:
+        daily = daily.filter(date__gte=month_of(first))
+    daily.delete()
+    AttendanceDailyRollup.objects.bulk_create(_daily_rows(Attendance.objects.all()), batch_size=1000)
+    if first is None:
+        _refresh_months()
+    else:
+        AttendanceMonthlyRollup.objects.filter(month__gte=month_of(first)).delete()
+        last = AttendanceDailyRollup.objects.order_by("-date").values_list("date", flat=True).first()
+        _refresh_months(first, last)
+    return AttendanceDailyRollup.objects.count(), AttendanceMonthlyRollup.objects.count()
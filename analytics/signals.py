@@ -0,0 +1,104 @@
+"""
+Signal receivers that keep analytics data in sync.
+
+- Attendance rollups: single-row saves apply +1/-1 deltas; bulk loads and
+  deletes (attendance_bulk_loaded) recompute the affected date range for the
+  affected departments. There are deliberately no delete receivers on
+  Attendance: they would make Django load and delete every cascaded row one
+  by one. Deleting an employee recomputes their department's date range once
+  instead; deleting a department takes its rollup rows with it.
+- Analytics cache: any Employee, Department or Attendance write (including
+  bulk loads) bumps the cache version once the transaction commits, once per
+  transaction however many rows it wrote.
+
+Connected in AnalyticsConfig.ready().
+"""
+
+from collections import Counter
+
+from django.db.models import Count, Max, Min
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from attendance.models import Attendance
+from attendance.signals import attendance_bulk_loaded
+from departments.models import Department
+from employees.models import Employee
+from employees.signals import deleted_with_department, employees_bulk_loaded
+from . import rollups
+from .cache import bump_version_on_commit
+
+
+@receiver(post_save, sender=Attendance)
+def attendance_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    deltas = Counter()
+    # Stored row loaded once by attendance.signals.remember_previous
+    previous = getattr(instance, "_attendance_previous", None)
+    if previous is not None:
+        _, day, status, department_id = previous
+        deltas[(day, department_id, status)] -= 1
+    deltas[(instance.date, instance.employee.department_id, instance.status)] += 1
+    rollups.apply_deltas(deltas)
+
+
+@receiver(attendance_bulk_loaded)
+def attendance_bulk_refresh(sender, dates=(), employee_ids=None, **kwargs):
+    department_ids = None
+    if employee_ids is not None:
+        department_ids = set(Employee.objects
+                             .filter(pk__in=list(employee_ids))
+                             .values_list("department_id", flat=True)
+                             .distinct())
+    rollups.refresh_dates(dates, department_ids)
+
+
+@receiver(post_save, sender=Employee)
+def employee_transferred(sender, instance, created=False, raw=False, **kwargs):
+    """Move an employee's attendance counts to their new department."""
+    # Stored department loaded once by employees.signals.remember_department
+    old = getattr(instance, "_previous_department_id", None)
+    if raw or created or old is None or old == instance.department_id:
+        return
+    deltas = Counter()
+    rows = (Attendance.objects
+            .filter(employee=instance)
+            .values("date", "status")
+            .annotate(total=Count("id"))
+            .order_by())
+    for row in rows:
+        deltas[(row["date"], old, row["status"])] -= row["total"]
+        deltas[(row["date"], instance.department_id, row["status"])] += row["total"]
+    rollups.apply_deltas(deltas)
+
+
+@receiver(pre_delete, sender=Employee)
+def employee_deleting(sender, instance, origin=None, **kwargs):
+    """Remember the live date range of the attendance about to be cascaded away."""
+    instance._attendance_range = None
+    if deleted_with_department(origin):
+        return
+    span = (Attendance.objects
+            .filter(employee_id=instance.pk)
+            .aggregate(first=Min("date"), last=Max("date")))
+    if span["first"] is not None:
+        instance._attendance_range = (span["first"], span["last"])
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    span = getattr(instance, "_attendance_range", None)
+    if span is not None:
+        rollups.refresh_dates(span, [instance.department_id])
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+@receiver(post_save, sender=Department)
+@receiver(post_delete, sender=Department)
+@receiver(post_save, sender=Attendance)
+@receiver(attendance_bulk_loaded)
+@receiver(employees_bulk_loaded)
+def invalidate_analytics_cache(sender, **kwargs):
+    bump_version_on_commit()
@@ -1,3 +1,179 @@
-from django.test import TestCase
+import shutil
+import tempfile
+from datetime import date, timedelta
+from unittest import skipUnless
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.test import TestCase, override_settings
+from rest_framework_simplejwt.tokens import AccessToken
+
+from attendance.bulk import upsert_attendance
+from attendance.models import Attendance
+from departments.models import Department
+from employees.models import Employee
+from . import cache, matrix, rollups
+from .models import AttendanceDailyRollup, AttendanceMonthlyRollup
+
+
+def shared_cache(test):
+    """Run ``test`` with a file cache, which every worker process would share."""
+    location = tempfile.mkdtemp()
+    test.addCleanup(shutil.rmtree, location)
+    test.enterContext(override_settings(CACHES={"default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location,
+    }}))
+
+
+@skipUnless(matrix.available(), "NumPy is not installed")
+class AttendanceMatrixTests(TestCase):
+    """Vectorized metrics on a small hand-checked department."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept = Department.objects.create(name="Engineering")
+        cls.start = date(2025, 3, 3)  # a Monday
+        a = Employee.objects.create(name="A", email="a@example.com", date_of_joining=date(2024, 1, 1),
+                                    department=cls.dept)
+        Employee.objects.create(name="B", email="b@example.com", date_of_joining=date(2024, 1, 1),
+                                department=cls.dept)
+        # Mon-Fri: Late, Late, Absent, Late, Late; next Mon-Tue: Late, Present
+        statuses = ["Late", "Late", "Absent", "Late", "Late", None, None, "Late", "Present"]
+        for offset, status in enumerate(statuses):
+            if status:
+                Attendance.objects.create(employee=a, date=cls.start + timedelta(days=offset), status=status)
+
+    def test_department_report(self):
+        with self.assertNumQueries(2):
+            report = matrix.department_report(self.dept.pk, self.start, self.start + timedelta(days=8))
+        a, b = report["employees"]
+        self.assertEqual((a["recorded_days"], a["absent_days"], a["late_days"]), (7, 1, 5))
+        self.assertEqual(a["absenteeism_rate"], round(1 / 7, 4))
+        # Thu, Fri, (weekend), Mon: the weekend does not break the streak
+        self.assertEqual(a["longest_late_streak"], 3)
+        self.assertEqual((b["recorded_days"], b["absenteeism_rate"], b["longest_late_streak"]), (0, None, 0))
+        monday = report["weekdays"][0]
+        self.assertEqual((monday["recorded"], monday["late"], monday["absence_rate"]), (2, 2, 0.0))
+        self.assertEqual(report["weekdays"][2]["absent"], 1)
+        self.assertEqual(report["absenteeism_rate"], round(1 / 7, 4))
+
+    def test_empty_department(self):
+        empty = Department.objects.create(name="Empty")
+        report = matrix.department_report(empty.pk, self.start, self.start)
+        self.assertEqual((report["employees"], report["absenteeism_rate"]), ([], None))
+
+    def test_endpoint(self):
+        shared_cache(self)
+        url = "/api/v1/analytics/attendance-matrix/"
+        params = {"department": self.dept.pk, "start": "2025-03-03", "end": "2025-03-11"}
+        self.assertEqual(self.client.get(url, params).status_code, 401)
+        user = get_user_model().objects.create_user("clerk", "clerk@example.com", "pw")
+        self.client.defaults["HTTP_AUTHORIZATION"] = f"Bearer {AccessToken.for_user(user)}"
+        self.assertEqual(self.client.get(url, params)["X-Cache"], "MISS")
+        response = self.client.get(url, params)
+        self.assertEqual((response.status_code, response["X-Cache"]), (200, "HIT"))
+        self.assertEqual(response.json()["days"], 9)
+        self.assertEqual(self.client.get(url, {"department": self.dept.pk, "start": "2025-03-12",
+                                               "end": "2025-03-11"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {**params, "department": "²"}).status_code, 400)
+
+
+class RollupTests(TestCase):
+    """Incremental rollup maintenance must match a full rebuild after every kind of write."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.depts = [Department.objects.create(name=name) for name in ("Engineering", "Sales")]
+        cls.emps = [
+            Employee.objects.create(name=f"E{i}", email=f"r{i}@example.com", date_of_joining=date(2024, 1, 1),
+                                    department=cls.depts[i % 2])
+            for i in range(3)
+        ]
+
+    def snapshot(self):
+        # Deltas can leave rows at zero behind, which read the same as no row
+        return (sorted(AttendanceDailyRollup.objects.exclude(count=0)
+                       .values_list("date", "department_id", "status", "count")),
+                sorted(AttendanceMonthlyRollup.objects.exclude(count=0)
+                       .values_list("month", "department_id", "status", "count")))
+
+    def assertMatchesRebuild(self):
+        incremental = self.snapshot()
+        rollups.rebuild()
+        self.assertEqual(incremental, self.snapshot())
+
+    def test_single_row_writes(self):
+        a, b, c = self.emps
+        record = Attendance.objects.create(employee=a, date=date(2025, 3, 31), status=Attendance.STATUS_LATE)
+        Attendance.objects.create(employee=b, date=date(2025, 3, 31), status=Attendance.STATUS_LATE)
+        Attendance.objects.create(employee=c, date=date(2025, 4, 1), status=Attendance.STATUS_PRESENT)
+        self.assertEqual(AttendanceMonthlyRollup.objects.get(month=date(2025, 3, 1), department=self.depts[0]).count, 1)
+        self.assertMatchesRebuild()
+
+        record.status = Attendance.STATUS_ABSENT
+        record.save()
+        self.assertMatchesRebuild()
+        record.date = date(2025, 4, 2)  # moves to another month
+        record.save()
+        self.assertMatchesRebuild()
+
+        record.delete()
+        self.assertMatchesRebuild()
+        Attendance.objects.filter(employee=b).delete()
+        self.assertMatchesRebuild()
+        self.assertEqual(self.snapshot()[1], [(date(2025, 4, 1), self.depts[0].pk, "Present", 1)])
+
+    def test_bulk_and_cascades(self):
+        a, b, c = self.emps
+        days = [date(2025, 5, 1) + timedelta(days=d) for d in range(40)]
+        upsert_attendance([(emp.pk, day, Attendance.STATUS_PRESENT) for emp in self.emps for day in days])
+        self.assertMatchesRebuild()
+
+        c.department = self.depts[1]  # transfer
+        c.save()
+        self.assertMatchesRebuild()
+
+        a.delete()
+        self.assertMatchesRebuild()
+        self.depts[1].delete()  # takes b, c and their rollup rows with it
+        self.assertMatchesRebuild()
+        self.assertFalse(AttendanceDailyRollup.objects.exists())
+
+
+class AnalyticsCacheTests(TestCase):
+    """Payloads are cached only in a shared cache, and each transaction bumps the version once."""
+
+    url = "/api/v1/analytics/employees-per-department/"
+
+    def test_local_memory_cache_is_bypassed(self):
+        self.assertEqual([self.client.get(self.url)["X-Cache"] for _ in range(2)], ["BYPASS", "BYPASS"])
+        self.assertEqual(cache.stats()["enabled"], False)
+
+    def test_shared_cache(self):
+        shared_cache(self)
+        self.assertEqual([self.client.get(self.url)["X-Cache"] for _ in range(2)], ["MISS", "HIT"])
+        version = cache.get_version()
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            with transaction.atomic():
+                dept = Department.objects.create(name="Engineering")
+                for i in range(3):
+                    Employee.objects.create(name=f"E{i}", email=f"cache{i}@example.com",
+                                            date_of_joining=date(2024, 1, 1), department=dept)
+        self.assertEqual(len(callbacks), 1)
+        self.assertEqual(cache.get_version(), version + 1)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Cache"], "MISS")
+        self.assertEqual(response.json()["values"], [3])
+
+    def test_stats_are_staff_only(self):
+        url = "/api/v1/analytics/cache-stats/"
+        self.assertEqual(self.client.get(url).status_code, 401)
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION="Bearer nonsense").status_code, 401)
+        users = get_user_model().objects
+        user = users.create_user("clerk", "clerk@example.com", "pw")
+        self.assertEqual(self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(user)}").status_code,
+                         403)
+        admin = users.create_user("staff", "staff@example.com", "pw", is_staff=True)
+        response = self.client.get(url, HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(admin)}")
+        self.assertEqual((response.status_code, response.json()["enabled"]), (200, False))
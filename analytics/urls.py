@@ -6,4 +6,8 @@ urlpatterns = [
     path("charts/", views.charts_page, name="charts"),
     path("employees-per-department/", views.employees_per_department, name="employees-per-department"),
     path("monthly-attendance/", views.monthly_attendance, name="monthly-attendance"),
+    path("dashboard/", views.dashboard, name="analytics-dashboard"),
+    path("attendance-matrix/", views.attendance_matrix, name="analytics-attendance-matrix"),
+    path("cache-stats/", views.cache_stats, name="analytics-cache-stats"),
+    path("db-stats/", views.db_stats, name="analytics-db-stats"),
 ]
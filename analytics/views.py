@@ -1,37 +1,180 @@
 # analytics/views.py
+"""
+Analytics views, written against Django's async ORM.
+
+Under ASGI (see the uvicorn profile in the README) a slow aggregation awaits
+the database instead of occupying one of gunicorn's fixed worker threads, so
+CRUD requests keep flowing. ``dashboard`` returns both chart payloads in one
+request, building them concurrently with asyncio.gather; each part shares its
+versioned cache entry with the single-chart endpoint. (Django still runs each
+async-ORM query on the request's sync thread, so the overlap is in cache
+round-trips and waiting, not parallel SQL on one connection.)
+"""
+
+import asyncio
+from datetime import date, timedelta
+from functools import wraps
+
+from asgiref.sync import iscoroutinefunction, sync_to_async
+
+from django.db.models import Q, Sum
 from django.http import JsonResponse
 from django.shortcuts import render
-from django.db.models import Count, Q
-from django.db.models.functions import TruncMonth
 from django.utils import timezone
-from datetime import timedelta
+from rest_framework.exceptions import AuthenticationFailed
 
-from employees.models import Employee
 from attendance.models import Attendance
+from departments.models import Department
+from employee_project import pooling
+from employees.authentication import CachedJWTAuthentication
+from .cache import aget_or_build, cached_payload, stats
+from .models import AttendanceMonthlyRollup
+
+
+def _today():
+    return timezone.now().date().isoformat()
 
-def charts_page(request):
-    # if your template is at templates/charts.html:
-    return render(request, "charts.html")
 
-def employees_per_department(request):
-    rows = (Employee.objects
-            .values("department__name")
-            .annotate(total=Count("id"))
-            .order_by("department__name"))
-    labels = [r["department__name"] or "Unassigned" for r in rows]
-    values = [r["total"] for r in rows]
-    return JsonResponse({"labels": labels, "values": values})
+def jwt_required(staff=False):
+    """
+    Authenticate a plain (sync or async) view like the API viewsets do:
+    401 without a valid access token (CachedJWTAuthentication), and 403 for
+    users who are not staff when ``staff`` is set.
+    """
+    def check(request):
+        authenticator = CachedJWTAuthentication()
+        try:
+            result = authenticator.authenticate(request)
+        except AuthenticationFailed as exc:
+            detail = exc.detail if isinstance(exc.detail, dict) else {"detail": exc.detail}
+            result, denied = None, JsonResponse(detail, status=401)
+        else:
+            denied = JsonResponse({"detail": "Authentication credentials were not provided."}, status=401)
+        if result is None:
+            denied["WWW-Authenticate"] = authenticator.authenticate_header(request)
+            return denied
+        request.user = result[0]
+        if staff and not (request.user.is_staff or request.user.is_superuser):
+            return JsonResponse({"detail": "You do not have permission to perform this action."}, status=403)
+        return None
 
-def monthly_attendance(request):
+    def decorator(view):
+        if iscoroutinefunction(view):
+            @wraps(view)
+            async def wrapper(request, *args, **kwargs):
+                denied = await sync_to_async(check)(request)
+                return denied or await view(request, *args, **kwargs)
+        else:
+            @wraps(view)
+            def wrapper(request, *args, **kwargs):
+                return check(request) or view(request, *args, **kwargs)
+        return wrapper
+
+    return decorator
+
+
+async def department_headcounts():
+    # Stored counter (see departments/headcount.py) instead of a GROUP BY over employees
+    rows = (Department.objects
+            .filter(headcount__gt=0)
+            .order_by("name")
+            .values_list("name", "headcount"))
+    rows = [r async for r in rows]
+    labels = [name for name, _ in rows]
+    values = [total for _, total in rows]
+    return {"labels": labels, "values": values}
+
+
+async def present_by_month():
     today = timezone.now().date()
     start = (today.replace(day=1) - timedelta(days=180)).replace(day=1)
     present_value = getattr(Attendance, "STATUS_PRESENT", "present")
-    qs = (Attendance.objects
-          .filter(date__gte=start)
-          .annotate(month=TruncMonth("date"))
+    # Served from the monthly rollup (see analytics/rollups.py), not raw attendance
+    qs = (AttendanceMonthlyRollup.objects
+          .filter(month__gte=start, count__gt=0)
           .values("month")
-          .annotate(present=Count("id", filter=Q(status=present_value)))
+          .annotate(present=Sum("count", filter=Q(status=present_value), default=0))
           .order_by("month"))
-    labels = [row["month"].strftime("%Y-%m") for row in qs]
-    values = [row["present"] for row in qs]
-    return JsonResponse({"labels": labels, "values": values})
+    rows = [row async for row in qs]
+    labels = [row["month"].strftime("%Y-%m") for row in rows]
+    values = [row["present"] for row in rows]
+    return {"labels": labels, "values": values}
+
+
+def charts_page(request):
+    # if your template is at templates/charts.html:
+    return render(request, "charts.html")
+
+
+@cached_payload("employees-per-department")
+async def employees_per_department(request):
+    return await department_headcounts()
+
+
+@cached_payload("monthly-attendance", vary=lambda request: _today())
+async def monthly_attendance(request):
+    return await present_by_month()
+
+
+async def dashboard(request):
+    """Both chart payloads in one response, built concurrently."""
+    (departments, dept_state), (monthly, monthly_state) = await asyncio.gather(
+        aget_or_build("employees-per-department", department_headcounts),
+        aget_or_build("monthly-attendance", present_by_month, _today()),
+    )
+    response = JsonResponse({
+        "employees_per_department": departments,
+        "monthly_attendance": monthly,
+    })
+    response["X-Cache"] = f"employees-per-department={dept_state}, monthly-attendance={monthly_state}"
+    return response
+
+
+@jwt_required()
+async def attendance_matrix(request):
+    """
+    Absenteeism, late streaks and weekday patterns for one department.
+
+    Query: ``department`` (id, required), ``start``/``end`` (YYYY-MM-DD,
+    default the last 90 days; at most 366 days). Computed with NumPy over an
+    employee × day matrix (see analytics/matrix.py) and cached like the
+    other analytics payloads. Needs a JWT access token, like the API.
+    """
+    from . import matrix  # NumPy is imported on first use, not at startup
+
+    if not matrix.available():
+        return JsonResponse({"detail": "NumPy is not installed."}, status=501)
+    try:
+        department = int(request.GET.get("department", ""))
+    except ValueError:
+        department = 0
+    if department < 1:
+        return JsonResponse({"detail": "department (id) is required."}, status=400)
+    start, end = matrix.default_range(timezone.now().date())
+    try:
+        start = date.fromisoformat(request.GET.get("start") or start.isoformat())
+        end = date.fromisoformat(request.GET.get("end") or end.isoformat())
+    except ValueError:
+        return JsonResponse({"detail": "start and end must be YYYY-MM-DD."}, status=400)
+    if not timedelta(0) <= end - start < timedelta(days=366):
+        return JsonResponse({"detail": "end must be on or after start, within 366 days."}, status=400)
+
+    async def build():
+        return await sync_to_async(matrix.department_report)(department, start, end)
+
+    payload, state = await aget_or_build("attendance-matrix", build, f"{department}:{start}:{end}")
+    response = JsonResponse(payload)
+    response["X-Cache"] = state
+    return response
+
+
+@jwt_required(staff=True)
+def cache_stats(request):
+    """Hit/miss counters and current version of the analytics cache (staff only)."""
+    return JsonResponse(stats())
+
+
+@jwt_required(staff=True)
+def db_stats(request):
+    """Database connection reuse for the worker that answered (staff only, see employee_project/pooling.py)."""
+    return JsonResponse(pooling.stats())
@@ -1,8 +1,15 @@
 from django.contrib import admin
-from .models import Attendance
+from .models import Attendance, AttendanceArchive
 
 @admin.register(Attendance)
 class AttendanceAdmin(admin.ModelAdmin):
     list_display = ("id", "employee", "date", "status")
     list_filter = ("status", "date", "employee__department")
     search_fields = ("employee__name", "employee__email")
+
+
+@admin.register(AttendanceArchive)
+class AttendanceArchiveAdmin(admin.ModelAdmin):
+    list_display = ("id", "employee", "date", "status")
+    list_filter = ("status", "date")
+    search_fields = ("employee__name", "employee__email")
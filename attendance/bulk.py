@@ -0,0 +1,90 @@
+"""
+Bulk write helpers for Attendance.
+
+Rows are upserted on the (employee, date) unique key with a single
+INSERT ... ON CONFLICT (employee_id, date) DO UPDATE per batch. Backends
+without conflict-target support fall back to update_or_create per row.
+On PostgreSQL, copy_upsert_attendance() streams rows with COPY into a
+temporary staging table and merges them with one INSERT ... SELECT.
+"""
+
+from django.db import connection, transaction
+from employee_project.imports import copy_rows
+from .models import Attendance
+from .signals import attendance_bulk_loaded
+
+STAGING_TABLE = "attendance_import_staging"
+
+UPSERT_BATCH_SIZE = 1000
+
+
+def existing_keys(keys):
+    """Return the subset of (employee_id, date) keys already stored, in one query."""
+    keys = set(keys)
+    if not keys:
+        return set()
+    employee_ids = {emp_id for emp_id, _ in keys}
+    dates = {dt for _, dt in keys}
+    found = (Attendance.objects
+             .filter(employee_id__in=employee_ids, date__in=dates)
+             .values_list("employee_id", "date"))
+    return keys.intersection(found)
+
+
+@transaction.atomic
+def upsert_attendance(rows, batch_size=UPSERT_BATCH_SIZE, notify=True):
+    """
+    Insert or update attendance rows.
+
+    ``rows`` is a list of (employee_id, date, status) tuples with unique
+    (employee_id, date) keys. Returns the set of keys that already existed
+    (i.e. were updated rather than created). With ``notify=False`` the caller
+    sends attendance_bulk_loaded itself (e.g. once for a whole import).
+    """
+    updated = existing_keys((emp_id, dt) for emp_id, dt, _ in rows)
+    objs = [Attendance(employee_id=emp_id, date=dt, status=status) for emp_id, dt, status in rows]
+
+    if connection.features.supports_update_conflicts_with_target:
+        Attendance.objects.bulk_create(
+            objs,
+            batch_size=batch_size,
+            update_conflicts=True,
+            unique_fields=["employee", "date"],
+            update_fields=["status", "updated_at"],
+        )
+    else:
+        for obj in objs:
+            Attendance.objects.update_or_create(
+                employee_id=obj.employee_id, date=obj.date, defaults={"status": obj.status},
+            )
+    if rows and notify:
+        attendance_bulk_loaded.send(
+            sender=Attendance,
+            dates={dt for _, dt, _ in rows},
+            employee_ids={emp_id for emp_id, _, _ in rows},
+        )
+    return updated
+
+
+@transaction.atomic
+def copy_upsert_attendance(rows, batch_size=UPSERT_BATCH_SIZE):
+    """
+    PostgreSQL only: upsert (employee_id, date, status) rows via COPY.
+
+    Keys must be unique within ``rows``. Does not send attendance_bulk_loaded.
+    Returns the number of rows written.
+    """
+    table = Attendance._meta.db_table
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"CREATE TEMP TABLE IF NOT EXISTS {STAGING_TABLE} "
+            f"(employee_id bigint, date date, status varchar(10)) ON COMMIT DELETE ROWS"
+        )
+        copy_rows(STAGING_TABLE, ("employee_id", "date", "status"), rows, batch_size)
+        cursor.execute(
+            f"INSERT INTO {table} (employee_id, date, status, updated_at) "
+            f"SELECT employee_id, date, status, now() FROM {STAGING_TABLE} "
+            f"ON CONFLICT (employee_id, date) DO UPDATE "
+            f"SET status = EXCLUDED.status, updated_at = EXCLUDED.updated_at"
+        )
+        return cursor.rowcount
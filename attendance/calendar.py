@@ -0,0 +1,127 @@
+"""
+Maintenance of the packed attendance calendar (AttendanceCalendar).
+
+- set_day()/clear_day(): rewrite one day's 2 bits in place, used for
+  single-row writes (receivers in attendance/signals.py)
+- refresh(): recompute whole employee-months from the raw table, used after
+  bulk loads and deletes
+- rebuild(): recompute every month that still has live rows
+- department_month(): a department's month as one digit string per employee
+"""
+
+from collections import defaultdict
+from datetime import date
+
+from django.db import IntegrityError, transaction
+from django.db.models import F, OuterRef, Subquery
+
+from employees.models import Employee
+from .models import Attendance, AttendanceCalendar
+
+CODES = {
+    Attendance.STATUS_PRESENT: 1,
+    Attendance.STATUS_ABSENT: 2,
+    Attendance.STATUS_LATE: 3,
+}
+LEGEND = {"0": None, **{str(code): status for status, code in CODES.items()}}
+
+
+def month_of(day):
+    return day.replace(day=1)
+
+
+def _next_month(month):
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _shift(day):
+    return 2 * (day.day - 1)
+
+
+def pack(statuses):
+    """Pack a {date: status} mapping for one month into an integer."""
+    bits = 0
+    for day, status in statuses.items():
+        bits |= CODES[status] << _shift(day)
+    return bits
+
+
+def unpack(bits, month):
+    """Digit string with one status code per day of ``month``."""
+    length = (_next_month(month) - month).days
+    return "".join(str((bits >> (2 * i)) & 3) for i in range(length))
+
+
+def _write_day(employee_id, day, code):
+    lookup = {"employee_id": employee_id, "month": month_of(day)}
+    mask = 3 << _shift(day)
+    value = F("days").bitand(~mask).bitor(code << _shift(day))
+    if AttendanceCalendar.objects.filter(**lookup).update(days=value) or not code:
+        return
+    try:
+        with transaction.atomic():
+            AttendanceCalendar.objects.create(days=code << _shift(day), **lookup)
+    except IntegrityError:
+        # Another writer created the month first; fall back to the update.
+        AttendanceCalendar.objects.filter(**lookup).update(days=value)
+
+
+def set_day(employee_id, day, status):
+    _write_day(employee_id, day, CODES[status])
+
+
+def clear_day(employee_id, day):
+    _write_day(employee_id, day, 0)
+
+
+@transaction.atomic
+def refresh(dates, employee_ids=None):
+    """Recompute the months spanning ``dates`` (for ``employee_ids``, or everyone)."""
+    dates = list(dates)
+    if not dates:
+        return
+    first, end = month_of(min(dates)), _next_month(max(dates))
+    calendars = AttendanceCalendar.objects.filter(month__gte=first, month__lt=end)
+    rows = Attendance.objects.filter(date__gte=first, date__lt=end)
+    if employee_ids is not None:
+        employee_ids = list(employee_ids)
+        calendars = calendars.filter(employee_id__in=employee_ids)
+        rows = rows.filter(employee_id__in=employee_ids)
+    calendars.delete()
+    _store(rows)
+
+
+def _store(rows):
+    packed = defaultdict(int)
+    for employee_id, day, status in rows.values_list("employee_id", "date", "status").iterator(chunk_size=5000):
+        packed[(employee_id, month_of(day))] |= CODES[status] << _shift(day)
+    AttendanceCalendar.objects.bulk_create(
+        [AttendanceCalendar(employee_id=emp_id, month=month, days=bits)
+         for (emp_id, month), bits in packed.items()],
+        batch_size=1000,
+    )
+    return len(packed)
+
+
+@transaction.atomic
+def rebuild():
+    """
+    Recompute the calendar from raw attendance. Months before the oldest live
+    row have been archived and are kept, as the analytics rollups do.
+    """
+    first = Attendance.objects.order_by("date").values_list("date", flat=True).first()
+    if first is None:
+        return 0
+    AttendanceCalendar.objects.filter(month__gte=month_of(first)).delete()
+    return _store(Attendance.objects.all())
+
+
+def department_month(department_id, month):
+    """Employees of a department with their packed month, in one query."""
+    bits = AttendanceCalendar.objects.filter(employee=OuterRef("pk"), month=month).values("days")
+    rows = (Employee.objects
+            .filter(department_id=department_id)
+            .annotate(days=Subquery(bits))
+            .order_by("name", "id")
+            .values_list("id", "name", "days"))
+    return [{"id": pk, "name": name, "days": unpack(days or 0, month)} for pk, name, days in rows]
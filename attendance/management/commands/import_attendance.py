@@ -0,0 +1,82 @@
+from datetime import date, timedelta
+
+from django.db.models.functions import Lower
+
+from attendance.bulk import copy_upsert_attendance, upsert_attendance
+from attendance.models import Attendance
+from attendance.signals import attendance_bulk_loaded
+from employee_project.imports import CsvImportCommand, RowError
+from employees.models import Employee
+
+STATUSES = {value.lower(): value for value, _ in Attendance.STATUS_CHOICES}
+
+
+class Command(CsvImportCommand):
+    help = (
+        "Import attendance from CSV with columns date, status and either email "
+        "or employee_id. Existing (employee, date) records are updated."
+    )
+    required_columns = ("date", "status")
+    default_chunk_size = 20000
+
+    def prepare(self, opts):
+        # One query each; rows are matched by email (case-insensitive) or id
+        self.by_email = dict(Employee.objects.values_list(Lower("email"), "id"))
+        self.employee_ids = set(self.by_email.values())
+
+    def validate(self, row):
+        email = (row.get("email") or "").strip().lower()
+        raw_id = (row.get("employee_id") or "").strip()
+        if email:
+            employee_id = self.by_email.get(email)
+            if employee_id is None:
+                raise RowError(f"unknown employee email {email!r}")
+        elif raw_id:
+            try:
+                employee_id = int(raw_id)
+            except ValueError:
+                employee_id = None
+            if employee_id not in self.employee_ids:
+                raise RowError(f"unknown employee_id {raw_id!r}")
+        else:
+            raise RowError("email or employee_id is required")
+
+        try:
+            day = date.fromisoformat((row.get("date") or "").strip())
+        except ValueError:
+            raise RowError("date must be YYYY-MM-DD")
+        status = STATUSES.get((row.get("status") or "").strip().lower())
+        if status is None:
+            raise RowError(f"status must be one of {', '.join(STATUSES.values())}")
+        return employee_id, day, status
+
+    def load(self, rows, opts):
+        # Last row wins when a chunk repeats an (employee, date) key
+        rows = list({(emp_id, day): (emp_id, day, status) for emp_id, day, status in rows}.values())
+        if not rows:
+            return
+        if opts["use_copy"]:
+            copy_upsert_attendance(rows, opts["batch_size"])
+        else:
+            upsert_attendance(rows, opts["batch_size"], notify=False)
+
+    def chunk_state(self, rows, state):
+        # The touched date range survives --resume, so finish() covers the whole import
+        if not rows:
+            return
+        first = min(day for _, day, _ in rows).isoformat()
+        last = max(day for _, day, _ in rows).isoformat()
+        state["first_date"] = min(state.get("first_date", first), first)
+        state["last_date"] = max(state.get("last_date", last), last)
+
+    def finish(self, state, opts):
+        if "first_date" not in state:
+            return
+        first = date.fromisoformat(state["first_date"])
+        last = date.fromisoformat(state["last_date"])
+        self.stdout.write("🔄 Refreshing derived attendance data...")
+        attendance_bulk_loaded.send(
+            sender=Attendance,
+            dates=[first + timedelta(days=n) for n in range((last - first).days + 1)],
+            employee_ids=None,
+        )
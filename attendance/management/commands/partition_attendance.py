@@ -0,0 +1,113 @@
+from datetime import datetime
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+
+from attendance import partitions
+from attendance.models import Attendance
+
+
+class Command(BaseCommand):
+    help = (
+        "Create upcoming monthly attendance partitions (PostgreSQL, after a one-off --convert) "
+        "and archive months older than --retain-months (all backends)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--ahead", type=int, default=3,
+            help="Months after the current one to create partitions for (default=3)",
+        )
+        parser.add_argument(
+            "--retain-months", type=int,
+            help="Keep this many months before the current one live; archive anything older",
+        )
+        parser.add_argument(
+            "--detach", action="store_true",
+            help="PostgreSQL: detach old partitions as standalone tables instead of copying them to the archive",
+        )
+        parser.add_argument(
+            "--convert", action="store_true",
+            help="PostgreSQL: rebuild the attendance table as a partitioned table first. Rewrites and locks "
+                 "the whole table; run it once, in a maintenance window",
+        )
+        parser.add_argument("--restore", metavar="YYYY-MM", help="Move an archived month back into the live table")
+        parser.add_argument("--dry-run", action="store_true", help="Only print what would be done")
+
+    def handle(self, *args, **opts):
+        if opts["ahead"] < 0 or (opts["retain_months"] is not None and opts["retain_months"] < 0):
+            raise CommandError("--ahead and --retain-months must not be negative.")
+        current = partitions.month_start(timezone.localdate())
+        cutoff = None
+        if opts["retain_months"] is not None:
+            cutoff = partitions.add_months(current, -opts["retain_months"])
+        dry_run = opts["dry_run"]
+
+        if opts["restore"]:
+            try:
+                month = datetime.strptime(opts["restore"], "%Y-%m").date()
+            except ValueError:
+                raise CommandError("--restore must be YYYY-MM.")
+            if cutoff is not None and month < cutoff:
+                raise CommandError(f"{month:%Y-%m} is older than --retain-months and would be archived again.")
+            if dry_run:
+                self.stdout.write(f"   ↩️  restore {month:%Y-%m} (dry run)")
+            else:
+                restored = partitions.restore_month(month)
+                self.stdout.write(self.style.SUCCESS(f"↩️  {restored} row(s) of {month:%Y-%m} restored."))
+
+        partitioned = partitions.is_partitioned()
+        if opts["convert"]:
+            if connection.vendor != "postgresql":
+                raise CommandError("--convert needs PostgreSQL.")
+            if partitioned:
+                self.stdout.write("   The attendance table is already partitioned.")
+            else:
+                self.stdout.write("   🔁 converting the attendance table to monthly partitions")
+                if not dry_run:
+                    partitions.convert_table()
+                    partitioned = True
+
+        # -------------------------------
+        # Create partitions
+        # -------------------------------
+        if partitioned:
+            existing = set(partitions.monthly_partitions())
+            month = min(partitions.oldest_month() or current, current)
+            if cutoff is not None:
+                month = max(month, cutoff)
+            created = 0
+            while month <= partitions.add_months(current, opts["ahead"]):
+                if month not in existing:
+                    self.stdout.write(f"   ➕ {partitions.partition_name(month)}")
+                    if not dry_run:
+                        partitions.create_partition(month)
+                    created += 1
+                month = partitions.add_months(month, 1)
+            self.stdout.write(self.style.SUCCESS(f"✅ {created} partition(s) created."))
+        elif connection.vendor == "postgresql":
+            self.stdout.write(self.style.WARNING(
+                "⚠️  The attendance table is not partitioned (see --convert); old months go to the archive table."
+            ))
+        else:
+            self.stdout.write(self.style.WARNING(
+                f"⚠️  {connection.vendor} has no native partitioning; old months go to the archive table."
+            ))
+
+        # -------------------------------
+        # Archive old months
+        # -------------------------------
+        if cutoff is None:
+            return
+        months = set(Attendance.objects.filter(date__lt=cutoff).dates("date", "month"))
+        if partitioned:
+            months.update(m for m in partitions.monthly_partitions() if m < cutoff)
+        moved = 0
+        for month in sorted(months):
+            action = "detach" if opts["detach"] and partitioned else "archive"
+            self.stdout.write(f"   📦 {action} {month:%Y-%m}")
+            if not dry_run:
+                moved += partitions.archive_month(month, detach=opts["detach"])
+        outcome = "to archive (dry run)" if dry_run else f"archived ({moved} rows)"
+        self.stdout.write(self.style.SUCCESS(f"🎉 {len(months)} month(s) before {cutoff:%Y-%m} {outcome}."))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from attendance import calendar
+
+
+class Command(BaseCommand):
+    help = "Rebuild the packed attendance calendar (one row per employee-month) from raw attendance; archived months are kept."
+
+    def handle(self, *args, **options):
+        months = calendar.rebuild()
+        self.stdout.write(self.style.SUCCESS(f"✅ Attendance calendar rebuilt: {months} employee-months."))
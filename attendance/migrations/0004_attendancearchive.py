@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:31
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0003_attendance_updated_at'),
+        ('employees', '0004_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date', models.DateField(help_text='Date of the attendance record.')),
+                ('status', models.CharField(choices=[('Present', 'Present'), ('Absent', 'Absent'), ('Late', 'Late')], max_length=10)),
+                ('updated_at', models.DateTimeField(help_text='Last modification time while the row was live.')),
+                ('employee', models.ForeignKey(help_text='Employee associated with this attendance record.', on_delete=django.db.models.deletion.CASCADE, related_name='archived_attendance', to='employees.employee')),
+            ],
+            options={
+                'verbose_name': 'Archived Attendance Record',
+                'verbose_name_plural': 'Archived Attendance Records',
+                'ordering': ['-date'],
+                'unique_together': {('employee', 'date')},
+            },
+        ),
+    ]
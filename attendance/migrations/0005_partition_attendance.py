@@ -0,0 +1,85 @@
+"""
+PostgreSQL: turn attendance_attendance into a table partitioned by month.
+
+The table is rebuilt as ``PARTITION BY RANGE (date)`` with the same columns,
+indexes, foreign key and unique (employee_id, date) constraint (it contains
+the partition key, so PostgreSQL can enforce it). The primary key becomes
+(id, date); ids still come from the same identity sequence, so the ORM keeps
+treating ``id`` as the key. Existing rows land in the DEFAULT partition and
+``manage.py partition_attendance`` splits them into monthly partitions.
+
+Other backends are left untouched (see attendance/partitions.py).
+"""
+
+from django.db import migrations
+
+TABLE = "attendance_attendance"
+LEGACY = "attendance_attendance_legacy"
+
+
+def partition_table(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [TABLE])
+        if cursor.fetchone():
+            return
+        constraints = connection.introspection.get_constraints(cursor, TABLE)
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY}")
+
+        # Free the constraint/index names for the new table
+        for name, info in constraints.items():
+            if info["primary_key"] or info["unique"] or info["foreign_key"]:
+                cursor.execute(f'ALTER TABLE {LEGACY} DROP CONSTRAINT "{name}"')
+            elif info["index"]:
+                cursor.execute(f'DROP INDEX "{name}"')
+
+        cursor.execute(
+            f"CREATE TABLE {TABLE} (LIKE {LEGACY} INCLUDING DEFAULTS INCLUDING IDENTITY) "
+            f"PARTITION BY RANGE (date)"
+        )
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id, date)')
+        for name, info in constraints.items():
+            columns = ", ".join(info["columns"])
+            if info["primary_key"]:
+                continue
+            if info["foreign_key"]:
+                to_table, to_column = info["foreign_key"]
+                cursor.execute(
+                    f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" FOREIGN KEY ({columns}) '
+                    f"REFERENCES {to_table} ({to_column}) DEFERRABLE INITIALLY DEFERRED"
+                )
+            elif info["unique"]:
+                cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" UNIQUE ({columns})')
+            elif info["index"]:
+                cursor.execute(f'CREATE INDEX "{name}" ON {TABLE} ({columns})')
+
+        cursor.execute(f"CREATE TABLE {TABLE}_default PARTITION OF {TABLE} DEFAULT")
+        cursor.execute(f"INSERT INTO {TABLE} OVERRIDING SYSTEM VALUE SELECT * FROM {LEGACY}")
+
+        # Identity columns get a fresh sequence; serial columns keep the old one
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id'), pg_get_serial_sequence(%s, 'id')",
+                       [TABLE, LEGACY])
+        sequence, legacy_sequence = cursor.fetchone()
+        if sequence is None and legacy_sequence is not None:
+            cursor.execute(f"ALTER SEQUENCE {legacy_sequence} OWNED BY {TABLE}.id")
+        elif sequence is not None:
+            cursor.execute(
+                f"SELECT setval(%s, COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {TABLE}", [sequence]
+            )
+        cursor.execute(f"DROP TABLE {LEGACY}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = True
+
+    dependencies = [
+        ('attendance', '0004_attendancearchive'),
+    ]
+
+    operations = [
+        # Schema-compatible with the plain table, so reversing leaves it partitioned
+        migrations.RunPython(partition_table, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:33
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('attendance', '0005_partition_attendance'),
+        ('employees', '0004_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AttendanceCalendar',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField(help_text='First day of the month.')),
+                ('days', models.BigIntegerField(default=0, help_text='2-bit status code per day of the month.')),
+                ('employee', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='attendance_calendar', to='employees.employee')),
+            ],
+            options={
+                'verbose_name': 'Attendance Calendar Month',
+                'verbose_name_plural': 'Attendance Calendar Months',
+                'ordering': ['-month'],
+                'constraints': [models.UniqueConstraint(fields=('employee', 'month'), name='uniq_attendance_calendar')],
+            },
+        ),
+    ]
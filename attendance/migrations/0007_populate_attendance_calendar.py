@@ -0,0 +1,30 @@
+from collections import defaultdict
+
+from django.db import migrations
+
+CODES = {"Present": 1, "Absent": 2, "Late": 3}
+
+
+def populate(apps, schema_editor):
+    Attendance = apps.get_model("attendance", "Attendance")
+    Calendar = apps.get_model("attendance", "AttendanceCalendar")
+
+    packed = defaultdict(int)
+    rows = Attendance.objects.values_list("employee_id", "date", "status").iterator(chunk_size=5000)
+    for employee_id, day, status in rows:
+        packed[(employee_id, day.replace(day=1))] |= CODES[status] << (2 * (day.day - 1))
+    Calendar.objects.bulk_create(
+        [Calendar(employee_id=emp_id, month=month, days=bits) for (emp_id, month), bits in packed.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("attendance", "0006_attendancecalendar"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,82 @@
+"""
+PostgreSQL: undo 0005 and turn attendance_attendance back into a plain table.
+
+0005 rewrote the whole table on deploy. Partitioning is now an opt-in step
+(``manage.py partition_attendance --convert``, run after migrating), so a
+table that 0005 partitioned is rebuilt as a regular table with the same
+columns, indexes, foreign key and unique constraint and a primary key on
+``id`` again. Monthly partitions are dropped along with the partitioned
+table once their rows have been copied back.
+
+Other backends, and tables that were never partitioned, are left untouched.
+"""
+
+from django.db import migrations
+
+TABLE = "attendance_attendance"
+LEGACY = "attendance_attendance_legacy"
+
+
+def unpartition_table(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor != "postgresql":
+        return
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [TABLE])
+        if not cursor.fetchone():
+            return
+        constraints = connection.introspection.get_constraints(cursor, TABLE)
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY}")
+
+        # Free the constraint/index names for the new table
+        for name, info in constraints.items():
+            if info["primary_key"] or info["unique"] or info["foreign_key"]:
+                cursor.execute(f'ALTER TABLE {LEGACY} DROP CONSTRAINT "{name}"')
+            elif info["index"]:
+                cursor.execute(f'DROP INDEX "{name}"')
+
+        cursor.execute(f"CREATE TABLE {TABLE} (LIKE {LEGACY} INCLUDING DEFAULTS INCLUDING IDENTITY)")
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id)')
+        for name, info in constraints.items():
+            columns = ", ".join(info["columns"])
+            if info["primary_key"]:
+                continue
+            if info["foreign_key"]:
+                to_table, to_column = info["foreign_key"]
+                cursor.execute(
+                    f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" FOREIGN KEY ({columns}) '
+                    f"REFERENCES {to_table} ({to_column}) DEFERRABLE INITIALLY DEFERRED"
+                )
+            elif info["unique"]:
+                cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" UNIQUE ({columns})')
+            elif info["index"]:
+                cursor.execute(f'CREATE INDEX "{name}" ON {TABLE} ({columns})')
+
+        cursor.execute(f"INSERT INTO {TABLE} OVERRIDING SYSTEM VALUE SELECT * FROM {LEGACY}")
+
+        # Identity columns get a fresh sequence; serial columns keep the old one
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id'), pg_get_serial_sequence(%s, 'id')",
+                       [TABLE, LEGACY])
+        sequence, legacy_sequence = cursor.fetchone()
+        if sequence is None and legacy_sequence is not None:
+            cursor.execute(f"ALTER SEQUENCE {legacy_sequence} OWNED BY {TABLE}.id")
+        elif sequence is not None:
+            cursor.execute(
+                f"SELECT setval(%s, COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {TABLE}", [sequence]
+            )
+        # Drops the attached partitions too; detached ones are standalone tables
+        cursor.execute(f"DROP TABLE {LEGACY}")
+
+
+class Migration(migrations.Migration):
+
+    atomic = True
+
+    dependencies = [
+        ("attendance", "0007_populate_attendance_calendar"),
+    ]
+
+    operations = [
+        # Re-partitioning is partition_attendance --convert, not a migration
+        migrations.RunPython(unpartition_table, migrations.RunPython.noop),
+    ]
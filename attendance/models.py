@@ -8,9 +8,29 @@ Used for generating reports, analytics, and HR summaries.
 """
 
 from django.db import models
+from django.db.models import Max, Min
+from django.db.models.functions import Now
 from employees.models import Employee
 
 
+def _deleted(dates, employee_ids):
+    """Let derived data catch up after a delete (see attendance/signals.py)."""
+    from .signals import attendance_bulk_loaded
+
+    attendance_bulk_loaded.send(sender=Attendance, dates=dates, employee_ids=employee_ids)
+
+
+class AttendanceQuerySet(models.QuerySet):
+    def delete(self):
+        """Delete the rows, then refresh derived data for their date range and employees once."""
+        span = self.aggregate(first=Min("date"), last=Max("date"))
+        employee_ids = set(self.order_by().values_list("employee_id", flat=True).distinct())
+        result = super().delete()
+        if result[0]:
+            _deleted([span["first"], span["last"]], employee_ids)
+        return result
+
+
 class Attendance(models.Model):
     """
     Stores attendance status for employees on specific dates.
@@ -54,6 +74,15 @@ class Attendance(models.Model):
         help_text="Attendance status (Present, Absent, or Late)."
     )
 
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_default=Now(),
+        db_index=True,
+        help_text="Last modification time (drives ETag / Last-Modified)."
+    )
+
+    objects = AttendanceQuerySet.as_manager()
+
     # -------------------------------
     # Meta options for indexing & constraints
     # -------------------------------
@@ -62,6 +91,7 @@ class Attendance(models.Model):
         ordering = ["-date"]  # Show most recent attendance first
         indexes = [
             models.Index(fields=["employee", "date"]),  # Optimize filtering
+            models.Index(fields=["date", "id"]),        # Keyset pagination
         ]
         verbose_name = "Attendance Record"
         verbose_name_plural = "Attendance Records"
@@ -72,3 +102,71 @@ class Attendance(models.Model):
     def __str__(self):
         """Readable representation shown in admin and logs."""
         return f"{self.employee.name} - {self.date} - {self.status}"
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the row, then refresh derived data for its day.
+
+        Attendance has no delete receivers, so that deleting an employee can
+        cascade to their attendance with one DELETE statement.
+        """
+        result = super().delete(*args, **kwargs)
+        _deleted([self.date], [self.employee_id])
+        return result
+
+
+class AttendanceArchive(models.Model):
+    """
+    Attendance rows moved out of the live table by ``partition_attendance``.
+
+    Same columns and keys as Attendance (ids are preserved), so archived
+    history stays queryable while the live table and its indexes stay small.
+    """
+
+    employee = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+        related_name="archived_attendance",
+        help_text="Employee associated with this attendance record."
+    )
+    date = models.DateField(help_text="Date of the attendance record.")
+    status = models.CharField(max_length=10, choices=Attendance.STATUS_CHOICES)
+    updated_at = models.DateTimeField(help_text="Last modification time while the row was live.")
+
+    class Meta:
+        unique_together = ("employee", "date")
+        ordering = ["-date"]
+        verbose_name = "Archived Attendance Record"
+        verbose_name_plural = "Archived Attendance Records"
+
+    def __str__(self):
+        return f"{self.employee_id} - {self.date} - {self.status} (archived)"
+
+
+class AttendanceCalendar(models.Model):
+    """
+    One employee's month of attendance packed into a single integer.
+
+    Day ``d`` occupies bits ``2*(d-1)`` and ``2*(d-1)+1``: 0 = no record,
+    1 = Present, 2 = Absent, 3 = Late. 31 days need 62 bits, so a month fits
+    in one BIGINT. Maintained from Attendance by attendance/calendar.py.
+    """
+
+    employee = models.ForeignKey(
+        Employee,
+        on_delete=models.CASCADE,
+        related_name="attendance_calendar",
+    )
+    month = models.DateField(help_text="First day of the month.")
+    days = models.BigIntegerField(default=0, help_text="2-bit status code per day of the month.")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["employee", "month"], name="uniq_attendance_calendar"),
+        ]
+        ordering = ["-month"]
+        verbose_name = "Attendance Calendar Month"
+        verbose_name_plural = "Attendance Calendar Months"
+
+    def __str__(self):
+        return f"{self.employee_id} • {self.month:%Y-%m}"
@@ -0,0 +1,220 @@
+"""
+Monthly partitions and archival for the attendance table.
+
+PostgreSQL, once ``partition_attendance --convert`` has been run (an opt-in
+step, since it rewrites the whole table): attendance_attendance is
+partitioned by RANGE (date). Each month lives in ``attendance_attendance_pYYYYMM`` and rows
+outside every monthly partition go to ``attendance_attendance_default``.
+Date-filtered queries (the attendance list, rollup refreshes) only scan the
+partitions they need, and old months leave the live table by detaching or
+dropping a partition instead of a large DELETE.
+
+Other backends: there is no partitioning, so archiving moves one month at a
+time from the live table into AttendanceArchive.
+
+Callers keep using Attendance as before. Archiving deliberately bypasses
+signals: the analytics rollups keep the counts for archived months.
+
+An (employee, date) pair lives in at most one of the two tables. When both
+hold it (a day was written again after its month was archived), the live
+row wins: archiving replaces the archived copy and restoring skips it.
+"""
+
+from datetime import date, timedelta
+
+from django.db import connection, transaction
+
+from .models import Attendance, AttendanceArchive
+from .signals import attendance_bulk_loaded
+
+TABLE = Attendance._meta.db_table
+LEGACY = f"{TABLE}_legacy"
+ARCHIVE = AttendanceArchive._meta.db_table
+DEFAULT_PARTITION = f"{TABLE}_default"
+COLUMNS = "id, employee_id, date, status, updated_at"
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month):
+    return f"{TABLE}_p{month:%Y%m}"
+
+
+def is_partitioned():
+    """True when the live table is a PostgreSQL partitioned table."""
+    if connection.vendor != "postgresql":
+        return False
+    with connection.cursor() as cursor:
+        cursor.execute("SELECT 1 FROM pg_partitioned_table WHERE partrelid = %s::regclass", [TABLE])
+        return cursor.fetchone() is not None
+
+
+@transaction.atomic
+def convert_table():
+    """
+    Rebuild the live table as ``PARTITION BY RANGE (date)`` (PostgreSQL).
+
+    Same columns, indexes, foreign key and unique (employee_id, date)
+    constraint (it contains the partition key, so PostgreSQL can enforce
+    it). The primary key becomes (id, date); ids still come from the same
+    sequence, so the ORM keeps treating ``id`` as the key. Every row is
+    copied into the DEFAULT partition under an exclusive lock; create_partition()
+    then splits them into months.
+    """
+    with connection.cursor() as cursor:
+        constraints = connection.introspection.get_constraints(cursor, TABLE)
+        cursor.execute(f"ALTER TABLE {TABLE} RENAME TO {LEGACY}")
+
+        # Free the constraint/index names for the new table
+        for name, info in constraints.items():
+            if info["primary_key"] or info["unique"] or info["foreign_key"]:
+                cursor.execute(f'ALTER TABLE {LEGACY} DROP CONSTRAINT "{name}"')
+            elif info["index"]:
+                cursor.execute(f'DROP INDEX "{name}"')
+
+        cursor.execute(
+            f"CREATE TABLE {TABLE} (LIKE {LEGACY} INCLUDING DEFAULTS INCLUDING IDENTITY) "
+            f"PARTITION BY RANGE (date)"
+        )
+        cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{TABLE}_pkey" PRIMARY KEY (id, date)')
+        for name, info in constraints.items():
+            columns = ", ".join(info["columns"])
+            if info["primary_key"]:
+                continue
+            if info["foreign_key"]:
+                to_table, to_column = info["foreign_key"]
+                cursor.execute(
+                    f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" FOREIGN KEY ({columns}) '
+                    f"REFERENCES {to_table} ({to_column}) DEFERRABLE INITIALLY DEFERRED"
+                )
+            elif info["unique"]:
+                cursor.execute(f'ALTER TABLE {TABLE} ADD CONSTRAINT "{name}" UNIQUE ({columns})')
+            elif info["index"]:
+                cursor.execute(f'CREATE INDEX "{name}" ON {TABLE} ({columns})')
+
+        cursor.execute(f"CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT")
+        cursor.execute(f"INSERT INTO {TABLE} OVERRIDING SYSTEM VALUE SELECT * FROM {LEGACY}")
+
+        # Identity columns get a fresh sequence; serial columns keep the old one
+        cursor.execute("SELECT pg_get_serial_sequence(%s, 'id'), pg_get_serial_sequence(%s, 'id')",
+                       [TABLE, LEGACY])
+        sequence, legacy_sequence = cursor.fetchone()
+        if sequence is None and legacy_sequence is not None:
+            cursor.execute(f"ALTER SEQUENCE {legacy_sequence} OWNED BY {TABLE}.id")
+        elif sequence is not None:
+            cursor.execute(
+                f"SELECT setval(%s, COALESCE(MAX(id), 1), MAX(id) IS NOT NULL) FROM {TABLE}", [sequence]
+            )
+        cursor.execute(f"DROP TABLE {LEGACY}")
+
+
+def monthly_partitions():
+    """Months that currently have their own attached partition, oldest first."""
+    with connection.cursor() as cursor:
+        cursor.execute(
+            "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+            "WHERE i.inhparent = %s::regclass",
+            [TABLE],
+        )
+        names = [name for name, in cursor.fetchall()]
+    prefix = f"{TABLE}_p"
+    return sorted(
+        date(int(name[-6:-2]), int(name[-2:]), 1)
+        for name in names
+        if name.startswith(prefix) and name[len(prefix):].isdigit()
+    )
+
+
+def oldest_month():
+    """First month with live attendance, or None for an empty table."""
+    first = Attendance.objects.order_by("date").values_list("date", flat=True).first()
+    return month_start(first) if first else None
+
+
+@transaction.atomic
+def create_partition(month):
+    """Create and attach the partition for ``month``, moving its rows out of DEFAULT."""
+    name, start, end = partition_name(month), month.isoformat(), add_months(month, 1).isoformat()
+    with connection.cursor() as cursor:
+        cursor.execute(f"CREATE TABLE {name} (LIKE {TABLE} INCLUDING DEFAULTS)")
+        # ATTACH refuses a range that the DEFAULT partition still holds rows for
+        cursor.execute(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} WHERE date >= %s AND date < %s RETURNING *) "
+            f"INSERT INTO {name} SELECT * FROM moved",
+            [start, end],
+        )
+        cursor.execute(f"ALTER TABLE {TABLE} ATTACH PARTITION {name} FOR VALUES FROM ('{start}') TO ('{end}')")
+
+
+@transaction.atomic
+def archive_month(month, detach=False):
+    """
+    Take ``month`` out of the live table; returns the number of rows moved.
+
+    Rows are copied into AttendanceArchive. With ``detach=True`` (PostgreSQL)
+    the partition is only detached and left as a standalone table.
+    """
+    start, end = month, add_months(month, 1)
+    partitioned = is_partitioned() and month in monthly_partitions()
+    name = partition_name(month)
+    with connection.cursor() as cursor:
+        if partitioned and detach:
+            cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+            cursor.execute(f"SELECT COUNT(*) FROM {name}")
+            return cursor.fetchone()[0]
+
+        source = name if partitioned else TABLE
+        # The live row is newer than an archived copy of the same day
+        cursor.execute(
+            f"DELETE FROM {ARCHIVE} WHERE date >= %s AND date < %s AND EXISTS ("
+            f"SELECT 1 FROM {source} live WHERE live.employee_id = {ARCHIVE}.employee_id "
+            f"AND live.date = {ARCHIVE}.date)",
+            [start, end],
+        )
+        cursor.execute(
+            f"INSERT INTO {ARCHIVE} ({COLUMNS}) "
+            f"SELECT {COLUMNS} FROM {source} WHERE date >= %s AND date < %s",
+            [start, end],
+        )
+        moved = cursor.rowcount
+        if partitioned:
+            cursor.execute(f"ALTER TABLE {TABLE} DETACH PARTITION {name}")
+            cursor.execute(f"DROP TABLE {name}")
+        else:
+            cursor.execute(f"DELETE FROM {TABLE} WHERE date >= %s AND date < %s", [start, end])
+        return moved
+
+
+@transaction.atomic
+def restore_month(month):
+    """
+    Move ``month`` from AttendanceArchive back into the live table; returns
+    the number of rows restored. Archived days that were written again since
+    are dropped, the live row is kept. Unlike archiving this changes what the
+    calendar and rollups are built from, so ``attendance_bulk_loaded`` is sent.
+    """
+    start, end = month, add_months(month, 1)
+    if is_partitioned() and month not in monthly_partitions():
+        create_partition(month)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {TABLE} ({COLUMNS}) "
+            f"SELECT {COLUMNS} FROM {ARCHIVE} WHERE date >= %s AND date < %s AND NOT EXISTS ("
+            f"SELECT 1 FROM {TABLE} live WHERE live.employee_id = {ARCHIVE}.employee_id "
+            f"AND live.date = {ARCHIVE}.date)",
+            [start, end],
+        )
+        restored = cursor.rowcount
+        cursor.execute(f"DELETE FROM {ARCHIVE} WHERE date >= %s AND date < %s", [start, end])
+    if restored:
+        attendance_bulk_loaded.send(
+            sender=Attendance, dates=[start + timedelta(days=n) for n in range((end - start).days)], employee_ids=None,
+        )
+    return restored
@@ -5,16 +5,34 @@ Serializers for Attendance and Performance models.
 from rest_framework import serializers
 from .models import Attendance
 from employees.models import Performance
+from employees.serializers import EmployeeSerializer
+from employee_project.sparse import SparseFieldsMixin
 
-class AttendanceSerializer(serializers.ModelSerializer):
-    """Serializer for Attendance records."""
+class AttendanceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Serializer for Attendance records (``?expand=employee`` nests the employee)."""
     class Meta:
         model = Attendance
-        fields = "__all__"
+        exclude = ["updated_at"]  # bookkeeping for ETags, not part of the API
 
+    expandable_fields = {"employee": EmployeeSerializer}
 
-class PerformanceSerializer(serializers.ModelSerializer):
-    """Serializer for Performance reviews."""
+
+class PerformanceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """Serializer for Performance reviews (``?expand=employee`` nests the employee)."""
     class Meta:
         model = Performance
-        fields = "__all__"
+        exclude = ["updated_at"]  # bookkeeping for ETags, not part of the API
+
+    expandable_fields = {"employee": EmployeeSerializer}
+
+
+class AttendanceBulkItemSerializer(serializers.Serializer):
+    """
+    Shape check for one row of a bulk attendance upload.
+
+    ``employee`` is a plain integer here; the view resolves all employee
+    IDs of a batch with a single query instead of one lookup per row.
+    """
+    employee = serializers.IntegerField(min_value=1)
+    date = serializers.DateField()
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES)
@@ -0,0 +1,56 @@
+"""
+Custom signals sent by the attendance app, plus the receivers that keep the
+packed calendar (attendance/calendar.py) in sync.
+
+bulk_create() and raw COPY loads bypass post_save/post_delete, so code that
+writes attendance in bulk sends ``attendance_bulk_loaded`` afterwards with the
+affected ``dates`` and ``employee_ids`` (None when every employee may be
+affected) so derived data can catch up. Deletes send it too, from
+Attendance.delete() and the queryset's delete(): any pre_delete/post_delete
+receiver on Attendance would stop Django from fast-deleting an employee's
+attendance in one statement. A deleted employee's calendar rows cascade with
+it, and analytics/signals.py recomputes its rollups.
+
+The pre_save receiver loads the stored row once as ``_attendance_previous``
+(employee_id, date, status, department_id); the analytics receivers reuse it.
+
+Connected in AttendanceConfig.ready().
+"""
+
+from django.db.models.signals import post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from . import calendar
+from .models import Attendance
+
+attendance_bulk_loaded = Signal()
+
+
+@receiver(pre_save, sender=Attendance)
+def remember_previous(sender, instance, raw=False, **kwargs):
+    instance._attendance_previous = None
+    if raw or instance.pk is None:
+        return
+    instance._attendance_previous = (Attendance.objects
+                                     .filter(pk=instance.pk)
+                                     .values_list("employee_id", "date", "status", "employee__department_id")
+                                     .first())
+
+
+@receiver(post_save, sender=Attendance)
+def attendance_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_attendance_previous", None)
+    if previous is not None:
+        employee_id, day, status, _ = previous
+        if (employee_id, day, status) == (instance.employee_id, instance.date, instance.status):
+            return
+        if (employee_id, day) != (instance.employee_id, instance.date):
+            calendar.clear_day(employee_id, day)
+    calendar.set_day(instance.employee_id, instance.date, instance.status)
+
+
+@receiver(attendance_bulk_loaded)
+def attendance_bulk_refresh(sender, dates=(), employee_ids=None, **kwargs):
+    calendar.refresh(dates, employee_ids)
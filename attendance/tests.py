@@ -1,3 +1,321 @@
+import csv
+import json
+from datetime import date, timedelta
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from analytics.models import AttendanceMonthlyRollup
+from departments.models import Department
+from employees.models import Employee, Performance
+from . import calendar
+from .bulk import upsert_attendance
+from .models import Attendance, AttendanceArchive, AttendanceCalendar
+from .views import AttendanceViewSet
+
+
+class FastListParityTests(TestCase):
+    """The .values() list path must render exactly the same JSON as the serializer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        dept = Department.objects.create(name="Engineering")
+        statuses = [Attendance.STATUS_PRESENT, Attendance.STATUS_ABSENT, Attendance.STATUS_LATE]
+        for i in range(3):
+            emp = Employee.objects.create(
+                name=f"Employee {i}", email=f"e{i}@example.com", date_of_joining=date(2024, 1, 1), department=dept,
+            )
+            for d in range(10):
+                Attendance.objects.create(employee=emp, date=date(2025, 3, 1) + timedelta(days=d),
+                                          status=statuses[(i + d) % 3])
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def test_attendance_list(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        for params in ({}, {"page": 2}, {"status": "Late"}, {"pagination": "cursor"}, {"ordering": "employee"},
+                       {"fields": "status", "pagination": "cursor"}, {"expand": "employee.department"}):
+            fast = client.get("/api/v1/attendance/", params)
+            with mock.patch.object(AttendanceViewSet, "fast_list", False):
+                slow = client.get("/api/v1/attendance/", params)
+            self.assertEqual(fast.status_code, 200)
+            self.assertEqual(fast.content, slow.content)
+        row = client.get("/api/v1/attendance/").json()["results"][0]
+        self.assertEqual(sorted(row), ["date", "employee", "id", "status"])
+
+
+class KeysetPaginationTests(TestCase):
+    """Following cursor links both ways visits every row once, in the list's order."""
+
+    @classmethod
+    def setUpTestData(cls):
+        dept = Department.objects.create(name="Engineering")
+        statuses = [Attendance.STATUS_PRESENT, Attendance.STATUS_ABSENT, Attendance.STATUS_LATE]
+        for i in range(3):
+            emp = Employee.objects.create(name=f"K{i}", email=f"k{i}@example.com", date_of_joining=date(2024, 1, 1),
+                                          department=dept)
+            for d in range(25):
+                Attendance.objects.create(employee=emp, date=date(2025, 3, 1) + timedelta(days=d),
+                                          status=statuses[(i + d) % 3])
+            for d in range(15):  # three reviews per date, ratings repeat
+                Performance.objects.create(employee=emp, rating=(i + d) % 5 + 1,
+                                           review_date=date(2025, 1, 1) + timedelta(days=d // 3))
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def walk(self, url, params):
+        """Row ids forward to the last page, then back to the first one."""
+        response = self.client.get(url, {**params, "pagination": "cursor"})
+        pages = [response.json()]
+        while pages[-1]["next"]:
+            pages.append(self.client.get(pages[-1]["next"]).json())
+        self.assertIsNone(pages[0]["previous"])
+        backward = [pages[-1]]
+        while backward[-1]["previous"]:
+            backward.append(self.client.get(backward[-1]["previous"]).json())
+        return self.ids(pages), self.ids(reversed(backward))
+
+    @staticmethod
+    def ids(pages):
+        return [row["id"] for page in pages for row in page["results"]]
+
+    def assertWalks(self, url, model, ordering):
+        params = {"ordering": ordering} if ordering else {}
+        ordering = ordering or model._meta.ordering[0]
+        tie = "-id" if ordering.startswith("-") else "id"
+        expected = list(model.objects.order_by(ordering, tie).values_list("id", flat=True))
+        forward, backward = self.walk(url, params)
+        self.assertEqual(forward, expected, ordering)
+        self.assertEqual(backward, expected, ordering)
+
+    def test_attendance(self):
+        for ordering in (None, "date", "-date"):
+            self.assertWalks("/api/v1/attendance/", Attendance, ordering)
+
+    def test_performance(self):
+        for ordering in (None, "rating", "-rating", "review_date", "-review_date"):
+            self.assertWalks("/api/v1/performance/", Performance, ordering)
+
+    def test_relation_ordering_is_rejected(self):
+        response = self.client.get("/api/v1/attendance/", {"ordering": "employee", "pagination": "cursor"})
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/attendance/", {"ordering": "employee"}).status_code, 200)
+
+
+class ArchiveTests(TestCase):
+    """Without native partitioning, old months move to AttendanceArchive."""
+
+    def test_archive_old_months(self):
+        dept = Department.objects.create(name="Engineering")
+        emp = Employee.objects.create(name="A", email="a@example.com", date_of_joining=date(2024, 1, 1),
+                                      department=dept)
+        today = date.today()
+        old = [date(2024, 1, 5), date(2024, 2, 5)]
+        for day in old + [today]:
+            Attendance.objects.create(employee=emp, date=day, status=Attendance.STATUS_PRESENT)
+        rollups = sorted(AttendanceMonthlyRollup.objects.values_list("month", "count"))
+        months = sorted(AttendanceCalendar.objects.values_list("month", "days"))
+
+        call_command("partition_attendance", retain_months=3, stdout=mock.Mock())
+
+        self.assertEqual(list(Attendance.objects.values_list("date", flat=True)), [today])
+        self.assertEqual(sorted(AttendanceArchive.objects.values_list("date", flat=True)), old)
+        # Rollups and the calendar keep archived months, also across a rebuild
+        call_command("rebuild_attendance_rollups", stdout=mock.Mock())
+        calendar.rebuild()
+        self.assertEqual(sorted(AttendanceMonthlyRollup.objects.values_list("month", "count")), rollups)
+        self.assertEqual(sorted(AttendanceCalendar.objects.values_list("month", "days")), months)
+
+    def test_live_row_wins(self):
+        dept = Department.objects.create(name="Engineering")
+        emp = Employee.objects.create(name="A", email="a@example.com", date_of_joining=date(2024, 1, 1),
+                                      department=dept)
+        for day in (5, 6):
+            Attendance.objects.create(employee=emp, date=date(2024, 1, day), status=Attendance.STATUS_PRESENT)
+        call_command("partition_attendance", retain_months=3, stdout=mock.Mock())
+
+        # Written again after its month was archived: archiving replaces the archived copy
+        Attendance.objects.create(employee=emp, date=date(2024, 1, 5), status=Attendance.STATUS_LATE)
+        call_command("partition_attendance", retain_months=3, stdout=mock.Mock())
+        self.assertFalse(Attendance.objects.exists())
+        self.assertEqual(sorted(AttendanceArchive.objects.values_list("date", "status")),
+                         [(date(2024, 1, 5), "Late"), (date(2024, 1, 6), "Present")])
+
+        # ... and restoring keeps the live row
+        Attendance.objects.create(employee=emp, date=date(2024, 1, 6), status=Attendance.STATUS_ABSENT)
+        call_command("partition_attendance", restore="2024-01", stdout=mock.Mock())
+        self.assertFalse(AttendanceArchive.objects.exists())
+        self.assertEqual(sorted(Attendance.objects.values_list("date", "status")),
+                         [(date(2024, 1, 5), "Late"), (date(2024, 1, 6), "Absent")])
+        self.assertEqual(calendar.department_month(dept.pk, date(2024, 1, 1))[0]["days"][4:6], "32")
+
+
+class CalendarTests(TestCase):
+    """The packed calendar follows single-row writes and bulk loads."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept = Department.objects.create(name="Engineering")
+        cls.emps = [
+            Employee.objects.create(name=f"Employee {i}", email=f"c{i}@example.com",
+                                    date_of_joining=date(2024, 1, 1), department=cls.dept)
+            for i in range(2)
+        ]
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def packed(self):
+        # Clearing a month's last day leaves a row of zeros behind, which reads the same
+        return sorted(AttendanceCalendar.objects.exclude(days=0).values_list("employee_id", "month", "days"))
+
+    def test_kept_in_sync(self):
+        a, b = self.emps
+        record = Attendance.objects.create(employee=a, date=date(2025, 3, 31), status=Attendance.STATUS_LATE)
+        Attendance.objects.create(employee=b, date=date(2025, 3, 1), status=Attendance.STATUS_PRESENT)
+        record.status = Attendance.STATUS_ABSENT
+        record.save()
+        record.date = date(2025, 4, 2)
+        record.save()
+        upsert_attendance([(a.pk, date(2025, 3, 5), Attendance.STATUS_PRESENT),
+                           (b.pk, date(2025, 3, 1), Attendance.STATUS_LATE)])
+        Attendance.objects.filter(employee=b).first().delete()
+        Attendance.objects.filter(employee=a, date=date(2025, 3, 5)).delete()
+
+        incremental = self.packed()
+        calendar.rebuild()
+        self.assertEqual(incremental, self.packed())
+        self.assertEqual(calendar.unpack(dict(((e, m), d) for e, m, d in incremental)[(a.pk, date(2025, 4, 1))],
+                                         date(2025, 4, 1)), "02" + "0" * 28)
+
+    def test_department_month_endpoint(self):
+        a, b = self.emps
+        Attendance.objects.create(employee=a, date=date(2025, 2, 1), status=Attendance.STATUS_PRESENT)
+        Attendance.objects.create(employee=a, date=date(2025, 2, 28), status=Attendance.STATUS_LATE)
+        client = APIClient()
+        client.force_authenticate(self.user)
+        with self.assertNumQueries(1):
+            response = client.get("/api/v1/attendance/calendar/", {"department": self.dept.pk, "month": "2025-02"})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["employees"], [
+            {"id": a.pk, "name": "Employee 0", "days": "1" + "0" * 26 + "3"},
+            {"id": b.pk, "name": "Employee 1", "days": "0" * 28},
+        ])
+        for department in ("", "abc", "²", "0"):
+            response = client.get("/api/v1/attendance/calendar/", {"department": department})
+            self.assertEqual(response.status_code, 400)
+
+
+class BulkUpsertTests(TestCase):
+    """POST /attendance/bulk/ answers one result per input row, in input order."""
+
+    @classmethod
+    def setUpTestData(cls):
+        dept = Department.objects.create(name="Engineering")
+        cls.emp = Employee.objects.create(name="A", email="bulk@example.com", date_of_joining=date(2024, 1, 1),
+                                          department=dept)
+        Attendance.objects.create(employee=cls.emp, date=date(2025, 3, 3), status=Attendance.STATUS_PRESENT)
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_per_row_results(self):
+        emp = self.emp.pk
+        response = self.client.post("/api/v1/attendance/bulk/", [
+            {"employee": emp, "date": "2025-03-03", "status": "Late"},      # existing row
+            {"employee": emp, "date": "2025-03-04", "status": "Present"},   # superseded below
+            {"employee": emp, "date": "2025-03-05", "status": "Sick"},      # bad status
+            {"employee": 999999, "date": "2025-03-05", "status": "Present"},
+            {"employee": emp, "date": "2025-03-04", "status": "Absent"},    # last row wins
+        ], format="json")
+        self.assertEqual(response.status_code, 200)
+        body = response.json()
+        self.assertEqual([r["result"] for r in body["results"]], ["updated", "skipped", "error", "error", "created"])
+        self.assertEqual([r["index"] for r in body["results"]], [0, 1, 2, 3, 4])
+        self.assertEqual({k: body[k] for k in ("created", "updated", "skipped", "error")},
+                         {"created": 1, "updated": 1, "skipped": 1, "error": 2})
+        self.assertIn("status", body["results"][2]["errors"])
+        self.assertIn("999999", body["results"][3]["errors"]["employee"][0])
+        self.assertEqual(sorted(Attendance.objects.values_list("date", "status")),
+                         [(date(2025, 3, 3), "Late"), (date(2025, 3, 4), "Absent")])
+
+    def test_limits(self):
+        self.assertEqual(self.client.post("/api/v1/attendance/bulk/", {"records": "x"}, format="json").status_code,
+                         400)
+        records = [{"employee": self.emp.pk, "date": "2025-04-01", "status": "Present"}] * 3
+        with mock.patch.object(AttendanceViewSet, "bulk_max_records", 2):
+            response = self.client.post("/api/v1/attendance/bulk/", {"records": records}, format="json")
+        self.assertEqual((response.status_code, response.json()["detail"]), (400, "At most 2 records per request."))
+        self.assertEqual(Attendance.objects.count(), 1)
+
+
+class ExportTests(TestCase):
+    """GET <list>/export/ streams the filtered rows as CSV or NDJSON."""
+
+    @classmethod
+    def setUpTestData(cls):
+        dept = Department.objects.create(name="Engineering")
+        cls.emps = [Employee.objects.create(name=f"E{i}", email=f"export{i}@example.com",
+                                            date_of_joining=date(2024, 1, 1), department=dept) for i in range(2)]
+        for d in range(3):
+            for emp in cls.emps:
+                Attendance.objects.create(employee=emp, date=date(2025, 3, 3) + timedelta(days=d),
+                                          status=Attendance.STATUS_LATE if d == 1 else Attendance.STATUS_PRESENT)
+        Performance.objects.create(employee=cls.emps[0], rating=4, review_date=date(2025, 1, 10))
+        Performance.objects.create(employee=cls.emps[1], rating=2, review_date=date(2025, 2, 10))
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def export(self, url, **params):
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response, b"".join(response.streaming_content).decode()
+
+    def test_attendance_csv(self):
+        emp = self.emps[0]
+        response, body = self.export("/api/v1/attendance/export/", employee=emp.pk, ordering="date")
+        self.assertEqual(response["Content-Type"], "text/csv")
+        self.assertEqual(response["Content-Disposition"], 'attachment; filename="attendance.csv"')
+        rows = list(csv.reader(body.splitlines()))
+        self.assertEqual(rows[0], ["id", "employee_id", "employee_name", "employee_email", "department", "date",
+                                   "status"])
+        self.assertEqual([row[1:] for row in rows[1:]], [
+            [str(emp.pk), "E0", "export0@example.com", "Engineering", f"2025-03-0{3 + d}",
+             "Late" if d == 1 else "Present"] for d in range(3)
+        ])
+
+    def test_attendance_ndjson(self):
+        response, body = self.export("/api/v1/attendance/export/", status="Late", export_format="ndjson")
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        rows = [json.loads(line) for line in body.splitlines()]
+        self.assertEqual(sorted((r["employee_id"], r["date"], r["status"]) for r in rows),
+                         [(emp.pk, "2025-03-04", "Late") for emp in self.emps])
+
+    def test_performance(self):
+        _, body = self.export("/api/v1/performance/export/", rating__gte=3)
+        self.assertEqual(list(csv.reader(body.splitlines())), [
+            ["id", "employee_id", "employee_name", "department", "rating", "review_date"],
+            [str(Performance.objects.get(rating=4).pk), str(self.emps[0].pk), "E0", "Engineering", "4", "2025-01-10"],
+        ])
+        _, body = self.export("/api/v1/performance/export/", export_format="ndjson", ordering="review_date")
+        self.assertEqual([json.loads(line)["rating"] for line in body.splitlines()], [4, 2])
+
+    def test_request_log_counts_streamed_sql(self):
+        with self.assertLogs("employee_project.requests", "DEBUG") as logs:
+            response, _ = self.export("/api/v1/attendance/export/")
+            self.assertIn('db;dur=', response["Server-Timing"])
+        record = json.loads(logs.records[-1].getMessage())
+        self.assertEqual((record["path"], record["streamed"], record["queries"]), ("/api/v1/attendance/export/", True, 1))
 
-# Create your tests here.
+    def test_unknown_format(self):
+        response = self.client.get("/api/v1/attendance/export/", {"export_format": "xlsx"})
+        self.assertEqual(response.status_code, 400)
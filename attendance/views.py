@@ -4,21 +4,37 @@ Supports filtering, search, and ordering.
 JWT authentication required.
 """
 
-from rest_framework import viewsets, filters
+from datetime import date
+
+from django.utils import timezone
+from rest_framework import viewsets, filters, status
+from rest_framework.decorators import action
 from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
 from django_filters.rest_framework import DjangoFilterBackend
+from . import calendar
+from .bulk import upsert_attendance
 from .models import Attendance
-from .serializers import AttendanceSerializer, PerformanceSerializer
-from employees.models import Performance
-from rest_framework_simplejwt.authentication import JWTAuthentication
+from .serializers import AttendanceSerializer, AttendanceBulkItemSerializer, PerformanceSerializer
+from employees.models import Employee, Performance
+from employees.serializers import PERFORMANCE_EXPORT_FIELDS
+from employee_project.conditional import ConditionalGetMixin
+from employee_project.exports import StreamingExportMixin
+from employee_project.fast_serializers import FastListMixin
+from employee_project.instrumentation import InstrumentedViewMixin
+from employee_project.pagination import OptionalKeysetPagination
+from employee_project.sparse import SparseFieldsetMixin
+from employees.authentication import CachedJWTAuthentication
 
-class AttendanceViewSet(viewsets.ModelViewSet):
+class AttendanceViewSet(InstrumentedViewMixin, ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, StreamingExportMixin,
+                        viewsets.ModelViewSet):
    
     """CRUD API for employee attendance records."""
     queryset = Attendance.objects.select_related("employee", "employee__department").all()
     serializer_class = AttendanceSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
     filterset_fields = {
         "employee": ["exact"],
@@ -27,14 +43,112 @@ class AttendanceViewSet(viewsets.ModelViewSet):
     }
     ordering_fields = ["date", "employee"]
     search_fields = ["employee__name", "employee__email", "employee__department__name"]
+    etag_related = ("employee",)  # ?expand=employee
+    export_filename = "attendance"
+    export_fields = [
+        ("id", "id"),
+        ("employee_id", "employee_id"),
+        ("employee_name", "employee__name"),
+        ("employee_email", "employee__email"),
+        ("department", "employee__department__name"),
+        ("date", "date"),
+        ("status", "status"),
+    ]
+    bulk_max_records = 5000
+
+    @action(detail=False, methods=["post"], url_path="bulk")
+    def bulk(self, request):
+        """
+        Upsert many attendance records in one call.
+
+        Body: a JSON list (or ``{"records": [...]}``) of
+        ``{"employee": id, "date": "YYYY-MM-DD", "status": "Present"}``.
+        An existing (employee, date) row is updated instead of rejected.
+        Returns a result per input row, in input order.
+        """
+        records = request.data.get("records") if isinstance(request.data, dict) else request.data
+        if not isinstance(records, list):
+            return Response({"detail": "Expected a list of attendance records."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if len(records) > self.bulk_max_records:
+            return Response({"detail": f"At most {self.bulk_max_records} records per request."},
+                            status=status.HTTP_400_BAD_REQUEST)
+
+        # 1. Shape validation (no queries)
+        results = [None] * len(records)
+        valid = {}
+        for i, record in enumerate(records):
+            item = AttendanceBulkItemSerializer(data=record)
+            if not item.is_valid():
+                results[i] = {"index": i, "result": "error", "errors": item.errors}
+                continue
+            data = item.validated_data
+            key = (data["employee"], data["date"])
+            if key in valid:
+                # Last row for a key wins; ON CONFLICT cannot touch a row twice per statement.
+                prev = valid[key][0]
+                results[prev] = {"index": prev, "result": "skipped",
+                                 "errors": {"non_field_errors": ["Superseded by a later row for the same employee and date."]}}
+            valid[key] = (i, data["status"])
+
+        # 2. Resolve every referenced employee in one query
+        employee_ids = {emp_id for emp_id, _ in valid}
+        known = set(Employee.objects.filter(pk__in=employee_ids).values_list("pk", flat=True))
+        rows = []
+        for (emp_id, dt), (i, att_status) in valid.items():
+            if emp_id not in known:
+                results[i] = {"index": i, "result": "error",
+                              "errors": {"employee": [f'Invalid pk "{emp_id}" - object does not exist.']}}
+                continue
+            rows.append((emp_id, dt, att_status))
+
+        # 3. One upsert for everything that survived validation
+        updated = upsert_attendance(rows)
+        for emp_id, dt, _ in rows:
+            i = valid[(emp_id, dt)][0]
+            results[i] = {"index": i, "result": "updated" if (emp_id, dt) in updated else "created"}
+
+        counts = {"created": 0, "updated": 0, "skipped": 0, "error": 0}
+        for r in results:
+            counts[r["result"]] += 1
+        return Response({**counts, "results": results}, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=["get"], url_path="calendar")
+    def calendar_month(self, request):
+        """
+        A department's month in one payload, read from the packed calendar.
+
+        Query: ``department`` (id, required) and ``month`` (YYYY-MM, default
+        current month). Each employee's ``days`` string holds one status code
+        per day of the month; ``legend`` maps the codes to statuses.
+        """
+        try:
+            department = int(request.query_params.get("department", ""))
+        except ValueError:
+            department = 0
+        if department < 1:
+            return Response({"detail": "department (id) is required."}, status=status.HTTP_400_BAD_REQUEST)
+        month = request.query_params.get("month")
+        try:
+            month = date.fromisoformat(f"{month}-01") if month else timezone.localdate().replace(day=1)
+        except ValueError:
+            return Response({"detail": "month must be YYYY-MM."}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({
+            "department": department,
+            "month": f"{month:%Y-%m}",
+            "legend": calendar.LEGEND,
+            "employees": calendar.department_month(department, month),
+        })
 
 
-class PerformanceViewSet(viewsets.ModelViewSet):
+class PerformanceViewSet(InstrumentedViewMixin, ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, StreamingExportMixin,
+                         viewsets.ModelViewSet):
     """CRUD API for employee performance reviews."""
     queryset = Performance.objects.select_related("employee", "employee__department").all()
     serializer_class = PerformanceSerializer
-    authentication_classes = [JWTAuthentication]
+    authentication_classes = [CachedJWTAuthentication]
     permission_classes = [IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
     filterset_fields = {
         "employee": ["exact"],
@@ -43,3 +157,6 @@ class PerformanceViewSet(viewsets.ModelViewSet):
     }
     ordering_fields = ["review_date", "rating", "employee"]
     search_fields = ["employee__name", "employee__email", "employee__department__name"]
+    etag_related = ("employee",)  # ?expand=employee
+    export_filename = "performance"
+    export_fields = PERFORMANCE_EXPORT_FIELDS
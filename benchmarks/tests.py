@@ -0,0 +1,247 @@
+"""
+Endpoint benchmark suite.
+
+Seeds a dataset with ``seed_data --bulk``, then hits every API endpoint
+through the Django test client with a real JWT, recording p50/p95 latency
+and query count per endpoint. Results are compared with
+benchmarks/baseline.json; more queries than the baseline, or a p95 beyond
+the allowed tolerance, fails the run.
+
+AttendanceMatrixBenchmark times the NumPy attendance metrics
+(analytics/matrix.py) against the same metrics computed with a per-row Python
+loop, and checks that both agree.
+
+Skipped unless RUN_BENCHMARKS=1:
+
+    RUN_BENCHMARKS=1 python manage.py test benchmarks
+
+Environment knobs:
+    BENCH_EMPLOYEES / BENCH_DAYS   dataset size (default 200 × 90)
+    BENCH_ITERATIONS               timed requests per endpoint (default 20)
+    BENCH_TOLERANCE                allowed p95 slowdown ratio (default 0.5 = +50%)
+    BENCH_SLACK_MS                 absolute p95 slack in ms (default 5)
+    BENCH_UPDATE_BASELINE=1        write the measured numbers as the new baseline
+"""
+
+import json
+import logging
+import os
+import shutil
+import statistics
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+from unittest import skipUnless
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+
+BASELINE_FILE = Path(__file__).resolve().parent / "baseline.json"
+
+EMPLOYEES = int(os.environ.get("BENCH_EMPLOYEES", 200))
+DAYS = int(os.environ.get("BENCH_DAYS", 90))
+ITERATIONS = int(os.environ.get("BENCH_ITERATIONS", 20))
+TOLERANCE = float(os.environ.get("BENCH_TOLERANCE", 0.5))
+SLACK_MS = float(os.environ.get("BENCH_SLACK_MS", 5))
+
+# name -> (url, query params)
+ENDPOINTS = {
+    "employees-list": ("/api/v1/employees/", {}),
+    "employees-search": ("/api/v1/employees/", {"search": "an"}),
+    "employees-ordered": ("/api/v1/employees/", {"ordering": "-date_of_joining"}),
+    "employee-detail": ("/api/v1/employees/{employee_id}/", {}),
+    "departments-list": ("/api/v1/departments/", {}),
+    "attendance-list": ("/api/v1/attendance/", {}),
+    "attendance-deep-page": ("/api/v1/attendance/", {"page": "{deep_page}"}),
+    "attendance-cursor": ("/api/v1/attendance/", {"pagination": "cursor"}),
+    "attendance-by-employee": ("/api/v1/attendance/", {"employee": "{employee_id}"}),
+    "attendance-calendar": ("/api/v1/attendance/calendar/", {"department": "{department_id}", "month": "{month}"}),
+    "performance-list": ("/api/v1/performance/", {}),
+    "performance-filtered": ("/api/v1/performance/", {"rating__gte": 4}),
+    "performance-summary": ("/api/v1/performance-summary/", {"ordering": "-rolling_avg"}),
+    "analytics-employees-per-department": ("/api/v1/analytics/employees-per-department/", {}),
+    "analytics-monthly-attendance": ("/api/v1/analytics/monthly-attendance/", {}),
+    "analytics-dashboard": ("/api/v1/analytics/dashboard/", {}),
+}
+
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+@skipUnless(os.environ.get("RUN_BENCHMARKS") == "1", "set RUN_BENCHMARKS=1 to run endpoint benchmarks")
+class EndpointBenchmarks(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("seed_data", bulk=True, employees=EMPLOYEES, days=DAYS, seed=42, stdout=StringIO())
+        get_user_model().objects.create_superuser("bench", "bench@example.com", "bench-pass")
+
+    def setUp(self):
+        request_logger = logging.getLogger("employee_project.requests")
+        self.addCleanup(request_logger.setLevel, request_logger.level)
+        request_logger.setLevel(logging.ERROR)  # one JSON line per request would drown the report
+
+        # Analytics payloads are only cached in a cache shared by all workers, as deployed
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        self.enterContext(override_settings(CACHES={"default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location,
+        }}))
+
+        self.client = APIClient()
+        token = self.client.post(
+            "/api/auth/token/", {"username": "bench", "password": "bench-pass"}, format="json",
+        ).json()["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+        from attendance.models import Attendance
+        from employees.models import Employee
+        self.context = {
+            "employee_id": Employee.objects.order_by("pk").values_list("pk", flat=True).first(),
+            "deep_page": max(1, Attendance.objects.count() // 20 - 1),
+            "department_id": Employee.objects.order_by("pk").values_list("department_id", flat=True).first(),
+            "month": f"{Attendance.objects.latest('date').date:%Y-%m}",
+        }
+
+    def request(self, url, params):
+        url = url.format(**self.context)
+        params = {k: str(v).format(**self.context) for k, v in params.items()}
+        response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200, f"{url} returned {response.status_code}")
+        return response
+
+    def measure(self, url, params):
+        self.request(url, params)  # warm-up
+        with CaptureQueriesContext(connection) as ctx:
+            self.request(url, params)
+        queries = len(ctx.captured_queries)  # read now: the next request resets the log
+        timings = []
+        for _ in range(ITERATIONS):
+            start = time.perf_counter()
+            self.request(url, params)
+            timings.append((time.perf_counter() - start) * 1000)
+        return {
+            "p50_ms": round(statistics.median(timings), 2),
+            "p95_ms": round(percentile(timings, 95), 2),
+            "queries": queries,
+        }
+
+    def test_endpoints(self):
+        results = {name: self.measure(url, params) for name, (url, params) in ENDPOINTS.items()}
+        dataset = {"employees": EMPLOYEES, "days": DAYS}
+
+        print(f"\n{'endpoint':40} {'p50 ms':>9} {'p95 ms':>9} {'queries':>8}")
+        for name, r in results.items():
+            print(f"{name:40} {r['p50_ms']:9.2f} {r['p95_ms']:9.2f} {r['queries']:8d}")
+
+        if os.environ.get("BENCH_UPDATE_BASELINE") == "1":
+            BASELINE_FILE.write_text(json.dumps({"dataset": dataset, "endpoints": results}, indent=2) + "\n")
+            print(f"Baseline written to {BASELINE_FILE}")
+            return
+
+        if not BASELINE_FILE.exists():
+            self.skipTest("no baseline.json yet; run with BENCH_UPDATE_BASELINE=1")
+        baseline = json.loads(BASELINE_FILE.read_text())
+        compare_latency = baseline.get("dataset") == dataset
+
+        regressions = []
+        for name, r in results.items():
+            base = baseline["endpoints"].get(name)
+            if base is None:
+                continue
+            if r["queries"] > base["queries"]:
+                regressions.append(f"{name}: {r['queries']} queries (baseline {base['queries']})")
+            limit = base["p95_ms"] * (1 + TOLERANCE) + SLACK_MS
+            if compare_latency and r["p95_ms"] > limit:
+                regressions.append(f"{name}: p95 {r['p95_ms']:.2f} ms (baseline {base['p95_ms']:.2f}, limit {limit:.2f})")
+
+        if regressions:
+            self.fail("Endpoint performance regressions:\n  " + "\n  ".join(regressions))
+
+
+def loop_report(department_id, start, end):
+    """Reference for analytics.matrix.department_report: one Python pass per attendance row."""
+    from attendance.models import Attendance
+    from employees.models import Employee
+    from analytics.matrix import WEEKDAYS
+
+    employees = list(Employee.objects.filter(department_id=department_id)
+                     .order_by("name", "id").values_list("id", "name"))
+    stats = {pk: {"recorded": 0, "absent": 0, "late": 0, "run": 0, "streak": 0} for pk, _ in employees}
+    weekdays = [{"Present": 0, "Absent": 0, "Late": 0} for _ in WEEKDAYS]
+    rows = (Attendance.objects
+            .filter(employee__department_id=department_id, date__range=(start, end))
+            .order_by("employee_id", "date")
+            .values_list("employee_id", "date", "status"))
+    for employee_id, day, status in rows:
+        s = stats[employee_id]
+        s["recorded"] += 1
+        weekdays[day.weekday()][status] += 1
+        if status == "Absent":
+            s["absent"] += 1
+        if status == "Late":
+            s["late"] += 1
+            s["run"] += 1
+            s["streak"] = max(s["streak"], s["run"])
+        else:
+            s["run"] = 0
+
+    def rate(a, b):
+        return round(a / b, 4) if b else None
+
+    recorded = sum(s["recorded"] for s in stats.values())
+    return {
+        "employees": [
+            {"id": pk, "name": name, "recorded_days": stats[pk]["recorded"], "absent_days": stats[pk]["absent"],
+             "late_days": stats[pk]["late"], "absenteeism_rate": rate(stats[pk]["absent"], stats[pk]["recorded"]),
+             "longest_late_streak": stats[pk]["streak"]}
+            for pk, name in employees
+        ],
+        "weekdays": [
+            {"weekday": WEEKDAYS[d], "recorded": sum(w.values()), "present": w["Present"], "absent": w["Absent"],
+             "late": w["Late"], "absence_rate": rate(w["Absent"], sum(w.values()))}
+            for d, w in enumerate(weekdays)
+        ],
+        "absenteeism_rate": rate(sum(s["absent"] for s in stats.values()), recorded),
+    }
+
+
+@skipUnless(os.environ.get("RUN_BENCHMARKS") == "1", "set RUN_BENCHMARKS=1 to run endpoint benchmarks")
+class AttendanceMatrixBenchmark(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        call_command("seed_data", bulk=True, employees=EMPLOYEES, days=DAYS, seed=42, stdout=StringIO())
+
+    def test_vectorized_vs_loop(self):
+        from analytics import matrix
+        from departments.models import Department
+        from django.utils import timezone
+
+        if not matrix.available():
+            self.skipTest("NumPy is not installed")
+        start, end = matrix.default_range(timezone.now().date(), DAYS)
+        departments = list(Department.objects.values_list("pk", flat=True))
+
+        def timed(build):
+            samples = []
+            for _ in range(ITERATIONS):
+                began = time.perf_counter()
+                reports = [build(pk, start, end) for pk in departments]
+                samples.append((time.perf_counter() - began) * 1000)
+            return reports, statistics.median(samples)
+
+        loop, loop_ms = timed(loop_report)
+        vectorized, numpy_ms = timed(lambda pk, a, b: {k: v for k, v in matrix.department_report(pk, a, b).items()
+                                                        if k in ("employees", "weekdays", "absenteeism_rate")})
+        self.assertEqual(vectorized, loop)
+        print(f"\nattendance metrics, {len(departments)} departments × {DAYS} days: "
+              f"python loop {loop_ms:.2f} ms, numpy {numpy_ms:.2f} ms ({loop_ms / numpy_ms:.1f}×)")
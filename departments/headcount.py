@@ -0,0 +1,34 @@
+"""
+Maintenance of the denormalized Department.headcount counter.
+
+adjust() is an atomic ``headcount = headcount + delta`` UPDATE, used by the
+Employee receivers in employees/signals.py for creates, deletes and transfers.
+recount() recomputes the counter from the employee table in one UPDATE, used
+after bulk loads and by ``manage.py reconcile_headcounts``. Both bump
+updated_at so the department ETag changes with the count.
+"""
+
+from django.db.models import Count, F, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce, Now
+
+from employees.models import Employee
+from .models import Department
+
+
+def adjust(department_id, delta):
+    if department_id is not None:
+        Department.objects.filter(pk=department_id).update(headcount=F("headcount") + delta, updated_at=Now())
+
+
+def recount(department_ids=None):
+    """Set headcount from COUNT(*) of each department's employees; returns rows updated."""
+    total = (Employee.objects
+             .filter(department=OuterRef("pk"))
+             .order_by()
+             .values("department")
+             .annotate(total=Count("*"))
+             .values("total"))
+    departments = Department.objects.all()
+    if department_ids is not None:
+        departments = departments.filter(pk__in=list(department_ids))
+    return departments.update(headcount=Coalesce(Subquery(total), Value(0)), updated_at=Now())
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from departments import headcount
+from departments.models import Department
+
+
+class Command(BaseCommand):
+    help = "Recompute Department.headcount from the employee table and report any drift."
+
+    def handle(self, *args, **options):
+        before = dict(Department.objects.values_list("pk", "headcount"))
+        headcount.recount()
+        drifted = [
+            (name, before.get(pk), count)
+            for pk, name, count in Department.objects.values_list("pk", "name", "headcount")
+            if before.get(pk) != count
+        ]
+        for name, old, new in drifted:
+            self.stdout.write(self.style.WARNING(f"⚠️  {name}: {old} → {new}"))
+        self.stdout.write(self.style.SUCCESS(
+            f"✅ Headcounts reconciled for {len(before)} departments ({len(drifted)} corrected)."
+        ))
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:19
+
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='department',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, db_default=django.db.models.functions.datetime.Now(), db_index=True, help_text='Last modification time (drives ETag / Last-Modified).'),
+        ),
+    ]
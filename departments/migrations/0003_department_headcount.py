@@ -0,0 +1,29 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:37
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate(apps, schema_editor):
+    Department = apps.get_model("departments", "Department")
+    Employee = apps.get_model("employees", "Employee")
+    counts = Employee.objects.values("department").annotate(total=Count("*")).order_by()
+    for row in counts:
+        Department.objects.filter(pk=row["department"]).update(headcount=row["total"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('departments', '0002_department_updated_at'),
+        ('employees', '0004_updated_at'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='department',
+            name='headcount',
+            field=models.IntegerField(default=0, help_text='Number of employees (maintained by departments/headcount.py).'),
+        ),
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -4,6 +4,7 @@ Each department represents a functional unit within the organization.
 """
 
 from django.db import models
+from django.db.models.functions import Now
 
 class Department(models.Model):
     """
@@ -12,6 +13,9 @@ class Department(models.Model):
     """
     name = models.CharField(max_length=100, unique=True)
     description = models.TextField(blank=True, null=True, help_text="Optional short description of the department.")
+    headcount = models.IntegerField(default=0, help_text="Number of employees (maintained by departments/headcount.py).")
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now(), db_index=True,
+                                      help_text="Last modification time (drives ETag / Last-Modified).")
 
     class Meta:
         ordering = ["name"]
@@ -4,11 +4,20 @@ Used to convert Department objects to/from JSON.
 """
 
 from rest_framework import serializers
+from employee_project.sparse import SparseFieldsMixin
 from .models import Department
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """Serialize and validate Department data for the API."""
     
     class Meta:
         model = Department
         fields = ["id", "name", "description"]
+
+
+class DepartmentStatsSerializer(DepartmentSerializer):
+    """Department with its stored counters, for the department endpoints."""
+
+    class Meta(DepartmentSerializer.Meta):
+        fields = DepartmentSerializer.Meta.fields + ["headcount"]
+        read_only_fields = ["headcount"]
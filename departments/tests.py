@@ -1,3 +1,75 @@
+from datetime import date
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
 from django.test import TestCase
+from rest_framework.test import APIClient
+
+from employees.models import Employee
+from employees.signals import employees_bulk_loaded
+from .models import Department
+from .views import DepartmentViewSet
+
+
+class FastListParityTests(TestCase):
+    """The .values() list path must render exactly the same JSON as the serializer."""
+
+    @classmethod
+    def setUpTestData(cls):
+        for i in range(5):
+            Department.objects.create(name=f"Dept {i}", description=None if i % 2 else f"About {i}")
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def test_department_list(self):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        for params in ({}, {"ordering": "-name"}, {"search": "Dept 3"}):
+            fast = client.get("/api/v1/departments/", params)
+            with mock.patch.object(DepartmentViewSet, "fast_list", False):
+                slow = client.get("/api/v1/departments/", params)
+            self.assertEqual(fast.status_code, 200)
+            self.assertEqual(fast.content, slow.content)
+
+
+class HeadcountTests(TestCase):
+    """Department.headcount follows employee creates, transfers, deletes and bulk loads."""
+
+    def counts(self):
+        return dict(Department.objects.values_list("name", "headcount"))
+
+    def test_counter_maintained(self):
+        eng = Department.objects.create(name="Engineering")
+        hr = Department.objects.create(name="HR")
+        emps = [
+            Employee.objects.create(name=f"E{i}", email=f"h{i}@example.com", date_of_joining=date(2024, 1, 1),
+                                    department=eng)
+            for i in range(3)
+        ]
+        self.assertEqual(self.counts(), {"Engineering": 3, "HR": 0})
+
+        emps[0].department = hr
+        emps[0].save()
+        emps[1].name = "Renamed"
+        emps[1].save()
+        emps[2].delete()
+        self.assertEqual(self.counts(), {"Engineering": 1, "HR": 1})
+
+        Employee.objects.bulk_create([
+            Employee(name="Bulk", email="bulk@example.com", date_of_joining=date(2024, 1, 1), department=hr),
+        ])
+        employees_bulk_loaded.send(sender=Employee, department_ids=[hr.pk])
+        self.assertEqual(self.counts(), {"Engineering": 1, "HR": 2})
+
+        Department.objects.update(headcount=7)
+        call_command("reconcile_headcounts", stdout=mock.Mock())
+        self.assertEqual(self.counts(), {"Engineering": 1, "HR": 2})
 
-# Create your tests here.
+    def test_listed_without_extra_queries(self):
+        dept = Department.objects.create(name="Engineering")
+        Employee.objects.create(name="A", email="a@example.com", date_of_joining=date(2024, 1, 1), department=dept)
+        client = APIClient()
+        client.force_authenticate(get_user_model().objects.create_superuser("admin", "admin@example.com", "pw"))
+        with self.assertNumQueries(2):  # validators + page
+            response = client.get("/api/v1/departments/")
+        self.assertEqual(response.json()["results"][0]["headcount"], 1)
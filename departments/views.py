@@ -5,11 +5,15 @@ Provides full CRUD functionality.
 
 from rest_framework import viewsets, filters
 from rest_framework.permissions import IsAuthenticated
+from employee_project.conditional import ConditionalGetMixin
+from employee_project.fast_serializers import FastListMixin
+from employee_project.instrumentation import InstrumentedViewMixin
+from employee_project.sparse import SparseFieldsetMixin
 from .models import Department
-from .serializers import DepartmentSerializer
+from .serializers import DepartmentStatsSerializer
 
 
-class DepartmentViewSet(viewsets.ModelViewSet):
+class DepartmentViewSet(InstrumentedViewMixin, ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, viewsets.ModelViewSet):
     """
     Department CRUD API.
     Features:
@@ -17,10 +21,12 @@ class DepartmentViewSet(viewsets.ModelViewSet):
     - Create new departments
     - Retrieve single department
     - Update or delete existing departments
+    - headcount is a stored counter, so listing it costs no extra query
+    - ?fields= trims the payload (employee_project/sparse.py)
     """
     queryset = Department.objects.all().order_by("name")   # ✅ THIS IS REQUIRED
-    serializer_class = DepartmentSerializer
+    serializer_class = DepartmentStatsSerializer
     permission_classes = [IsAuthenticated]
     filter_backends = [filters.SearchFilter, filters.OrderingFilter]
     search_fields = ["name", "description"]
-    ordering_fields = ["name"]
+    ordering_fields = ["name", "headcount"]
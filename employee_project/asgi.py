@@ -9,6 +9,6 @@ https://docs.djangoproject.com/en/5.2/howto/deployment/asgi/
 
 # asgi.py
 import os
-from django.core.asgi import get_asgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "employee_project.settings")
-application = get_asgi_application()
+from employee_project import startup  # noqa: E402
+application = startup.load("asgi")  # timed, and warmed up with WARMUP=True
@@ -0,0 +1,166 @@
+"""
+Batch endpoint: several API calls in one HTTP round trip.
+
+POST /api/v1/batch/ with
+
+    {"atomic": false,
+     "requests": [{"id": "employee", "method": "GET", "path": "/api/v1/employees/7/"},
+                  {"method": "GET", "path": "/api/v1/attendance/?employee=7",
+                   "headers": {"If-None-Match": "\\"...\\""}},
+                  {"method": "PATCH", "path": "/api/v1/employees/7/", "body": {"phone_number": "555"}}]}
+
+Each sub-request is resolved against the URLconf and its view is called
+in-process, in order:
+
+- authentication runs once, for the batch request; sub-requests reuse the
+  verified user and token (DRF forced authentication), so the JWT is not
+  decoded again and the RBAC role set memoised on the user is shared
+- the middleware stack runs once; sub-requests go straight to the view
+- everything runs on the batch request's thread and therefore on the same
+  database connection
+- with ``"atomic": true`` the whole batch runs in one transaction; the first
+  sub-request answering 4xx/5xx rolls everything back and the remaining
+  ones are reported as 424 without running
+
+The response lists one ``{"id", "status", "headers", "body"}`` per
+sub-request, in input order; the batch itself answers 200 unless the batch
+payload is invalid. Only paths under /api/v1/ are accepted, a batch cannot
+contain another batch, and streaming responses (CSV/NDJSON exports) are not
+supported.
+"""
+
+import io
+import json
+import logging
+from urllib.parse import urlsplit
+
+from asgiref.sync import async_to_sync, iscoroutinefunction
+from django.conf import settings
+from django.core.handlers.wsgi import WSGIRequest
+from django.db import transaction
+from django.urls import Resolver404, resolve
+from rest_framework import status
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+from .instrumentation import InstrumentedViewMixin
+
+logger = logging.getLogger(__name__)
+
+METHODS = {"GET", "HEAD", "POST", "PUT", "PATCH", "DELETE"}
+PATH_PREFIX = "/api/v1/"
+# Outer-request headers that describe the batch call itself, not its items
+_OWN_HEADERS = ("CONTENT_TYPE", "CONTENT_LENGTH", "HTTP_IF_", "HTTP_ACCEPT")
+
+
+def _error(item_id, code, detail):
+    return {"id": item_id, "status": code, "headers": {}, "body": {"detail": detail}}
+
+
+class BatchView(InstrumentedViewMixin, APIView):
+    """Run a list of API sub-requests and return every response in one payload."""
+
+    max_requests = getattr(settings, "BATCH_MAX_REQUESTS", 20)
+
+    def post(self, request):
+        items = request.data.get("requests") if isinstance(request.data, dict) else request.data
+        if not isinstance(items, list) or not all(isinstance(item, dict) for item in items):
+            return Response({"detail": "Expected a list of request objects."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        if not items:
+            return Response({"detail": "The batch is empty."}, status=status.HTTP_400_BAD_REQUEST)
+        if len(items) > self.max_requests:
+            return Response({"detail": f"At most {self.max_requests} requests per batch."},
+                            status=status.HTTP_400_BAD_REQUEST)
+        atomic = isinstance(request.data, dict) and bool(request.data.get("atomic"))
+
+        if not atomic:
+            return Response({"responses": [self.run(request, i, item) for i, item in enumerate(items)]})
+
+        responses = []
+        with transaction.atomic():
+            for i, item in enumerate(items):
+                result = self.run(request, i, item)
+                responses.append(result)
+                if result["status"] >= 400:
+                    transaction.set_rollback(True)
+                    responses += [_error(other.get("id", j), status.HTTP_424_FAILED_DEPENDENCY,
+                                         f"Not run: request {result['id']!r} failed and the batch was rolled back.")
+                                  for j, other in enumerate(items[i + 1:], start=i + 1)]
+                    break
+        return Response({"responses": responses})
+
+    # -------------------------------
+    # One sub-request
+    # -------------------------------
+    def run(self, request, index, item):
+        item_id = item.get("id", index)
+        method = str(item.get("method", "GET")).upper()
+        url = item.get("path")
+        if method not in METHODS:
+            return _error(item_id, status.HTTP_405_METHOD_NOT_ALLOWED, f"Method {method!r} is not allowed.")
+        if not isinstance(url, str) or not url.startswith(PATH_PREFIX):
+            return _error(item_id, status.HTTP_400_BAD_REQUEST, f"Path must start with {PATH_PREFIX}.")
+
+        parts = urlsplit(url)
+        try:
+            match = resolve(parts.path)
+        except Resolver404:
+            return _error(item_id, status.HTTP_404_NOT_FOUND, "Not found.")
+        if getattr(match.func, "view_class", None) is type(self):
+            return _error(item_id, status.HTTP_400_BAD_REQUEST, "Batches cannot be nested.")
+
+        sub = self.build_request(request, method, parts, item)
+        try:
+            if iscoroutinefunction(match.func):
+                response = async_to_sync(match.func)(sub, *match.args, **match.kwargs)
+            else:
+                response = match.func(sub, *match.args, **match.kwargs)
+            if hasattr(response, "render"):
+                response.render()
+        except Exception:
+            logger.exception("Batch sub-request %s %s failed", method, url)
+            return _error(item_id, status.HTTP_500_INTERNAL_SERVER_ERROR, "Internal server error.")
+        return self.serialize(item_id, response)
+
+    def build_request(self, request, method, parts, item):
+        """A WSGIRequest for ``item`` carrying the batch request's identity."""
+        body = item.get("body")
+        payload = b"" if body is None else json.dumps(body).encode()
+        environ = {key: value for key, value in request.META.items() if not key.startswith(_OWN_HEADERS)}
+        environ.update({
+            "REQUEST_METHOD": method,
+            "PATH_INFO": parts.path,
+            "SCRIPT_NAME": "",
+            "QUERY_STRING": parts.query,
+            "CONTENT_TYPE": "application/json",
+            "CONTENT_LENGTH": str(len(payload)),
+            "HTTP_ACCEPT": "application/json",
+            "wsgi.input": io.BytesIO(payload),
+            "wsgi.url_scheme": request.scheme,
+        })
+        for name, value in (item.get("headers") or {}).items():
+            key = "HTTP_" + str(name).upper().replace("-", "_")
+            if key not in ("HTTP_AUTHORIZATION", "HTTP_COOKIE"):
+                environ[key] = str(value)
+
+        sub = WSGIRequest(environ)
+        # One authentication pass: DRF views trust these instead of re-verifying the token
+        sub._force_auth_user = request.user
+        sub._force_auth_token = request.auth
+        sub.user = request.user  # plain Django views (analytics)
+        return sub
+
+    def serialize(self, item_id, response):
+        headers = {name: value for name, value in response.items() if name != "Server-Timing"}
+        if response.streaming:
+            return _error(item_id, status.HTTP_400_BAD_REQUEST,
+                          "Streaming responses are not supported in a batch; call the export directly.")
+        content = response.content
+        if not content:
+            body = None
+        elif response.get("Content-Type", "").startswith("application/json"):
+            body = json.loads(content)
+        else:
+            body = content.decode(response.charset or "utf-8", errors="replace")
+        return {"id": item_id, "status": response.status_code, "headers": headers, "body": body}
@@ -0,0 +1,128 @@
+"""
+Conditional GET (ETag / Last-Modified) for API viewsets.
+
+ConditionalGetMixin validates ``list`` and ``retrieve`` requests before any
+serialization happens:
+
+- list: one query over the filtered queryset — COUNT(*), MAX(updated_at) and
+  MAX(updated_at) of each related model listed in ``etag_related`` (nested
+  data such as the employee's department). Each is a scalar subquery, so
+  every aggregate keeps its own index plan (SQLite answers a lone MAX from
+  the updated_at index, but scans the table for MAX and COUNT together). The
+  ETag hashes those values with the full request path, so every page, filter
+  and ordering has its own tag. Deletions change the count, so the ETag
+  catches them; Last-Modified cannot, which is why lists only honour
+  If-None-Match. The count is handed to CountedPageNumberPagination as
+  ``list_count``, so a 200 response costs no extra scan over the plain list.
+- retrieve: the object's ``updated_at`` and those of its ``etag_related``
+  objects (loaded by the viewset's select_related, so no extra query).
+
+A matching If-None-Match (or, for retrieve, If-Modified-Since) returns
+``304 Not Modified`` with an empty body; a failed If-Match gives 412.
+"""
+
+import datetime
+import hashlib
+
+from django.conf import settings
+from django.db import connections
+from django.db.models import Count, IntegerField, Max, Value
+from django.utils import timezone
+from django.utils.cache import get_conditional_response
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date
+from rest_framework import status
+from rest_framework.response import Response
+
+
+def _etag(*parts):
+    digest = hashlib.md5("|".join(str(p) for p in parts).encode(), usedforsecurity=False).hexdigest()
+    return f'W/"{digest}"'
+
+
+def _scalars(queryset, expressions):
+    """Evaluate aggregate ``expressions`` over ``queryset`` as one SELECT of scalar subqueries."""
+    parts, params = [], []
+    for expression in expressions:
+        subquery = (queryset.order_by()
+                    .annotate(_all=Value(1, output_field=IntegerField())).values("_all")
+                    .annotate(value=expression).values("value"))
+        sql, sub_params = subquery.query.get_compiler(using=queryset.db).as_sql()
+        parts.append(f"({sql})")
+        params.extend(sub_params)
+    with connections[queryset.db].cursor() as cursor:
+        cursor.execute("SELECT " + ", ".join(parts), params)
+        return cursor.fetchone()
+
+
+def _as_datetime(value):
+    """Raw cursor values skip field converters (SQLite returns text)."""
+    if isinstance(value, str):
+        value = parse_datetime(value)
+    if value is not None and settings.USE_TZ and timezone.is_naive(value):
+        value = timezone.make_aware(value, datetime.timezone.utc)
+    return value
+
+
+def _related_stamp(instance, path, field):
+    for attr in path.split("__"):
+        instance = getattr(instance, attr, None)
+        if instance is None:
+            return None
+    return getattr(instance, field)
+
+
+class ConditionalGetMixin:
+    """Viewset mixin; set ``etag_related`` to FK paths whose changes alter the output."""
+
+    updated_field = "updated_at"
+    etag_related = ()
+    list_count = None
+
+    def list_validators(self, queryset):
+        """(etag, last_modified) for a filtered list queryset, in one query."""
+        expressions = [Count("*"), Max(self.updated_field)]
+        expressions += [Max(f"{related}__{self.updated_field}") for related in self.etag_related]
+        count, *stamps = _scalars(queryset, expressions)
+        stamps = [_as_datetime(stamp) for stamp in stamps]
+        self.list_count = count or 0
+
+        present = [stamp for stamp in stamps if stamp is not None]
+        last_modified = max(present) if present else None
+        etag = _etag(self.request.get_full_path(), self.request.accepted_renderer.format, count, *stamps)
+        return etag, last_modified
+
+    def with_validators(self, response, etag, last_modified):
+        response["ETag"] = etag
+        if last_modified is not None:
+            response["Last-Modified"] = http_date(last_modified.timestamp())
+        return response
+
+    def precondition_response(self, etag, last_modified=None):
+        """304/412 response if the request's preconditions decide the outcome, else None."""
+        timestamp = int(last_modified.timestamp()) if last_modified is not None else None
+        conditional = get_conditional_response(self.request, etag=etag, last_modified=timestamp)
+        if conditional is None:
+            return None
+        if conditional.status_code == status.HTTP_304_NOT_MODIFIED:
+            return self.with_validators(Response(status=status.HTTP_304_NOT_MODIFIED), etag, last_modified)
+        return Response(status=conditional.status_code)
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = self.list_validators(self.filter_queryset(self.get_queryset()))
+        response = self.precondition_response(etag)
+        if response is not None:
+            return response
+        return self.with_validators(super().list(request, *args, **kwargs), etag, last_modified)
+
+    def retrieve(self, request, *args, **kwargs):
+        instance = self.get_object()
+        stamps = [getattr(instance, self.updated_field)]
+        stamps += [_related_stamp(instance, related, self.updated_field) for related in self.etag_related]
+        last_modified = max(stamp for stamp in stamps if stamp is not None)
+        etag = _etag(request.get_full_path(), request.accepted_renderer.format, instance.pk, *stamps)
+        response = self.precondition_response(etag, last_modified)
+        if response is not None:
+            return response
+        serializer = self.get_serializer(instance)
+        return self.with_validators(Response(serializer.data), etag, last_modified)
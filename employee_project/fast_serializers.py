@@ -0,0 +1,144 @@
+"""
+Read-optimised list serialization.
+
+FastListMixin serves a viewset's ``list`` action from ``.values()`` rows
+instead of model instances. A ValuesPlan is compiled once per serializer
+class: it maps every readable serializer field to an ORM lookup plus a
+precomputed converter that reproduces the field's to_representation(). The
+JSON is identical to the regular serializer path (see the parity tests in
+each app's tests.py), without model instantiation, N+1 joins for nested
+serializers, or per-field serializer dispatch.
+
+Serializers using fields the plan cannot mirror (method fields, custom
+to_representation, ...) are detected up front and keep the normal path.
+"""
+
+from functools import lru_cache
+
+from rest_framework import fields as drf_fields, relations, serializers
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+
+
+class UnsupportedField(Exception):
+    """The serializer cannot be mirrored by a ValuesPlan."""
+
+
+def _identity(value):
+    return value
+
+
+def _isoformat(value):
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def _converter(field):
+    """Return a function reproducing ``field.to_representation`` for raw column values."""
+    if not type(field).to_representation.__module__.startswith("rest_framework."):
+        raise UnsupportedField(field)  # custom to_representation()
+    if isinstance(field, drf_fields.ChoiceField):
+        choices = field.choice_strings_to_values
+        return lambda value: value if value == "" else choices.get(str(value), value)
+    if isinstance(field, drf_fields.IntegerField):
+        return int
+    if isinstance(field, drf_fields.CharField):
+        return str
+    if isinstance(field, drf_fields.DateField):
+        fmt = getattr(field, "format", api_settings.DATE_FORMAT)
+        if fmt is None:
+            return _identity
+        if fmt.lower() == drf_fields.ISO_8601:
+            return _isoformat
+        return field.to_representation
+    if isinstance(field, (drf_fields.DateTimeField, drf_fields.FloatField, drf_fields.BooleanField,
+                          drf_fields.DecimalField)):
+        return field.to_representation
+    if isinstance(field, drf_fields.ReadOnlyField):
+        return _identity
+    if isinstance(field, relations.PrimaryKeyRelatedField) and field.pk_field is None:
+        return _identity
+    raise UnsupportedField(field)
+
+
+class ValuesPlan:
+    """
+    Compiled mapping from a serializer to ``.values()`` lookups.
+
+    ``entries`` holds (output key, lookup, converter) for flat fields and
+    (output key, null-check lookup, nested ValuesPlan) for nested serializers.
+    """
+
+    def __init__(self, serializer, prefix=""):
+        self.entries = []
+        self.lookups = []
+        if type(serializer).to_representation is not serializers.Serializer.to_representation:
+            raise UnsupportedField(serializer)
+        for field in serializer._readable_fields:
+            if field.source == "*":
+                raise UnsupportedField(field)
+            lookup = prefix + "__".join(field.source_attrs)
+            if isinstance(field, serializers.BaseSerializer):
+                if isinstance(field, serializers.ListSerializer):
+                    raise UnsupportedField(field)
+                nested = ValuesPlan(field, prefix=lookup + "__")
+                # values("department") yields the FK column itself: a free null check
+                self.entries.append((field.field_name, lookup, nested))
+                self.lookups.append(lookup)
+                self.lookups.extend(nested.lookups)
+            else:
+                self.entries.append((field.field_name, lookup, _converter(field)))
+                self.lookups.append(lookup)
+        self.lookups = list(dict.fromkeys(self.lookups))
+
+    def render(self, row):
+        ret = {}
+        for key, lookup, convert in self.entries:
+            value = row[lookup]
+            if value is None:
+                ret[key] = None
+            elif isinstance(convert, ValuesPlan):
+                ret[key] = convert.render(row)
+            else:
+                ret[key] = convert(value)
+        return ret
+
+
+@lru_cache(maxsize=256)
+def _compile(serializer_class, options):
+    try:
+        return ValuesPlan(serializer_class(**dict(options)))
+    except UnsupportedField:
+        return None
+
+
+def get_plan(serializer_class, **options):
+    """
+    Compile (once) and return the ValuesPlan for a serializer class, or None.
+
+    ``options`` are passed to the serializer (e.g. the ``fields``/``expand``
+    of employee_project/sparse.py) and must be hashable; each combination
+    gets its own plan.
+    """
+    return _compile(serializer_class, tuple(sorted(options.items())))
+
+
+class FastListMixin:
+    """Serve ``list`` from ``.values()`` rows via the serializer's ValuesPlan."""
+
+    fast_list = True
+
+    def get_values_plan(self):
+        if not self.fast_list:
+            return None
+        return get_plan(self.get_serializer_class())
+
+    def list(self, request, *args, **kwargs):
+        plan = self.get_values_plan()
+        if plan is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset()).values(*plan.lookups)
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response([plan.render(row) for row in page])
+        return Response([plan.render(row) for row in queryset])
@@ -0,0 +1,231 @@
+"""
+Bulk loading helpers and the base class for CSV import commands.
+
+CsvImportCommand streams a CSV file in chunks: each chunk is validated row by
+row (bad rows go to an error report instead of aborting the run) and written
+in one transaction together with its checkpoint (jobs.ImportCheckpoint), so an
+interrupted import continues exactly where it stopped with ``--resume``:
+
+    python manage.py import_attendance attendance.csv
+    python manage.py import_attendance attendance.csv --resume
+
+Subclasses implement ``prepare()`` (build lookup maps, ideally one query
+each), ``validate(row)`` and ``load(rows)``.
+"""
+
+import csv
+import io
+import os
+from itertools import islice
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+
+from jobs.models import ImportCheckpoint
+
+
+def batched(iterable, size):
+    """Yield lists of at most ``size`` items from ``iterable``."""
+    it = iter(iterable)
+    while True:
+        batch = list(islice(it, size))
+        if not batch:
+            return
+        yield batch
+
+
+# -------------------------------
+# PostgreSQL COPY
+# -------------------------------
+def copy_supported():
+    """True when the default connection can stream rows with PostgreSQL COPY."""
+    return connection.vendor == "postgresql"
+
+
+def _copy_value(value):
+    """Encode one value for COPY ... FORMAT text."""
+    if value is None:
+        return r"\N"
+    return (str(value).replace("\\", "\\\\").replace("\t", "\\t")
+            .replace("\n", "\\n").replace("\r", "\\r"))
+
+
+def copy_rows(table, columns, rows, batch_size):
+    """Load ``rows`` into ``table`` with COPY FROM STDIN, one buffer per batch."""
+    sql = f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT text)"
+    total = 0
+    with connection.cursor() as cursor:
+        raw = cursor.cursor
+        for batch in batched(rows, batch_size):
+            buf = io.StringIO()
+            for row in batch:
+                buf.write("\t".join(_copy_value(v) for v in row))
+                buf.write("\n")
+            buf.seek(0)
+            if hasattr(raw, "copy_expert"):       # psycopg2
+                raw.copy_expert(sql, buf)
+            else:                                 # psycopg 3
+                with raw.copy(sql) as copy:
+                    copy.write(buf.getvalue())
+            total += len(batch)
+    return total
+
+
+# -------------------------------
+# CSV import commands
+# -------------------------------
+class RowError(ValueError):
+    """A CSV row that fails validation; the message goes to the error report."""
+
+
+class CsvImportCommand(BaseCommand):
+    """Chunked, resumable CSV import with an error report."""
+
+    required_columns = ()
+    default_chunk_size = 5000
+    default_batch_size = 1000
+
+    def add_arguments(self, parser):
+        parser.add_argument("csv_path", help="CSV file to import (UTF-8, header row required)")
+        parser.add_argument(
+            "--chunk-size", type=int, default=self.default_chunk_size,
+            help=f"Rows validated and committed per transaction (default={self.default_chunk_size})",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=self.default_batch_size,
+            help=f"Rows per INSERT/COPY statement (default={self.default_batch_size})",
+        )
+        parser.add_argument(
+            "--resume", action="store_true",
+            help="Continue from the checkpoint left by an interrupted run",
+        )
+        parser.add_argument("--checkpoint", help="Checkpoint name (default: the absolute path of csv_path)")
+        parser.add_argument("--errors", help="Error report CSV (default: <csv_path>.errors.csv)")
+        parser.add_argument(
+            "--no-copy", action="store_true",
+            help="Use bulk_create even when PostgreSQL COPY is available",
+        )
+
+    # --- hooks -------------------------------------------------------
+    def prepare(self, opts):
+        """Build in-memory lookup maps before the first chunk."""
+
+    def validate(self, row):
+        """Return the cleaned row or raise RowError."""
+        raise NotImplementedError
+
+    def load(self, rows, opts):
+        """Write one chunk of cleaned rows (inside a transaction)."""
+        raise NotImplementedError
+
+    def finish(self, state, opts):
+        """Called once after the last chunk; ``state`` is the checkpoint dict."""
+
+    def chunk_state(self, rows, state):
+        """Fold a committed chunk into the checkpoint ``state`` (JSON-serialisable)."""
+
+    # --- driver ------------------------------------------------------
+    def handle(self, *args, **opts):
+        path = opts["csv_path"]
+        if not os.path.exists(path):
+            raise CommandError(f"File not found: {path}")
+        if opts["chunk_size"] < 1 or opts["batch_size"] < 1:
+            raise CommandError("--chunk-size and --batch-size must be at least 1.")
+        opts["use_copy"] = copy_supported() and not opts["no_copy"]
+        checkpoint = opts["checkpoint"] or os.path.abspath(path)
+        errors_path = opts["errors"] or f"{path}.errors.csv"
+
+        state = self.read_checkpoint(checkpoint, path) if opts["resume"] else None
+        if state is None:
+            state = {"source": os.path.abspath(path), "size": os.path.getsize(path),
+                     "rows": 0, "loaded": 0, "errors": 0}
+            ImportCheckpoint.objects.filter(name=checkpoint).delete()
+            if os.path.exists(errors_path):
+                os.remove(errors_path)
+        elif state["rows"]:
+            self.stdout.write(self.style.WARNING(f"↩️  Resuming after row {state['rows']}."))
+
+        self.prepare(opts)
+        mode = "COPY" if opts["use_copy"] else "batched INSERT"
+        self.stdout.write(self.style.SUCCESS(f"🚀 Importing {path} ({mode}, {opts['chunk_size']} rows per chunk)..."))
+
+        with open(path, newline="", encoding="utf-8-sig") as fh:
+            reader = csv.DictReader(fh)
+            missing = [c for c in self.required_columns if c not in (reader.fieldnames or [])]
+            if missing:
+                raise CommandError(f"Missing column(s): {', '.join(missing)}")
+            report = ErrorReport(errors_path, reader.fieldnames)
+
+            rows = ((reader.line_num, row) for row in reader)
+            for chunk in batched(islice(rows, state["rows"], None), opts["chunk_size"]):
+                cleaned, rejected = [], []
+                for line, row in chunk:
+                    try:
+                        cleaned.append(self.validate(row))
+                    except RowError as exc:
+                        rejected.append((line, row, exc))
+                with transaction.atomic():
+                    self.load(cleaned, opts)
+                    state["rows"] += len(chunk)
+                    state["loaded"] += len(cleaned)
+                    state["errors"] += len(chunk) - len(cleaned)
+                    self.chunk_state(cleaned, state)
+                    self.write_checkpoint(checkpoint, state)
+                # only after the commit, so a retried chunk is never reported twice
+                report.write_all(rejected)
+                self.stdout.write(f"   … {state['rows']} rows read, {state['loaded']} loaded")
+            report.close()
+
+        self.finish(state, opts)
+        ImportCheckpoint.objects.filter(name=checkpoint).delete()
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🎉 Done! {state['loaded']} rows loaded, {state['errors']} rejected."
+        ))
+        if state["errors"]:
+            self.stdout.write(self.style.WARNING(f"⚠️  Rejected rows written to {errors_path}"))
+
+    @staticmethod
+    def read_checkpoint(checkpoint, path):
+        state = ImportCheckpoint.objects.filter(name=checkpoint).values_list("state", flat=True).first()
+        if state is None:
+            return None
+        if state.get("source") != os.path.abspath(path) or state.get("size") != os.path.getsize(path):
+            raise CommandError(
+                f"Checkpoint {checkpoint!r} belongs to a different or modified file; "
+                f"run without --resume to start over."
+            )
+        return state
+
+    @staticmethod
+    def write_checkpoint(checkpoint, state):
+        ImportCheckpoint.objects.update_or_create(name=checkpoint, defaults={"state": state})
+
+
+class ErrorReport:
+    """Append-only CSV of rejected rows: line number, original columns, error."""
+
+    def __init__(self, path, fieldnames):
+        self.path = path
+        self.fieldnames = ["line", *(fieldnames or []), "error"]
+        self.fh = None
+        self.writer = None
+
+    def write(self, line, row, error):
+        if self.writer is None:
+            new = not os.path.exists(self.path)
+            self.fh = open(self.path, "a", newline="", encoding="utf-8")
+            self.writer = csv.DictWriter(self.fh, self.fieldnames, extrasaction="ignore")
+            if new:
+                self.writer.writeheader()
+        self.writer.writerow({**row, "line": line, "error": str(error)})
+
+    def write_all(self, rejected):
+        for line, row, error in rejected:
+            self.write(line, row, error)
+        if self.fh is not None:
+            self.fh.flush()
+
+    def close(self):
+        if self.fh is not None:
+            self.fh.close()
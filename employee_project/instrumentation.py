@@ -0,0 +1,259 @@
+"""
+Per-request performance instrumentation.
+
+ServerTimingMiddleware times every request and reports the breakdown both
+as a ``Server-Timing`` header (visible in the browser dev tools) and as one
+JSON line on the ``employee_project.requests`` logger, at DEBUG:
+
+    db          time in SQL, via an execute wrapper (desc = query count)
+    auth        DRF authentication
+    perm        DRF permission and throttle checks
+    serialize   view handler + response rendering, minus the SQL run meanwhile
+                (for list/retrieve this is model/row conversion and JSON encoding)
+    total       the whole request as seen by the middleware
+
+Requests slower than SLOW_REQUEST_MS are logged at WARNING together with the
+SLOW_REQUEST_TOP_SQL statements that took the most time.
+
+Streaming responses (the CSV/NDJSON exports) run most of their SQL while
+the body is sent, after the middleware has returned. Their Server-Timing
+header can only show the work done before the first byte; the log line is
+written once the stream is exhausted or closed, and covers all of it
+(``"streamed": true``). Async iterators are not wrapped and log only the
+work done before streaming.
+
+The auth/perm/serialize phases come from InstrumentedViewMixin, which the
+API viewsets include; plain Django views report db and total only.
+
+Database connections are per thread, and async views run their ORM calls in
+sync_to_async threads, so instead of a per-request execute_wrapper() block
+every connection carries one permanent wrapper that reports to the metrics of
+the current request (a context variable, which does follow sync_to_async).
+"""
+
+import json
+import logging
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger("employee_project.requests")
+
+_current = ContextVar("request_metrics", default=None)
+
+
+def current_metrics():
+    """The RequestMetrics of the request being served, or None."""
+    return _current.get()
+
+
+@contextmanager
+def timer(name):
+    """Add the duration of the block to the current request's ``name`` phase."""
+    metrics = _current.get()
+    if metrics is None:
+        yield
+        return
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        metrics.timings[name] += time.perf_counter() - start
+
+
+def _dispatch(execute, sql, params, many, context):
+    metrics = _current.get()
+    if metrics is None:
+        return execute(sql, params, many, context)
+    return metrics(execute, sql, params, many, context)
+
+
+def install(connection, **kwargs):
+    """Attach the metrics wrapper to ``connection`` (idempotent)."""
+    if _dispatch not in connection.execute_wrappers:
+        connection.execute_wrappers.append(_dispatch)
+
+
+connection_created.connect(install)
+
+
+class RequestMetrics:
+    """Timings collected while serving one request (durations in seconds)."""
+
+    def __init__(self):
+        self.timings = defaultdict(float)
+        self.queries = []  # (sql, duration)
+        self.db_time = 0.0
+        self._serialize_mark = None
+
+    def __call__(self, execute, sql, params, many, context):
+        """Execute-wrapper hook, reached through _dispatch."""
+        start = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start
+            self.db_time += duration
+            self.queries.append((sql, duration))
+
+    def start_serialize(self):
+        self._serialize_mark = (time.perf_counter(), self.db_time, self.timings["perm"])
+
+    def stop_serialize(self, *args):
+        if self._serialize_mark is None:
+            return
+        start, db_time, perm_time = self._serialize_mark
+        self._serialize_mark = None
+        elapsed = time.perf_counter() - start
+        excluded = (self.db_time - db_time) + (self.timings["perm"] - perm_time)
+        self.timings["serialize"] += max(0.0, elapsed - excluded)
+
+    def top_queries(self, limit):
+        """Statements with the highest total time: [(sql, count, seconds), ...]."""
+        grouped = defaultdict(lambda: [0, 0.0])
+        for sql, duration in self.queries:
+            grouped[sql][0] += 1
+            grouped[sql][1] += duration
+        ranked = sorted(grouped.items(), key=lambda item: item[1][1], reverse=True)
+        return [(sql, count, total) for sql, (count, total) in ranked[:limit]]
+
+    def server_timing(self, total):
+        count = len(self.queries)
+        parts = [f'db;dur={self.db_time * 1000:.2f};desc="{count} quer{"y" if count == 1 else "ies"}"']
+        for name in ("auth", "perm", "serialize"):
+            if name in self.timings:
+                parts.append(f"{name};dur={self.timings[name] * 1000:.2f}")
+        parts.append(f"total;dur={total * 1000:.2f}")
+        return ", ".join(parts)
+
+
+class ServerTimingMiddleware:
+    """Measure each request; add Server-Timing and log the breakdown."""
+
+    sync_capable = True
+    async_capable = True  # async analytics views stay async under ASGI
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.is_async = iscoroutinefunction(get_response)
+        if self.is_async:
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if self.is_async:
+            return self.__acall__(request)
+        for conn in connections.all(initialized_only=True):
+            install(conn)  # connections opened before this module was imported
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, time.perf_counter() - start)
+
+    async def __acall__(self, request):
+        metrics = RequestMetrics()
+        token = _current.set(metrics)
+        start = time.perf_counter()
+        try:
+            response = await self.get_response(request)
+        finally:
+            _current.reset(token)
+        return self.finish(request, response, metrics, time.perf_counter() - start)
+
+    def finish(self, request, response, metrics, total):
+        response["Server-Timing"] = metrics.server_timing(total)
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.stream(request, response, metrics, total, response.streaming_content)
+        else:
+            self.log(request, response, metrics, total)
+        return response
+
+    def stream(self, request, response, metrics, total, content):
+        """Re-enter the request's metrics for each chunk of ``content``; log when the stream ends."""
+        start = time.perf_counter()
+        try:
+            while True:
+                token = _current.set(metrics)
+                try:
+                    chunk = next(content, None)
+                finally:
+                    _current.reset(token)
+                if chunk is None:
+                    break
+                yield chunk
+        finally:
+            self.log(request, response, metrics, total + time.perf_counter() - start, streamed=True)
+
+    def log(self, request, response, metrics, total, streamed=False):
+        record = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "total_ms": round(total * 1000, 2),
+            "db_ms": round(metrics.db_time * 1000, 2),
+            "queries": len(metrics.queries),
+        }
+        if streamed:
+            record["streamed"] = True
+        for name, duration in metrics.timings.items():
+            record[f"{name}_ms"] = round(duration * 1000, 2)
+
+        threshold = getattr(settings, "SLOW_REQUEST_MS", 500)
+        if threshold is not None and record["total_ms"] >= threshold:
+            limit = getattr(settings, "SLOW_REQUEST_TOP_SQL", 5)
+            record["slow"] = True
+            record["top_sql"] = [
+                {"sql": sql, "count": count, "ms": round(duration * 1000, 2)}
+                for sql, count, duration in metrics.top_queries(limit)
+            ]
+            logger.warning(json.dumps(record), extra={"metrics": record})
+        else:
+            logger.debug(json.dumps(record), extra={"metrics": record})
+
+
+class InstrumentedViewMixin:
+    """
+    APIView mixin reporting DRF's auth, permission and serialization phases
+    to ServerTimingMiddleware.
+    """
+
+    def perform_authentication(self, request):
+        with timer("auth"):
+            super().perform_authentication(request)
+
+    def check_permissions(self, request):
+        with timer("perm"):
+            super().check_permissions(request)
+
+    def check_object_permissions(self, request, obj):
+        with timer("perm"):
+            super().check_object_permissions(request, obj)
+
+    def check_throttles(self, request):
+        with timer("perm"):
+            super().check_throttles(request)
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        metrics = _current.get()
+        if metrics is not None:
+            metrics.start_serialize()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        metrics = _current.get()
+        if metrics is not None:
+            if getattr(response, "is_rendered", True):
+                metrics.stop_serialize()
+            else:
+                response.add_post_render_callback(metrics.stop_serialize)
+        return response
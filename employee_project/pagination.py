@@ -0,0 +1,235 @@
+"""
+Pagination classes shared by the API viewsets.
+
+KeysetPagination walks a queryset by its sort key instead of OFFSET, so deep
+pages cost the same as the first one and no COUNT(*) is issued.
+OptionalKeysetPagination keeps the default page-number behaviour and switches
+to keyset mode only when the client asks for it with ``?pagination=cursor``
+(or follows a ``cursor`` link).
+CountedPageNumberPagination reuses a row count the view already has (see
+employee_project/conditional.py) instead of running its own COUNT(*).
+"""
+
+import base64
+import json
+from functools import partial
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator as DjangoPaginator
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, ParseError
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import replace_query_param
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on the full ordering tuple plus ``id``.
+
+    The ordering comes from the queryset (so ``?ordering=`` from
+    OrderingFilter keeps working) and falls back to the model's Meta ordering.
+    ``id`` is always appended as a tie-breaker, which keeps pages stable when
+    many rows share the same date. Orderings on a relation (``employee``, but
+    not its column ``employee_id``) are rejected with a 400: page mode sorts them by the related model's ordering
+    (the employee's name), which a cursor on the row's own columns cannot
+    follow.
+    """
+
+    cursor_query_param = "cursor"
+    page_size = api_settings.PAGE_SIZE
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.fields = []
+        self.ordering = []
+        for name in self.get_ordering(queryset):
+            field = self.get_field(queryset.model, name.lstrip("-"))
+            self.fields.append(field)
+            self.ordering.append(f"-{field.attname}" if name.startswith("-") else field.attname)
+
+        if queryset._fields:
+            # .values() rows (FastListMixin) must carry the sort key for the cursor
+            missing = [field.attname for field in self.fields
+                       if field.attname not in queryset._fields and field.name not in queryset._fields]
+            if missing:
+                queryset = queryset.values(*queryset._fields, *missing)
+
+        values, self.reverse = self.decode_cursor(request)
+        self.has_cursor = values is not None
+
+        ordering = self.ordering
+        if self.reverse:
+            ordering = [self.flip(name) for name in ordering]
+        queryset = queryset.order_by(*ordering)
+        if self.has_cursor:
+            queryset = queryset.filter(self.after(ordering, values))
+
+        rows = list(queryset[:self.page_size + 1])
+        has_more = len(rows) > self.page_size
+        rows = rows[:self.page_size]
+        if self.reverse:
+            rows.reverse()
+
+        self.page = rows
+        # Moving forward we know a previous page exists once a cursor was used;
+        # moving backward the same holds for the next page.
+        self.has_next = has_more if not self.reverse else self.has_cursor
+        self.has_previous = self.has_cursor if not self.reverse else has_more
+        return rows
+
+    def get_paginated_response(self, data):
+        return Response({
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+            "results": data,
+        })
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    # -------------------------------
+    # Ordering helpers
+    # -------------------------------
+    def get_ordering(self, queryset):
+        ordering = list(queryset.query.order_by) or list(queryset.model._meta.ordering)
+        ordering = [name.replace("pk", "id") if name.lstrip("-") == "pk" else name for name in ordering]
+        if not any(name.lstrip("-") == "id" for name in ordering):
+            last = ordering[-1] if ordering else "id"
+            ordering.append("-id" if last.startswith("-") else "id")
+        return ordering
+
+    @staticmethod
+    def flip(name):
+        return name[1:] if name.startswith("-") else f"-{name}"
+
+    def get_field(self, model, name):
+        try:
+            field = model._meta.get_field(name)
+        except FieldDoesNotExist:
+            field = None
+        if field is None or not field.concrete or (field.is_relation and name != field.attname):
+            raise ParseError(f"Ordering by '{name}' is not supported with cursor pagination.")
+        return field
+
+    def after(self, ordering, values):
+        """Build the row-value comparison ``(a, b, id) > (x, y, z)`` as OR-ed Q objects."""
+        condition = Q()
+        for i, name in enumerate(ordering):
+            field = self.fields[i]
+            lookup = "lt" if name.startswith("-") else "gt"
+            prefix = {self.fields[j].attname: values[j] for j in range(i)}
+            condition |= Q(**prefix, **{f"{field.attname}__{lookup}": values[i]})
+        return condition
+
+    # -------------------------------
+    # Cursor encoding
+    # -------------------------------
+    def decode_cursor(self, request):
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None, False
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")).decode("utf-8"))
+            raw = payload["v"]
+            if len(raw) != len(self.fields):
+                raise ValueError
+            values = [field.to_python(value) for field, value in zip(self.fields, raw)]
+            return values, bool(payload.get("r"))
+        except (TypeError, ValueError, KeyError, ValidationError, UnicodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+    @staticmethod
+    def cursor_value(row, field):
+        """String form of ``field`` for a model instance or a ``.values()`` dict."""
+        if not isinstance(row, dict):
+            return field.value_to_string(row)
+        value = row[field.attname] if field.attname in row else row[field.name]
+        return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+    def encode_cursor(self, row, reverse):
+        raw = [self.cursor_value(row, field) for field in self.fields]
+        payload = json.dumps({"v": raw, "r": int(reverse)}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], reverse=True)
+
+
+class KnownCountPaginator(DjangoPaginator):
+    """Django paginator that trusts a precomputed ``known_count``."""
+
+    def __init__(self, object_list, per_page, known_count=None, **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        if known_count is not None:
+            self.count = known_count  # fills the cached_property
+
+
+class CountedPageNumberPagination(PageNumberPagination):
+    """
+    PageNumberPagination that takes the total from ``view.list_count`` when
+    the view has already counted the filtered queryset.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        known_count = getattr(view, "list_count", None)
+        self.django_paginator_class = partial(KnownCountPaginator, known_count=known_count)
+        return super().paginate_queryset(queryset, request, view)
+
+
+class OptionalKeysetPagination(CountedPageNumberPagination):
+    """
+    Page-number pagination by default; keyset pagination on request.
+
+    - ``?page=N``            classic pages with a total ``count``
+    - ``?pagination=cursor`` keyset pages, no COUNT(*) and no OFFSET
+    """
+
+    mode_query_param = "pagination"
+    keyset_class = KeysetPagination
+
+    def use_keyset(self, request):
+        params = request.query_params
+        return (params.get(self.mode_query_param) == "cursor"
+                or self.keyset_class.cursor_query_param in params)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = None
+        if self.use_keyset(request):
+            self.keyset = self.keyset_class()
+            return self.keyset.paginate_queryset(queryset, request, view)
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.keyset is not None:
+            return self.keyset.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def get_next_link(self):
+        if self.keyset is not None:
+            return self.keyset.get_next_link()
+        return super().get_next_link()
+
+    def get_previous_link(self):
+        if self.keyset is not None:
+            return self.keyset.get_previous_link()
+        return super().get_previous_link()
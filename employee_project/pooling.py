@@ -0,0 +1,74 @@
+"""
+Database connection reuse statistics, reported to staff on
+/api/v1/analytics/db-stats/ (/health/ stays a plain liveness check).
+
+settings.py picks one of three modes for the default database:
+
+    pool        DB_POOL=True on PostgreSQL: a psycopg_pool ConnectionPool per
+                process; request threads borrow a connection and return it
+    persistent  CONN_MAX_AGE > 0: each thread keeps its own connection
+    per-request CONN_MAX_AGE = 0 and no pool: connect on every request
+
+For the pool, stats() reports the pool's own counters: open connections in
+use and idle, clients waiting right now, and the time clients spent waiting
+for a connection (cumulative since start). In-use near max_size with
+growing wait time means the pool (or the database) is too small for the
+number of worker threads. Other modes only report how many connections this
+process has opened, which keeps growing without reuse.
+
+Counters are per process, so behind gunicorn each db-stats call describes the
+worker that answered it. Reading them never touches the database.
+"""
+
+import threading
+
+from django.db import connections
+from django.db.backends.signals import connection_created
+
+_opened = 0
+_lock = threading.Lock()
+
+
+def _count_opened(sender, connection, **kwargs):
+    global _opened
+    with _lock:
+        _opened += 1
+
+
+connection_created.connect(_count_opened)
+
+
+def stats(alias="default"):
+    """Connection statistics for ``alias``."""
+    connection = connections[alias]
+    settings_dict = connection.settings_dict
+    pool = getattr(connection, "pool", None)  # only the PostgreSQL backend has one
+    if pool is None:
+        max_age = settings_dict.get("CONN_MAX_AGE") or 0
+        return {
+            "mode": "persistent" if max_age else "per-request",
+            "conn_max_age": max_age,
+            "health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+            "connections_opened": _opened,
+        }
+
+    raw = pool.get_stats()
+    size, idle = raw.get("pool_size", 0), raw.get("pool_available", 0)
+    requests, wait_ms = raw.get("requests_num", 0), raw.get("requests_wait_ms", 0)
+    return {
+        "mode": "pool",
+        "min_size": raw.get("pool_min", pool.min_size),
+        "max_size": raw.get("pool_max", pool.max_size),
+        "size": size,
+        "in_use": size - idle,
+        "idle": idle,
+        "waiting": raw.get("requests_waiting", 0),
+        "requests": requests,
+        "requests_queued": raw.get("requests_queued", 0),
+        "wait_ms_total": wait_ms,
+        "wait_ms_avg": round(wait_ms / requests, 2) if requests else 0.0,
+        "timeouts": raw.get("requests_errors", 0),
+        "health_checks": settings_dict.get("CONN_HEALTH_CHECKS", False),
+        "connections_opened": raw.get("connections_num", 0),
+        "connections_lost": raw.get("connections_lost", 0),
+    }
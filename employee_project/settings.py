@@ -59,11 +59,13 @@ INSTALLED_APPS = [
     "employees",
     "attendance",
     "analytics",
+    "jobs",
 ]
 
 MIDDLEWARE = [
     "django.middleware.security.SecurityMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
+    "employee_project.instrumentation.ServerTimingMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
     "django.middleware.csrf.CsrfViewMiddleware",
@@ -103,13 +105,47 @@ DATABASES = {
     "default": env.db("DATABASE_URL", default=f"sqlite:///{BASE_DIR / 'db.sqlite3'}")
 }
 
+# Connection reuse (staff stats on /api/v1/analytics/db-stats/, see employee_project/pooling.py).
+# Persistent connections: each worker thread keeps its connection for
+# CONN_MAX_AGE seconds (0 = reconnect per request), checked before reuse.
+DATABASES["default"]["CONN_MAX_AGE"] = env.int("CONN_MAX_AGE", default=60)
+DATABASES["default"]["CONN_HEALTH_CHECKS"] = env.bool("CONN_HEALTH_CHECKS", default=True)
+
+# PostgreSQL connection pool (needs psycopg 3 with psycopg_pool). Threads
+# borrow a connection per request instead of each holding one, so the
+# server's connection count follows DB_POOL_MAX_SIZE, not workers x threads.
+# Checkouts are health-checked when CONN_HEALTH_CHECKS is on.
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql" and env.bool("DB_POOL", default=False):
+    DATABASES["default"]["CONN_MAX_AGE"] = 0  # the pool replaces persistent connections
+    DATABASES["default"].setdefault("OPTIONS", {})["pool"] = {
+        "min_size": env.int("DB_POOL_MIN_SIZE", default=2),
+        "max_size": env.int("DB_POOL_MAX_SIZE", default=10),
+        "timeout": env.float("DB_POOL_TIMEOUT", default=10.0),  # seconds to wait for a free connection
+        "max_idle": env.float("DB_POOL_MAX_IDLE", default=600.0),
+    }
+
+# PostgreSQL-only lookups (trigram search for the employee directory)
+if DATABASES["default"]["ENGINE"] == "django.db.backends.postgresql":
+    INSTALLED_APPS.append("django.contrib.postgres")
+
+# ---------------------------------------------------------------------
+# CACHE
+# ---------------------------------------------------------------------
+# Local memory by default. Set CACHE_URL for a shared/persistent cache, e.g.
+# filecache:///var/tmp/employee_cache or rediscache://localhost:6379/1
+# The analytics cache is only used with a shared backend (see analytics/cache.py).
+CACHES = {
+    "default": env.cache("CACHE_URL", default="locmemcache://")
+}
+ANALYTICS_CACHE_TIMEOUT = env.int("ANALYTICS_CACHE_TIMEOUT", default=300)  # seconds
+
 # ---------------------------------------------------------------------
 # REST FRAMEWORK / SIMPLEJWT
 # ---------------------------------------------------------------------
 REST_FRAMEWORK = {
-    # Use ONLY JWT authentication for APIs
+    # Use ONLY JWT authentication for APIs (user row cached, see employees/authentication.py)
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "employees.authentication.CachedJWTAuthentication",
     ),
 
     # Require authentication globally for all endpoints
@@ -125,7 +161,7 @@ REST_FRAMEWORK = {
     ),
 
     # Pagination setup
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "employee_project.pagination.CountedPageNumberPagination",
     "PAGE_SIZE": 20,
 }
 
@@ -140,8 +176,26 @@ SIMPLE_JWT = {
     "AUTH_HEADER_TYPES": ("Bearer",),
     "USER_ID_FIELD": "id",
     "USER_ID_CLAIM": "user_id",
+    # Tokens carry a password fingerprint; changing the password revokes them
+    "CHECK_REVOKE_TOKEN": True,
+    # Access tokens carry the user's group names as a "roles" claim, read
+    # afresh on login and on every refresh (never copied from the refresh token)
+    "TOKEN_OBTAIN_SERIALIZER": "employees.serializers.RoleTokenObtainPairSerializer",
+    "TOKEN_REFRESH_SERIALIZER": "employees.serializers.RoleTokenRefreshSerializer",
 }
 
+# Let RBACPermission read roles from the token claim instead of the DB.
+# Group changes then take effect with the client's next /token/refresh/, and
+# at the latest once the old access token expires (ACCESS_TOKEN_LIFETIME).
+RBAC_TRUST_TOKEN_ROLES = env.bool("RBAC_TRUST_TOKEN_ROLES", default=False)
+
+# Seconds a verified user's snapshot (active flag, password fingerprint) is
+# reused by CachedJWTAuthentication before the users table is read again.
+JWT_USER_CACHE_TTL = env.int("JWT_USER_CACHE_TTL", default=30)
+
+# Most sub-requests accepted by /api/v1/batch/ (see employee_project/batch.py)
+BATCH_MAX_REQUESTS = env.int("BATCH_MAX_REQUESTS", default=20)
+
 # ---------------------------------------------------------------------
 # INTERNATIONALIZATION
 # ---------------------------------------------------------------------
@@ -187,8 +241,23 @@ LOGGING = {
     "disable_existing_loggers": False,
     "handlers": {"console": {"class": "logging.StreamHandler"}},
     "root": {"handlers": ["console"], "level": "INFO"},
+    "loggers": {
+        # one JSON line per request at DEBUG, slow ones at WARNING (see employee_project/instrumentation.py);
+        # REQUEST_LOG_LEVEL=DEBUG logs every request
+        "employee_project.requests": {"level": env("REQUEST_LOG_LEVEL", default="INFO")},
+        # one JSON line per process start (see employee_project/startup.py)
+        "employee_project.startup": {"level": "INFO"},
+    },
 }
 
+# Requests at or above this many ms are logged at WARNING with their top SQL
+SLOW_REQUEST_MS = env.int("SLOW_REQUEST_MS", default=500)
+SLOW_REQUEST_TOP_SQL = env.int("SLOW_REQUEST_TOP_SQL", default=5)
+
+# Prime URLconf, serializers and DB connections when a worker loads the app,
+# before it accepts traffic (see employee_project/startup.py)
+WARMUP = env.bool("WARMUP", default=False)
+
 
 CSRF_TRUSTED_ORIGINS = ["https://*.onrender.com"]
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
\ No newline at end of file
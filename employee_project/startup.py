@@ -0,0 +1,128 @@
+"""
+Process startup: timed application loading and an optional warmup.
+
+wsgi.py and asgi.py build their application through load(), which logs one
+JSON line on the ``employee_project.startup`` logger with the time spent in
+each phase (milliseconds):
+
+    setup       settings, app registry and models (django.setup())
+    handler     the middleware chain of the WSGI/ASGI handler
+    urls        URLconf import and resolver population   (warmup only)
+    serializers serializer fields and ValuesPlans        (warmup only)
+    db          first database round trip                 (warmup only)
+    total
+
+Without WARMUP those costs are paid by the first request each worker
+serves. With WARMUP=True they are paid before the worker accepts traffic:
+
+- the URLconf is imported (and with it every view module) and the
+  resolver's reverse lookup tables are built
+- every DRF view's serializer builds its fields once (filling the model
+  _meta caches), and list views compile the ValuesPlan their list()
+  action will use (employee_project/fast_serializers.py), with the
+  viewset's default ``expand`` where sparse fieldsets apply
+- each database answers ``SELECT 1``, which imports the backend, resolves
+  and connects to the host and, with DB_POOL, opens the connection pool;
+  the warmup connection itself is closed again so no socket is shared with
+  forked processes
+
+For the import-time breakdown per module, see ``manage.py startup_profile``.
+"""
+
+import json
+import logging
+import time
+from contextlib import contextmanager
+
+import django
+from django.conf import settings
+from django.db import connections
+
+logger = logging.getLogger("employee_project.startup")
+
+
+@contextmanager
+def phase(timings, name):
+    """Record the duration of the block, in ms, as ``timings[name]``."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timings[name] = round((time.perf_counter() - start) * 1000, 1)
+
+
+def load(kind="wsgi"):
+    """Set up Django and return the ``"wsgi"`` or ``"asgi"`` application, warmed up if WARMUP is set."""
+    timings = {}
+    start = time.perf_counter()
+    with phase(timings, "setup"):
+        django.setup(set_prefix=False)
+    with phase(timings, "handler"):
+        if kind == "asgi":
+            from django.core.handlers.asgi import ASGIHandler
+            application = ASGIHandler()
+        else:
+            from django.core.handlers.wsgi import WSGIHandler
+            application = WSGIHandler()
+    if settings.WARMUP:
+        timings.update(warmup())
+    timings["total"] = round((time.perf_counter() - start) * 1000, 1)
+    logger.info(json.dumps({"event": "startup", "kind": kind, "warmup": settings.WARMUP, "ms": timings}))
+    return application
+
+
+def warmup():
+    """Prime URL resolvers, serializers and database connections; return the time per phase."""
+    timings = {}
+    with phase(timings, "urls"):
+        resolver = _populate_resolver()
+    with phase(timings, "serializers"):
+        for view_class in _api_views(resolver.url_patterns):
+            _prime_serializer(view_class)
+    with phase(timings, "db"):
+        for conn in connections.all():
+            with conn.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            conn.close()
+    return timings
+
+
+# -------------------------------
+# Helpers
+# -------------------------------
+def _populate_resolver():
+    from django.urls import get_resolver
+
+    resolver = get_resolver()
+    resolver.reverse_dict  # imports the URLconf and fills the reverse/namespace tables
+    return resolver
+
+
+def _api_views(patterns):
+    """Yield each DRF view class routed by ``patterns`` once, recursing into includes."""
+    seen = set()
+    stack = list(patterns)
+    while stack:
+        pattern = stack.pop()
+        if hasattr(pattern, "url_patterns"):
+            stack.extend(pattern.url_patterns)
+            continue
+        view_class = getattr(pattern.callback, "cls", None)
+        if view_class is not None and view_class not in seen:
+            seen.add(view_class)
+            yield view_class
+
+
+def _prime_serializer(view_class):
+    from .fast_serializers import FastListMixin, get_plan
+    from .sparse import SparseFieldsetMixin
+
+    serializer_class = getattr(view_class, "serializer_class", None)
+    if serializer_class is None:
+        return
+    serializer_class().fields
+    if issubclass(view_class, FastListMixin) and view_class.fast_list:
+        if issubclass(view_class, SparseFieldsetMixin):
+            get_plan(serializer_class, fields=None, expand=frozenset(view_class.default_expand))
+        else:
+            get_plan(serializer_class)
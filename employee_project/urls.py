@@ -7,37 +7,58 @@ Includes:
 - JWT authentication (login & refresh)
 - Swagger documentation
 - Analytics app (charts/visuals)
+- Background reports (queued jobs, see jobs/)
+- Batch endpoint (several API calls in one request)
 - Health check endpoint
 - Root redirect → /swagger/ for easy navigation
 """
 
+from functools import lru_cache
+
 from django.contrib import admin
 from django.urls import path, include
 from django.shortcuts import redirect
 from rest_framework_simplejwt.views import TokenObtainPairView, TokenRefreshView
-from drf_yasg.views import get_schema_view
-from drf_yasg import openapi
 from rest_framework import permissions
 from django.http import JsonResponse
 from django.conf import settings
 from django.conf.urls.static import static
 
+from .batch import BatchView
+
 
 # --------------------------------------------------------------------
 # SWAGGER SCHEMA VIEW CONFIGURATION
 # --------------------------------------------------------------------
-schema_view = get_schema_view(
-    openapi.Info(
-        title="Employee Management API",            # Project title
-        default_version="v1",
-        description=(
-            "Comprehensive API documentation for managing Employees, "
-            "Departments, Attendance, Performance, and Analytics."
+# drf_yasg (and its inspectors, YAML and coreapi imports) is only loaded when
+# the docs are first requested, not while each worker starts up.
+@lru_cache(maxsize=None)
+def schema_view():
+    from drf_yasg import openapi
+    from drf_yasg.views import get_schema_view
+
+    return get_schema_view(
+        openapi.Info(
+            title="Employee Management API",            # Project title
+            default_version="v1",
+            description=(
+                "Comprehensive API documentation for managing Employees, "
+                "Departments, Attendance, Performance, and Analytics."
+            ),
         ),
-    ),
-    public=True,
-    permission_classes=(permissions.AllowAny,),
-)
+        public=True,
+        permission_classes=(permissions.AllowAny,),
+    )
+
+
+@lru_cache(maxsize=None)
+def _swagger_ui():
+    return schema_view().with_ui("swagger", cache_timeout=0)
+
+
+def swagger_ui(request, *args, **kwargs):
+    """Swagger UI, built on the first visit."""
+    return _swagger_ui()(request, *args, **kwargs)
 
 
 # --------------------------------------------------------------------
@@ -67,13 +88,15 @@ urlpatterns = [
     path("api/v1/", include("employees.urls")),       # Employees & Performance
     path("api/v1/", include("attendance.urls")),      # Attendance records
     path("api/v1/", include("departments.urls")),     # Departments 
+    path("api/v1/batch/", BatchView.as_view(), name="api-batch"),  # Several calls, one round trip
+    path("api/v1/", include("jobs.urls")),            # Background reports & jobs
 
     # --- JWT Authentication (Token generation and refresh) ---
     path("api/auth/token/", TokenObtainPairView.as_view(), name="token_obtain_pair"),
     path("api/auth/token/refresh/", TokenRefreshView.as_view(), name="token_refresh"),
 
     # --- Swagger API Documentation ---
-    path("swagger/", schema_view.with_ui("swagger", cache_timeout=0), name="schema-swagger-ui"),
+    path("swagger/", swagger_ui, name="schema-swagger-ui"),
 
     # --- Analytics routes (bonus feature) ---
      path("api/v1/analytics/", include("analytics.urls")),
@@ -5,24 +5,17 @@ This file exposes the WSGI callable as a module-level variable named ``applicati
 
 WSGI (Web Server Gateway Interface) is the entry point for web servers
 like Gunicorn or uWSGI to serve your Django project in production.
+
+Importing this module has no side effects beyond loading Django: the Render
+superuser is created by ``manage.py create_render_superuser`` in the start
+command, and WARMUP=True primes the worker before it serves traffic (see
+employee_project/startup.py).
 """
 
 import os
-from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'employee_project.settings')
 
-application = get_wsgi_application()
+from employee_project import startup  # noqa: E402
 
-# --- Auto-create superuser for Render deployment (silent) ---
-try:
-    from django.contrib.auth import get_user_model
-    User = get_user_model()
-    if not User.objects.filter(username="glynac").exists():
-        User.objects.create_superuser(
-            username="glynac",
-            email="glynac@example.com",
-            password="glynac"
-        )
-except Exception:
-    pass
+application = startup.load("wsgi")
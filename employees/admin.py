@@ -1,5 +1,5 @@
 from django.contrib import admin
-from .models import Employee, Performance
+from .models import Employee, Performance, PerformanceSummary
 
 @admin.register(Employee)
 class EmployeeAdmin(admin.ModelAdmin):
@@ -12,3 +12,10 @@ class PerformanceAdmin(admin.ModelAdmin):
     list_display = ("id", "employee", "rating", "review_date")
     list_filter = ("rating", "review_date", "employee__department")
     search_fields = ("employee__name", "employee__email")
+
+
+@admin.register(PerformanceSummary)
+class PerformanceSummaryAdmin(admin.ModelAdmin):
+    list_display = ("employee", "latest_rating", "rolling_avg", "trend", "review_count", "latest_review_date")
+    list_filter = ("employee__department",)
+    search_fields = ("employee__name", "employee__email")
@@ -0,0 +1,146 @@
+"""
+JWT authentication without a per-request user query.
+
+CachedJWTAuthentication verifies the token exactly like SimpleJWT's
+JWTAuthentication, but builds a lightweight user from a small snapshot of the
+user row (id, username, flags, password fingerprint) that is cached:
+
+- in-process for JWT_USER_CACHE_TTL seconds (no I/O at all on a hit), and
+- in the Django cache for the same TTL (shared across workers when CACHE_URL
+  points at a shared backend).
+
+Saving or deleting a User evicts both tiers in the writing process, so a
+deactivation or password change is enforced there immediately and in every
+other worker within the TTL.
+"""
+
+import threading
+import time
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.cache import cache
+from django.utils.translation import gettext_lazy as _
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.models import TokenUser
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+_local = {}
+_local_lock = threading.Lock()
+
+
+def _ttl():
+    return getattr(settings, "JWT_USER_CACHE_TTL", 30)
+
+
+def _cache_key(user_id):
+    return f"auth:user:{user_id}"
+
+
+def load_user_state(user_id):
+    """Return the cached snapshot for ``user_id`` (None if the user does not exist)."""
+    user_id = str(user_id)  # token claims carry ids as strings
+    now = time.monotonic()
+    entry = _local.get(user_id)
+    if entry is not None and entry[0] > now:
+        return entry[1]
+
+    state = cache.get(_cache_key(user_id))
+    if state is None:
+        row = (get_user_model().objects
+               .filter(**{api_settings.USER_ID_FIELD: user_id})
+               .values("pk", "username", "is_active", "is_staff", "is_superuser", "password")
+               .first())
+        if row is None:
+            return None
+        state = {
+            "pk": row["pk"],
+            "username": row["username"],
+            "is_active": row["is_active"],
+            "is_staff": row["is_staff"],
+            "is_superuser": row["is_superuser"],
+            "password_hash": get_md5_hash_password(row["password"]),
+        }
+        cache.set(_cache_key(user_id), state, _ttl())
+
+    with _local_lock:
+        _local[user_id] = (now + _ttl(), state)
+    return state
+
+
+def forget_user(user_id):
+    """Evict a user's snapshot from both cache tiers."""
+    user_id = str(user_id)
+    with _local_lock:
+        _local.pop(user_id, None)
+    cache.delete(_cache_key(user_id))
+
+
+class CachedUser(TokenUser):
+    """
+    Token-backed user with flags taken from the cached snapshot.
+
+    Unlike TokenUser, ``groups`` queries the real memberships so RBAC role
+    checks (employees.permissions.get_roles) keep working.
+    """
+
+    def __init__(self, token, state):
+        super().__init__(token)
+        self.state = state
+        self.is_active = state["is_active"]
+
+    def __str__(self):
+        return self.username
+
+    @property
+    def id(self):
+        return self.state["pk"]
+
+    @property
+    def pk(self):
+        return self.state["pk"]
+
+    @property
+    def username(self):
+        return self.state["username"]
+
+    @property
+    def is_staff(self):
+        return self.state["is_staff"]
+
+    @property
+    def is_superuser(self):
+        return self.state["is_superuser"]
+
+    @property
+    def groups(self):
+        return Group.objects.filter(user__pk=self.pk)
+
+    def get_username(self):
+        return self.username
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """Drop-in replacement for JWTAuthentication that skips the User query."""
+
+    def get_user(self, validated_token):
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        state = load_user_state(user_id)
+        if state is None:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found")
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not state["is_active"]:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != state["password_hash"]:
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return CachedUser(validated_token, state)
@@ -1,5 +1,5 @@
 import django_filters as df
-from .models import Employee, Performance
+from .models import Employee, Performance, PerformanceSummary
 
 class EmployeeFilter(df.FilterSet):
     min_doj = df.DateFilter(field_name="date_of_joining", lookup_expr="gte")
@@ -16,3 +16,11 @@ class PerformanceFilter(df.FilterSet):
     class Meta:
         model = Performance
         fields = ["employee","min_date","max_date","min_rating","max_rating"]
+
+class PerformanceSummaryFilter(df.FilterSet):
+    department = df.NumberFilter(field_name="employee__department")
+    min_avg = df.NumberFilter(field_name="rolling_avg", lookup_expr="gte")
+    max_avg = df.NumberFilter(field_name="rolling_avg", lookup_expr="lte")
+    class Meta:
+        model = PerformanceSummary
+        fields = ["employee", "department", "latest_rating", "min_avg", "max_avg"]
@@ -0,0 +1,78 @@
+from datetime import date
+
+from django.core.exceptions import ValidationError
+from django.core.validators import validate_email
+
+from departments.models import Department
+from employee_project.imports import CsvImportCommand, RowError, copy_rows
+from employees.models import Employee
+from employees.signals import employees_bulk_loaded
+
+COLUMNS = ("name", "email", "phone_number", "address", "date_of_joining", "department_id")
+
+
+class Command(CsvImportCommand):
+    help = (
+        "Import employees from CSV with columns name, email, date_of_joining, "
+        "department (name) and optional phone_number, address."
+    )
+    required_columns = ("name", "email", "date_of_joining", "department")
+
+    def add_arguments(self, parser):
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--create-departments",
+            action="store_true",
+            help="Create departments that do not exist yet instead of rejecting the row",
+        )
+
+    def prepare(self, opts):
+        # One query each; emails are compared case-insensitively
+        self.departments = {name.lower(): pk for name, pk in Department.objects.values_list("name", "id")}
+        self.emails = {email.lower() for email in Employee.objects.values_list("email", flat=True)}
+        self.create_departments = opts["create_departments"]
+
+    def validate(self, row):
+        name = (row.get("name") or "").strip()
+        email = (row.get("email") or "").strip()
+        department = (row.get("department") or "").strip()
+        phone = (row.get("phone_number") or "").strip()
+
+        if not name or len(name) > 120:
+            raise RowError("name is required (max 120 characters)")
+        try:
+            validate_email(email)
+        except ValidationError:
+            raise RowError(f"invalid email {email!r}")
+        if email.lower() in self.emails:
+            raise RowError(f"email {email} already exists")
+        if len(phone) > 30:
+            raise RowError("phone_number is longer than 30 characters")
+        try:
+            joined = date.fromisoformat((row.get("date_of_joining") or "").strip())
+        except ValueError:
+            raise RowError("date_of_joining must be YYYY-MM-DD")
+        if not department:
+            raise RowError("department is required")
+        if department.lower() not in self.departments and not self.create_departments:
+            raise RowError(f"unknown department {department!r}")
+
+        self.emails.add(email.lower())
+        return name, email, phone, (row.get("address") or "").strip(), joined, department
+
+    def load(self, rows, opts):
+        if not rows:
+            return
+        new = {dept for *_, dept in rows if dept.lower() not in self.departments}
+        for dept in sorted(new):
+            self.departments[dept.lower()] = Department.objects.get_or_create(name=dept)[0].pk
+
+        records = [(*fields, self.departments[dept.lower()]) for *fields, dept in rows]
+        if opts["use_copy"]:
+            copy_rows(Employee._meta.db_table, COLUMNS, records, opts["batch_size"])
+        else:
+            Employee.objects.bulk_create(
+                [Employee(**dict(zip(COLUMNS, record))) for record in records],
+                batch_size=opts["batch_size"],
+            )
+        employees_bulk_loaded.send(sender=Employee, department_ids=sorted({record[-1] for record in records}))
@@ -0,0 +1,11 @@
+from django.core.management.base import BaseCommand
+
+from employees import performance
+
+
+class Command(BaseCommand):
+    help = "Rebuild the per-employee performance summary table from all reviews."
+
+    def handle(self, *args, **options):
+        count = performance.refresh()
+        self.stdout.write(self.style.SUCCESS(f"✅ Performance summary rebuilt for {count} employees."))
@@ -1,16 +1,42 @@
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 from faker import Faker
 import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import timedelta, date
-from django.db import transaction
+from django.db import connection, connections, transaction
 
 from departments.models import Department
 from employees.models import Employee, Performance
 from attendance.models import Attendance
+from attendance.signals import attendance_bulk_loaded
+from employee_project.imports import batched, copy_rows, copy_supported
+from employees.signals import employees_bulk_loaded, performance_bulk_loaded
 
 fake = Faker()
 
+DEPT_NAMES = [
+    "Engineering", "Research", "HR",
+    "Finance", "Marketing", "Sales", "Support"
+]
+
+STATUS_WEIGHTS = (
+    [Attendance.STATUS_PRESENT, Attendance.STATUS_ABSENT, Attendance.STATUS_LATE],
+    [0.85, 0.07, 0.08],
+)
+
+# Presets for --scale: (employees, days). Attendance rows ≈ employees × days × 5/7.
+SCALE_PRESETS = {
+    "small": (50, 90),           # ~3k attendance rows
+    "medium": (1_000, 180),      # ~130k attendance rows
+    "large": (5_000, 365),       # ~1.3M attendance rows
+    "xlarge": (20_000, 365),     # ~5.2M attendance rows
+}
+
+# Employees handed to one worker task. Fixed so a given --seed produces the
+# same dataset no matter how many --workers are used.
+EMPLOYEES_PER_CHUNK = 200
+
 
 def daterange(start: date, end: date):
     """Yield all days between start and end inclusive."""
@@ -18,6 +44,73 @@ def daterange(start: date, end: date):
         yield start + timedelta(n)
 
 
+def iter_employees(rng, faker, n_emp, dept_ids, today):
+    """Stream unsaved Employee instances (emails are unique by construction)."""
+    for i in range(n_emp):
+        yield Employee(
+            name=faker.name(),
+            email=f"{faker.user_name()}.{i}@{faker.free_email_domain()}",
+            phone_number=faker.msisdn()[:10],
+            address=faker.address(),
+            date_of_joining=today - timedelta(days=rng.randint(0, 365)),
+            department_id=rng.choice(dept_ids),
+        )
+
+
+def iter_attendance_rows(rng, employee_ids, start_date, end_date):
+    """Stream (employee_id, date, status) tuples for every weekday in range."""
+    weekdays = [dt for dt in daterange(start_date, end_date) if dt.weekday() < 5]
+    statuses, weights = STATUS_WEIGHTS
+    for emp_id in employee_ids:
+        picks = rng.choices(statuses, weights=weights, k=len(weekdays))
+        for dt, status in zip(weekdays, picks):
+            yield emp_id, dt, status
+
+
+def iter_performance_rows(rng, employee_ids, start_date, days):
+    """Stream (employee_id, rating, review_date) tuples, 2–5 per employee."""
+    for emp_id in employee_ids:
+        for _ in range(rng.randint(2, 5)):
+            yield emp_id, rng.randint(1, 5), start_date + timedelta(days=rng.randint(0, days))
+
+
+def insert_rows(model, fields, rows, batch_size):
+    """Load ``rows`` with bulk_create, building only one batch of instances at a time."""
+    total = 0
+    for batch in batched(rows, batch_size):
+        model.objects.bulk_create(
+            [model(**dict(zip(fields, row))) for row in batch],
+            batch_size=batch_size,
+        )
+        total += len(batch)
+    return total
+
+
+def _init_worker():
+    """Give each worker process its own database connections."""
+    import django
+    from django.apps import apps
+    if not apps.ready:
+        django.setup()
+    connections.close_all()
+
+
+def seed_chunk(chunk_index, employee_ids, start_date, end_date, days, seed, batch_size, use_copy):
+    """Insert attendance and performance rows for one chunk of employees."""
+    rng = random.Random(None if seed is None else f"{seed}:{chunk_index}")
+    att_rows = iter_attendance_rows(rng, employee_ids, start_date, end_date)
+    perf_rows = iter_performance_rows(rng, employee_ids, start_date, days)
+
+    with transaction.atomic():
+        if use_copy:
+            att = copy_rows(Attendance._meta.db_table, ("employee_id", "date", "status"), att_rows, batch_size)
+            perf = copy_rows(Performance._meta.db_table, ("employee_id", "rating", "review_date"), perf_rows, batch_size)
+        else:
+            att = insert_rows(Attendance, ("employee_id", "date", "status"), att_rows, batch_size)
+            perf = insert_rows(Performance, ("employee_id", "rating", "review_date"), perf_rows, batch_size)
+    return att, perf
+
+
 class Command(BaseCommand):
     help = "Seed departments, employees, attendance, and performance data."
 
@@ -34,28 +127,74 @@ class Command(BaseCommand):
             default=90,
             help="Days of attendance data (default=90)",
         )
+        parser.add_argument(
+            "--seed",
+            type=int,
+            default=None,
+            help="Random seed for a reproducible dataset",
+        )
+        parser.add_argument(
+            "--scale",
+            choices=sorted(SCALE_PRESETS),
+            default=None,
+            help="Dataset preset; overrides --employees/--days and implies --bulk "
+                 "(large ≈ 1.3M attendance rows)",
+        )
+        parser.add_argument(
+            "--bulk",
+            action="store_true",
+            help="High-volume mode: batched bulk inserts (COPY on PostgreSQL)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=5000,
+            help="Rows per bulk insert in --bulk mode (default=5000)",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Worker processes for attendance/performance in --bulk mode (default=1)",
+        )
+        parser.add_argument(
+            "--no-copy",
+            action="store_true",
+            help="Use bulk_create even when PostgreSQL COPY is available",
+        )
 
-    @transaction.atomic
     def handle(self, *args, **opts):
-        n_emp = opts["employees"]
-        days = opts["days"]
+        if opts["scale"]:
+            opts["employees"], opts["days"] = SCALE_PRESETS[opts["scale"]]
+            opts["bulk"] = True
 
-        # ✅ Always define this first
-        dept_names = [
-            "Engineering", "Research", "HR",
-            "Finance", "Marketing", "Sales", "Support"
-        ]
+        if opts["seed"] is not None:
+            random.seed(opts["seed"])
+            Faker.seed(opts["seed"])
 
         # ✅ Stop here if already seeded
         if Employee.objects.exists():
             self.stdout.write(self.style.WARNING("⚠️  Employees already exist — skipping seeding."))
             return
 
+        if opts["bulk"]:
+            self.handle_bulk(opts)
+        else:
+            self.handle_simple(opts)
+
+    # -------------------------------
+    # Default mode: small demo datasets
+    # -------------------------------
+    @transaction.atomic
+    def handle_simple(self, opts):
+        n_emp = opts["employees"]
+        days = opts["days"]
+
         self.stdout.write(self.style.SUCCESS("🚀 Seeding database..."))
 
         # Step 1: Departments
         depts = []
-        for name in dept_names:
+        for name in DEPT_NAMES:
             dept, _ = Department.objects.get_or_create(name=name)
             depts.append(dept)
         self.stdout.write(self.style.SUCCESS(f"✅ Departments ready: {len(depts)}"))
@@ -85,15 +224,7 @@ class Command(BaseCommand):
             for dt in daterange(start_date, end_date):
                 if dt.weekday() >= 5:
                     continue
-                status = random.choices(
-                    [
-                        Attendance.STATUS_PRESENT,
-                        Attendance.STATUS_ABSENT,
-                        Attendance.STATUS_LATE,
-                    ],
-                    weights=[0.85, 0.07, 0.08],
-                    k=1,
-                )[0]
+                status = random.choices(*STATUS_WEIGHTS, k=1)[0]
                 Attendance.objects.create(employee=emp, date=dt, status=status)
                 att_count += 1
 
@@ -111,3 +242,77 @@ class Command(BaseCommand):
                 f"{perf_count} performance reviews."
             )
         )
+
+    # -------------------------------
+    # --bulk mode: load-test datasets
+    # -------------------------------
+    def handle_bulk(self, opts):
+        n_emp = opts["employees"]
+        days = opts["days"]
+        seed = opts["seed"]
+        batch_size = opts["batch_size"]
+        workers = max(1, opts["workers"])
+        use_copy = copy_supported() and not opts["no_copy"]
+
+        if batch_size < 1:
+            raise CommandError("--batch-size must be at least 1.")
+        if workers > 1 and connection.vendor == "sqlite":
+            self.stdout.write(self.style.WARNING("⚠️  SQLite allows a single writer — using 1 worker."))
+            workers = 1
+
+        self.stdout.write(self.style.SUCCESS(
+            f"🚀 Bulk seeding {n_emp} employees × {days} days "
+            f"({'COPY' if use_copy else 'bulk_create'}, {workers} worker(s))..."
+        ))
+
+        today = timezone.now().date()
+        rng = random.Random(seed)
+        faker = Faker()
+        if seed is not None:
+            faker.seed_instance(seed)
+
+        # Step 1: Departments
+        dept_ids = [Department.objects.get_or_create(name=name)[0].pk for name in DEPT_NAMES]
+        self.stdout.write(self.style.SUCCESS(f"✅ Departments ready: {len(dept_ids)}"))
+
+        # Step 2: Employees (streamed, never all in memory)
+        with transaction.atomic():
+            for batch in batched(iter_employees(rng, faker, n_emp, dept_ids, today), batch_size):
+                Employee.objects.bulk_create(batch, batch_size=batch_size)
+            employees_bulk_loaded.send(sender=Employee, department_ids=dept_ids)
+        self.stdout.write(self.style.SUCCESS(f"👥 Created {n_emp} employees."))
+
+        # Step 3: Attendance + Performance, one task per chunk of employees
+        start_date = today - timedelta(days=days)
+        emp_ids = Employee.objects.order_by("pk").values_list("pk", flat=True).iterator(chunk_size=batch_size)
+        tasks = (
+            (i, chunk, start_date, today, days, seed, batch_size, use_copy)
+            for i, chunk in enumerate(batched(emp_ids, EMPLOYEES_PER_CHUNK))
+        )
+
+        att_count = perf_count = 0
+        if workers == 1:
+            results = (seed_chunk(*task) for task in tasks)
+            for att, perf in results:
+                att_count += att
+                perf_count += perf
+        else:
+            tasks = list(tasks)
+            connections.close_all()   # never share a socket with forked workers
+            with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker) as pool:
+                futures = [pool.submit(seed_chunk, *task) for task in tasks]
+                for future in futures:
+                    att, perf = future.result()
+                    att_count += att
+                    perf_count += perf
+
+        # Bulk inserts skip post_save; let derived tables catch up in one pass.
+        attendance_bulk_loaded.send(sender=Attendance, dates=list(daterange(start_date, today)), employee_ids=None)
+        performance_bulk_loaded.send(sender=Performance, employee_ids=None)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"🎉 Done! {n_emp} employees, {att_count} attendances, "
+                f"{perf_count} performance reviews."
+            )
+        )
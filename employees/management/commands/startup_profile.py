@@ -0,0 +1,65 @@
+import os
+import subprocess
+import sys
+import time
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Measure a cold worker start in a fresh interpreter: python -X importtime of the "
+        "WSGI/ASGI application and URLconf, broken down per module and per package."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--asgi", action="store_true", help="Profile employee_project.asgi instead of .wsgi")
+        parser.add_argument("--top", type=int, default=15, help="Rows per table (default=15)")
+        parser.add_argument("--warmup", action="store_true", help="Start with WARMUP=True (see employee_project/startup.py)")
+
+    def handle(self, *args, **opts):
+        module = "employee_project.asgi" if opts["asgi"] else "employee_project.wsgi"
+        env = dict(os.environ, WARMUP=str(opts["warmup"]))
+        env.setdefault("DJANGO_SETTINGS_MODULE", "employee_project.settings")
+
+        started = time.perf_counter()
+        proc = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", f"import {module}; import employee_project.urls"],
+            env=env, capture_output=True, text=True,
+        )
+        wall = (time.perf_counter() - started) * 1000
+        if proc.returncode:
+            raise CommandError(f"Importing {module} failed:\n{proc.stderr[-2000:]}")
+        modules = parse_importtime(proc.stderr)
+
+        self.stdout.write(f"🚀 {module} + URLconf: {wall:.0f} ms wall clock, "
+                          f"{sum(s for s, _ in modules.values()) / 1000:.0f} ms importing {len(modules)} modules")
+        self.table("Slowest imports (cumulative, includes what they import)",
+                   sorted(((cum, name) for name, (_, cum) in modules.items()), reverse=True)[:opts["top"]])
+
+        packages = defaultdict(int)
+        for name, (self_us, _) in modules.items():
+            packages[name.split(".")[0]] += self_us
+        self.table("Import time per top-level package (self)",
+                   sorted(((us, name) for name, us in packages.items()), reverse=True)[:opts["top"]])
+
+        for line in proc.stderr.splitlines():
+            if '"event": "startup"' in line:
+                self.stdout.write(f"\n⏱️  Startup phases: {line.strip()}")
+
+    def table(self, title, rows):
+        self.stdout.write(f"\n📊 {title}")
+        for us, name in rows:
+            self.stdout.write(f"   {us / 1000:8.1f} ms  {name}")
+
+
+def parse_importtime(output):
+    """Map module -> (self µs, cumulative µs) from ``-X importtime`` output."""
+    modules = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = (int(self_us), int(cumulative))
+    return modules
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:06
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='performance',
+            index=models.Index(fields=['review_date', 'id'], name='employees_p_review__1a1acf_idx'),
+        ),
+    ]
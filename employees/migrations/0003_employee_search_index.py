@@ -0,0 +1,80 @@
+"""
+Full-text search index for employees (see employees/search.py).
+
+PostgreSQL gets GIN indexes (tsvector + pg_trgm); SQLite gets an FTS5 table
+kept in sync by triggers. Other backends are left untouched.
+"""
+
+from django.db import migrations
+
+FTS_TABLE = "employees_employee_fts"
+COLUMNS = ("name", "email", "phone_number", "address")
+
+
+def _postgres_indexes():
+    from django.contrib.postgres.indexes import GinIndex, OpClass
+    from django.contrib.postgres.search import SearchVector
+
+    return [
+        GinIndex(SearchVector(*COLUMNS, config="simple"), name="employee_search_vector_idx"),
+        GinIndex(OpClass("name", name="gin_trgm_ops"), name="employee_name_trgm_idx"),
+        GinIndex(OpClass("email", name="gin_trgm_ops"), name="employee_email_trgm_idx"),
+    ]
+
+
+def create_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    Employee = apps.get_model("employees", "Employee")
+
+    if vendor == "postgresql":
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for index in _postgres_indexes():
+            schema_editor.add_index(Employee, index)
+
+    elif vendor == "sqlite":
+        with schema_editor.connection.cursor() as cursor:
+            cursor.execute("PRAGMA compile_options")
+            if "ENABLE_FTS5" not in {row[0] for row in cursor.fetchall()}:
+                return  # search falls back to ILIKE
+
+        table = Employee._meta.db_table
+        cols = ", ".join(COLUMNS)
+        new = ", ".join(f"new.{c}" for c in COLUMNS)
+        old = ", ".join(f"old.{c}" for c in COLUMNS)
+        for sql in (
+            f"CREATE VIRTUAL TABLE {FTS_TABLE} USING fts5({cols}, content='{table}', content_rowid='id')",
+            f"CREATE TRIGGER {FTS_TABLE}_ai AFTER INSERT ON {table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new}); END",
+            f"CREATE TRIGGER {FTS_TABLE}_ad AFTER DELETE ON {table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old}); END",
+            f"CREATE TRIGGER {FTS_TABLE}_au AFTER UPDATE ON {table} BEGIN "
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, {cols}) VALUES ('delete', old.id, {old}); "
+            f"INSERT INTO {FTS_TABLE}(rowid, {cols}) VALUES (new.id, {new}); END",
+            f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')",
+        ):
+            schema_editor.execute(sql)
+
+
+def drop_search_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    Employee = apps.get_model("employees", "Employee")
+
+    if vendor == "postgresql":
+        for index in _postgres_indexes():
+            schema_editor.remove_index(Employee, index)
+
+    elif vendor == "sqlite":
+        for suffix in ("ai", "ad", "au"):
+            schema_editor.execute(f"DROP TRIGGER IF EXISTS {FTS_TABLE}_{suffix}")
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0002_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-18 19:35
+
+import django.db.models.deletion
+import django.db.models.functions.datetime
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('employees', '0004_updated_at'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PerformanceSummary',
+            fields=[
+                ('employee', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='performance_summary', serialize=False, to='employees.employee')),
+                ('review_count', models.IntegerField(default=0)),
+                ('latest_rating', models.IntegerField()),
+                ('latest_review_date', models.DateField()),
+                ('rolling_avg', models.FloatField(help_text='Average rating of the last 4 reviews.')),
+                ('trend', models.FloatField(help_text='Change of the rolling average caused by the latest review.', null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True, db_default=django.db.models.functions.datetime.Now(), db_index=True, help_text='Last modification time (drives ETag / Last-Modified).')),
+            ],
+            options={
+                'verbose_name': 'Performance Summary',
+                'verbose_name_plural': 'Performance Summaries',
+                'ordering': ['-rolling_avg', 'employee_id'],
+                'indexes': [models.Index(fields=['rolling_avg', 'employee'], name='employees_p_rolling_c916f2_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,42 @@
+from django.db import migrations
+
+WINDOW = 4
+
+
+def populate(apps, schema_editor):
+    Performance = apps.get_model("employees", "Performance")
+    Summary = apps.get_model("employees", "PerformanceSummary")
+
+    reviews = {}
+    rows = (Performance.objects
+            .order_by("employee_id", "-review_date", "-id")
+            .values_list("employee_id", "rating", "review_date")
+            .iterator(chunk_size=5000))
+    for employee_id, rating, review_date in rows:
+        reviews.setdefault(employee_id, []).append((rating, review_date))
+
+    summaries = []
+    for employee_id, items in reviews.items():
+        ratings = [rating for rating, _ in items[:WINDOW + 1]]
+        rolling = round(sum(ratings[:WINDOW]) / len(ratings[:WINDOW]), 2)
+        previous = round(sum(ratings[1:]) / len(ratings[1:]), 2) if len(ratings) > 1 else None
+        summaries.append(Summary(
+            employee_id=employee_id,
+            review_count=len(items),
+            latest_rating=ratings[0],
+            latest_review_date=items[0][1],
+            rolling_avg=rolling,
+            trend=round(rolling - previous, 2) if previous is not None else None,
+        ))
+    Summary.objects.bulk_create(summaries, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0005_performancesummary"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,36 @@
+"""
+pg_trgm index on phone_number, so the substring match of employees/search.py
+("digits from the middle of a number") stays an index scan on PostgreSQL.
+Other backends are left untouched.
+"""
+
+from django.db import migrations
+
+INDEX_NAME = "employee_phone_trgm_idx"
+
+
+def _index():
+    from django.contrib.postgres.indexes import GinIndex, OpClass
+
+    return GinIndex(OpClass("phone_number", name="gin_trgm_ops"), name=INDEX_NAME)
+
+
+def create_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.add_index(apps.get_model("employees", "Employee"), _index())
+
+
+def drop_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.remove_index(apps.get_model("employees", "Employee"), _index())
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0006_populate_performance_summary"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_index, drop_index),
+    ]
@@ -4,11 +4,14 @@ Models for Employees and Performance Reviews.
 This module defines:
 - Employee: Stores employee details linked to a department.
 - Performance: Tracks employee performance reviews and ratings.
+- PerformanceSummary: Latest rating, rolling average and trend per employee,
+  maintained from Performance by employees/performance.py.
 
 Department model has been moved to the departments app.
 """
 
 from django.db import models
+from django.db.models.functions import Now
 from departments.models import Department
 
 
@@ -46,6 +49,12 @@ class Employee(models.Model):
     on_delete=models.CASCADE,
     related_name="employees"
 )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_default=Now(),
+        db_index=True,
+        help_text="Last modification time (drives ETag / Last-Modified)."
+    )
 
     class Meta:
         # Database-level optimizations
@@ -62,6 +71,23 @@ class Employee(models.Model):
         return f"{self.name} ({self.email})"
 
 
+def _performance_deleted(employee_ids):
+    """Refresh the summaries of the reviewed employees (see employees/signals.py)."""
+    from .signals import performance_bulk_loaded
+
+    performance_bulk_loaded.send(sender=Performance, employee_ids=employee_ids)
+
+
+class PerformanceQuerySet(models.QuerySet):
+    def delete(self):
+        """Delete the reviews, then refresh the summaries of their employees once."""
+        employee_ids = set(self.order_by().values_list("employee_id", flat=True).distinct())
+        result = super().delete()
+        if result[0]:
+            _performance_deleted(employee_ids)
+        return result
+
+
 class Performance(models.Model):
     """
     Represents a performance review for an employee.
@@ -83,12 +109,21 @@ class Performance(models.Model):
     review_date = models.DateField(
         help_text="Date when the performance review was recorded."
     )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_default=Now(),
+        db_index=True,
+        help_text="Last modification time (drives ETag / Last-Modified)."
+    )
+
+    objects = PerformanceQuerySet.as_manager()
 
     class Meta:
         ordering = ["-review_date"]  # Most recent reviews first
         indexes = [
             models.Index(fields=["employee", "review_date"]),
             models.Index(fields=["rating"]),
+            models.Index(fields=["review_date", "id"]),  # Keyset pagination
         ]
         verbose_name = "Performance Review"
         verbose_name_plural = "Performance Reviews"
@@ -96,3 +131,56 @@ class Performance(models.Model):
     def __str__(self):
         """Display example: 'Alice • 4 on 2025-10-01'."""
         return f"{self.employee.name} • {self.rating} on {self.review_date}"
+
+    def delete(self, *args, **kwargs):
+        """
+        Delete the review, then refresh its employee's summary.
+
+        Performance has no delete receivers, so that deleting an employee can
+        cascade to their reviews with one DELETE statement (their summary
+        cascades too).
+        """
+        result = super().delete(*args, **kwargs)
+        _performance_deleted([self.employee_id])
+        return result
+
+
+class PerformanceSummary(models.Model):
+    """
+    Precomputed review metrics for one employee.
+
+    ``rolling_avg`` averages the last ``ROLLING_WINDOW`` reviews; ``trend`` is
+    how much that average moved with the latest review (None for a single
+    review). Reviews are ordered by review_date, then id.
+    """
+
+    ROLLING_WINDOW = 4
+
+    employee = models.OneToOneField(
+        Employee,
+        on_delete=models.CASCADE,
+        primary_key=True,
+        related_name="performance_summary",
+    )
+    review_count = models.IntegerField(default=0)
+    latest_rating = models.IntegerField()
+    latest_review_date = models.DateField()
+    rolling_avg = models.FloatField(help_text="Average rating of the last 4 reviews.")
+    trend = models.FloatField(null=True, help_text="Change of the rolling average caused by the latest review.")
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        db_default=Now(),
+        db_index=True,
+        help_text="Last modification time (drives ETag / Last-Modified)."
+    )
+
+    class Meta:
+        ordering = ["-rolling_avg", "employee_id"]
+        indexes = [
+            models.Index(fields=["rolling_avg", "employee"]),
+        ]
+        verbose_name = "Performance Summary"
+        verbose_name_plural = "Performance Summaries"
+
+    def __str__(self):
+        return f"{self.employee_id} • avg {self.rolling_avg} ({self.review_count} reviews)"
@@ -0,0 +1,82 @@
+"""
+Maintenance of PerformanceSummary.
+
+refresh() recomputes the summaries of the given employees (or everyone) in
+one query: a ROW_NUMBER() window over each employee's reviews, newest first,
+keeps only the last ROLLING_WINDOW + 1 reviews, and a COUNT() window over the
+same partition gives the review total. A single Performance write therefore
+touches one employee's handful of rows, not the review table.
+"""
+
+from django.db import transaction
+from django.db.models import Count, F, Window
+from django.db.models.functions import RowNumber
+
+from .models import Performance, PerformanceSummary
+
+WINDOW = PerformanceSummary.ROLLING_WINDOW
+SUMMARY_FIELDS = ["review_count", "latest_rating", "latest_review_date", "rolling_avg", "trend"]
+
+
+def _average(ratings):
+    return round(sum(ratings) / len(ratings), 2)
+
+
+def compute(employee_ids=None):
+    """Return {employee_id: PerformanceSummary} built from the latest reviews."""
+    partition = [F("employee_id")]
+    reviews = Performance.objects.all()
+    if employee_ids is not None:
+        reviews = reviews.filter(employee_id__in=employee_ids)
+    rows = (reviews
+            .annotate(
+                position=Window(RowNumber(), partition_by=partition,
+                                order_by=[F("review_date").desc(), F("id").desc()]),
+                total=Window(Count("id"), partition_by=partition),
+            )
+            .filter(position__lte=WINDOW + 1)
+            .order_by("employee_id", "position")
+            .values_list("employee_id", "rating", "review_date", "total"))
+
+    latest = {}
+    for employee_id, rating, review_date, total in rows:
+        latest.setdefault(employee_id, []).append((rating, review_date, total))
+
+    summaries = {}
+    for employee_id, reviews in latest.items():
+        ratings = [rating for rating, _, _ in reviews]
+        rolling = _average(ratings[:WINDOW])
+        summaries[employee_id] = PerformanceSummary(
+            employee_id=employee_id,
+            review_count=reviews[0][2],
+            latest_rating=ratings[0],
+            latest_review_date=reviews[0][1],
+            rolling_avg=rolling,
+            trend=round(rolling - _average(ratings[1:]), 2) if len(ratings) > 1 else None,
+        )
+    return summaries
+
+
+@transaction.atomic
+def refresh(employee_ids=None):
+    """Recompute summaries for ``employee_ids`` (None = rebuild all); returns the row count."""
+    if employee_ids is not None:
+        employee_ids = list(employee_ids)
+        if not employee_ids:
+            return 0
+    summaries = compute(employee_ids)
+    if employee_ids is None:
+        PerformanceSummary.objects.all().delete()
+    else:
+        (PerformanceSummary.objects
+         .filter(employee_id__in=employee_ids)
+         .exclude(employee_id__in=list(summaries))
+         .delete())
+    PerformanceSummary.objects.bulk_create(
+        summaries.values(),
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["employee"],
+        update_fields=SUMMARY_FIELDS + ["updated_at"],
+    )
+    return len(summaries)
@@ -1,7 +1,80 @@
+from django.conf import settings
+from django.core.cache import cache
 from rest_framework.permissions import BasePermission, SAFE_METHODS
 
+from analytics.cache import PROCESS_LOCAL_BACKENDS
+
+# Role lookups are resolved once per request (memoised on the user object).
+# With a cache shared by all workers they are also shared across requests;
+# the cache key embeds a version that employees/signals.py bumps whenever
+# group membership changes. A per-process cache (the default local memory
+# one) would only see the bump in the worker that made the change, so then
+# roles are read from the database on every request.
+ROLES_VERSION_KEY = "rbac:roles:version"
+ROLES_CACHE_TIMEOUT = 300  # seconds
+
+
+def _shared_cache():
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_BACKENDS
+
+
+def _roles_version():
+    version = cache.get(ROLES_VERSION_KEY)
+    if version is None:
+        cache.add(ROLES_VERSION_KEY, 1, timeout=None)
+        version = cache.get(ROLES_VERSION_KEY, 1)
+    return version
+
+
+def invalidate_roles():
+    """Forget every cached role set (called on group membership changes)."""
+    try:
+        cache.incr(ROLES_VERSION_KEY)
+    except ValueError:
+        cache.set(ROLES_VERSION_KEY, 1, timeout=None)
+
+
+def get_roles(user) -> frozenset:
+    """Names of the groups ``user`` belongs to: one query per request, or per TTL with a shared cache."""
+    if not user or not user.is_authenticated:
+        return frozenset()
+    roles = getattr(user, "_rbac_roles", None)
+    if roles is None:
+        if not _shared_cache():
+            roles = frozenset(user.groups.values_list("name", flat=True))
+        else:
+            key = f"rbac:roles:v{_roles_version()}:{user.pk}"
+            roles = cache.get(key)
+            if roles is None:
+                roles = frozenset(user.groups.values_list("name", flat=True))
+                cache.set(key, roles, ROLES_CACHE_TIMEOUT)
+        user._rbac_roles = roles
+    return roles
+
+
+def load_token_roles(request):
+    """
+    Trust the ``roles`` claim of the access token, if enabled.
+
+    With RBAC_TRUST_TOKEN_ROLES the role set comes straight from the verified
+    JWT and no query is made; membership changes then apply once the token
+    is refreshed.
+    """
+    user = request.user
+    if not getattr(settings, "RBAC_TRUST_TOKEN_ROLES", False) or getattr(user, "_rbac_roles", None) is not None:
+        return
+    token = getattr(request, "auth", None)
+    try:
+        claim = token.get("roles") if token is not None else None
+    except AttributeError:
+        claim = None
+    if isinstance(claim, list):
+        user._rbac_roles = frozenset(claim)
+
+
 def in_group(user, name: str) -> bool:
-    return user.is_authenticated and user.groups.filter(name=name).exists()
+    return name in get_roles(user)
+
 
 class RBACPermission(BasePermission):
     """
@@ -14,6 +87,7 @@ class RBACPermission(BasePermission):
         if not u or not u.is_authenticated:
             return False
 
+        load_token_roles(request)
         if u.is_superuser or in_group(u, "Admin"):
             return True
 
@@ -26,6 +100,7 @@ class RBACPermission(BasePermission):
     def has_object_permission(self, request, view, obj):
         u = request.user
 
+        load_token_roles(request)
         if u.is_superuser or in_group(u, "Admin"):
             return True
 
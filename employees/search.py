@@ -0,0 +1,146 @@
+"""
+Indexed full-text search for the employee directory.
+
+EmployeeSearchFilter is a drop-in replacement for DRF's SearchFilter on
+EmployeeViewSet: same ``?search=`` parameter, same "every term must match"
+semantics, but served from an index and ordered by relevance (an explicit
+``?ordering=`` still wins).
+
+A term matches when any of these hold:
+- every word of it starts a word of name, email, phone number or address
+  (prefix full-text match)
+- it is similar to the name or email (PostgreSQL trigrams, for typos)
+- it occurs anywhere in the email or phone number (``icontains``, as with
+  SearchFilter). Emails and phone numbers are mostly single index tokens,
+  so without this "gmail" or digits from the middle of a number would not
+  match.
+- it occurs in the department name
+
+Indexes are created by migration employees/0003_employee_search_index:
+- PostgreSQL: GIN index on a ``simple`` tsvector over the text columns,
+  plus pg_trgm GIN indexes on name and email for fuzzy matches (these also
+  serve the email ILIKE) and on phone_number (0007) for its ILIKE.
+- SQLite: an FTS5 external-content table kept in sync with triggers
+  (so bulk_create and raw inserts are indexed too).
+Other backends fall back to DRF's ILIKE search.
+
+Department names are matched by resolving the (small) department table
+first, so every condition stays on the employee table's own indexes.
+"""
+
+import operator
+import re
+from functools import reduce
+
+from django.db import connection
+from django.db.models import FloatField, Q, Value
+from django.db.models.expressions import RawSQL
+from rest_framework import filters
+
+from departments.models import Department
+
+FTS_TABLE = "employees_employee_fts"
+SEARCH_COLUMNS = ("name", "email", "phone_number", "address")
+TRIGRAM_COLUMNS = ("name", "email")
+SUBSTRING_COLUMNS = ("email", "phone_number")
+
+_fts_tables = {}
+
+
+def _words(term):
+    """Split a user term into index-safe words (no tsquery/FTS5 operators)."""
+    return re.findall(r"\w+", term)
+
+
+def fts_available():
+    """True when the SQLite FTS5 index exists in the current database."""
+    name = connection.settings_dict["NAME"]
+    if name not in _fts_tables:
+        _fts_tables[name] = FTS_TABLE in connection.introspection.table_names()
+    return _fts_tables[name]
+
+
+class EmployeeSearchFilter(filters.SearchFilter):
+    """Ranked, index-backed ``?search=`` for employees."""
+
+    rank_annotation = "search_rank"
+
+    def filter_queryset(self, request, queryset, view):
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+        if connection.vendor == "postgresql":
+            return self.postgres_search(queryset, terms)
+        if connection.vendor == "sqlite" and fts_available():
+            return self.sqlite_search(queryset, terms)
+        return super().filter_queryset(request, queryset, view)
+
+    def department_ids(self, term):
+        return Department.objects.filter(name__icontains=term).values("pk")
+
+    def base_condition(self, term):
+        """Department and substring matches for one term; both backends add their index match."""
+        condition = Q(department__in=self.department_ids(term))
+        for column in SUBSTRING_COLUMNS:
+            condition |= Q(**{f"{column}__icontains": term})
+        return condition
+
+    # -------------------------------
+    # PostgreSQL: tsvector + pg_trgm
+    # -------------------------------
+    def postgres_search(self, queryset, terms):
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector, TrigramSimilarity
+
+        vector = SearchVector(*SEARCH_COLUMNS, config="simple")
+        queryset = queryset.alias(search_document=vector)
+
+        conditions = []
+        queries = []
+        for term in terms:
+            words = _words(term)
+            condition = self.base_condition(term)
+            condition |= reduce(operator.or_, (Q(**{f"{col}__trigram_similar": term}) for col in TRIGRAM_COLUMNS))
+            if words:
+                query = SearchQuery(" & ".join(f"{w}:*" for w in words), search_type="raw", config="simple")
+                queries.append(query)
+                condition |= Q(search_document=query)
+            conditions.append(condition)
+
+        rank = TrigramSimilarity("name", " ".join(terms))
+        if queries:
+            rank = rank + SearchRank(vector, reduce(operator.and_, queries))
+        return (queryset
+                .filter(reduce(operator.and_, conditions))
+                .annotate(**{self.rank_annotation: rank})
+                .order_by(f"-{self.rank_annotation}", "name"))
+
+    # -------------------------------
+    # SQLite: FTS5
+    # -------------------------------
+    def sqlite_search(self, queryset, terms):
+        table = queryset.model._meta.db_table
+        conditions = []
+        phrases = []
+        for term in terms:
+            condition = self.base_condition(term)
+            words = _words(term)
+            if words:
+                phrase = " AND ".join(f'"{w}"*' for w in words)
+                phrases.append(f"({phrase})")
+                condition |= Q(pk__in=RawSQL(f"SELECT rowid FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s", [phrase]))
+            conditions.append(condition)
+
+        if phrases:
+            # bm25() is lower-is-better; negate so higher ranks sort first.
+            rank = RawSQL(
+                f"COALESCE((SELECT -bm25({FTS_TABLE}) FROM {FTS_TABLE} "
+                f"WHERE {FTS_TABLE} MATCH %s AND rowid = {table}.id), 0)",
+                [" OR ".join(phrases)],
+                output_field=FloatField(),
+            )
+        else:
+            rank = Value(0.0, output_field=FloatField())
+        return (queryset
+                .filter(reduce(operator.and_, conditions))
+                .annotate(**{self.rank_annotation: rank})
+                .order_by(f"-{self.rank_annotation}", "name"))
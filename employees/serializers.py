@@ -6,11 +6,16 @@ Department serialization is imported from the departments app.
 """
 
 from rest_framework import serializers
+from django.contrib.auth.models import Group
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer, TokenRefreshSerializer
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.tokens import RefreshToken
 from departments.models import Department
 from departments.serializers import DepartmentSerializer
-from .models import Employee, Performance
+from employee_project.sparse import SparseFieldsMixin
+from .models import Employee, Performance, PerformanceSummary
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class EmployeeSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     department = DepartmentSerializer(read_only=True, allow_null=True)
     department_id = serializers.PrimaryKeyRelatedField(
         queryset=Department.objects.all(),
@@ -33,10 +38,79 @@ class EmployeeSerializer(serializers.ModelSerializer):
             "department_id",
         ]
 
+    expandable_fields = {"department": DepartmentSerializer}
 
-class PerformanceSerializer(serializers.ModelSerializer):
+
+# (column header, ORM lookup) pairs of the performance CSV/NDJSON export
+# (employee_project/exports.py), shared by both performance viewsets.
+PERFORMANCE_EXPORT_FIELDS = [
+    ("id", "id"),
+    ("employee_id", "employee_id"),
+    ("employee_name", "employee__name"),
+    ("department", "employee__department__name"),
+    ("rating", "rating"),
+    ("review_date", "review_date"),
+]
+
+
+class PerformanceSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     employee_name = serializers.CharField(source="employee.name", read_only=True)
 
     class Meta:
         model = Performance
         fields = ["id", "employee", "employee_name", "rating", "review_date"]
+
+    expandable_fields = {"employee": EmployeeSerializer}
+
+
+class RoleRefreshToken(RefreshToken):
+    """
+    Refresh token whose access tokens carry the user's group names as ``roles``.
+
+    The claim is read from the database each time an access token is minted
+    (login and /token/refresh/) and is never stored in the refresh token, so
+    a group change reaches the client with its next refresh.
+    """
+
+    no_copy_claims = RefreshToken.no_copy_claims + ("roles",)
+
+    @property
+    def access_token(self):
+        access = super().access_token
+        user_id = self.payload.get(api_settings.USER_ID_CLAIM)
+        access["roles"] = sorted(Group.objects
+                                 .filter(**{f"user__{api_settings.USER_ID_FIELD}": user_id})
+                                 .values_list("name", flat=True))
+        return access
+
+
+class RoleTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Login; the access token gets a ``roles`` claim (see RBAC_TRUST_TOKEN_ROLES)."""
+
+    token_class = RoleRefreshToken
+
+
+class RoleTokenRefreshSerializer(TokenRefreshSerializer):
+    """Token refresh; the new access token's ``roles`` are re-read from the user's groups."""
+
+    token_class = RoleRefreshToken
+
+
+class PerformanceSummarySerializer(serializers.ModelSerializer):
+    employee_name = serializers.CharField(source="employee.name", read_only=True)
+    department = serializers.IntegerField(source="employee.department_id", read_only=True, allow_null=True)
+    department_name = serializers.CharField(source="employee.department.name", read_only=True, allow_null=True)
+
+    class Meta:
+        model = PerformanceSummary
+        fields = [
+            "employee",
+            "employee_name",
+            "department",
+            "department_name",
+            "review_count",
+            "latest_rating",
+            "latest_review_date",
+            "rolling_avg",
+            "trend",
+        ]
@@ -0,0 +1,122 @@
+"""
+Signal receivers for the employees app, plus the app's custom signals.
+
+``employees_bulk_loaded`` is sent after bulk_create()/COPY loads of Employee
+rows (which bypass post_save) with the affected ``department_ids``;
+``performance_bulk_loaded`` likewise for Performance rows, with the affected
+``employee_ids`` (None when every employee may be affected).
+
+Performance writes refresh the PerformanceSummary of the employees involved.
+Deletes send ``performance_bulk_loaded`` from Performance.delete() and the
+queryset's delete() rather than using a post_delete receiver, which would
+stop Django from fast-deleting an employee's reviews in one statement.
+Employee creates, deletes and transfers adjust Department.headcount with F()
+updates; bulk loads recount the departments they touched. The pre_save
+receiver loads the stored department once as ``_previous_department_id``;
+the analytics receivers reuse it.
+
+Connected in EmployeesConfig.ready().
+"""
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.db import transaction
+from django.db.models import QuerySet
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.dispatch import Signal, receiver
+
+from departments import headcount
+from departments.models import Department
+from . import performance
+from .authentication import forget_user
+from .models import Employee, Performance
+from .permissions import invalidate_roles
+
+employees_bulk_loaded = Signal()
+performance_bulk_loaded = Signal()
+
+
+def deleted_with_department(origin):
+    """True when a delete receiver runs because a Department (or queryset of them) is being deleted."""
+    if isinstance(origin, QuerySet):
+        return origin.model is Department
+    return isinstance(origin, Department)
+
+
+@receiver(m2m_changed, sender=get_user_model().groups.through)
+def user_groups_changed(sender, action, **kwargs):
+    if action in ("post_add", "post_remove", "post_clear"):
+        transaction.on_commit(invalidate_roles)
+
+
+@receiver(post_save, sender=Group)
+@receiver(post_delete, sender=Group)
+def group_changed(sender, **kwargs):
+    transaction.on_commit(invalidate_roles)
+
+
+@receiver(post_save, sender=get_user_model())
+@receiver(post_delete, sender=get_user_model())
+def user_changed(sender, instance, **kwargs):
+    # Evict now for this process, and again after commit in case a concurrent
+    # request re-cached the pre-commit row in between.
+    forget_user(instance.pk)
+    transaction.on_commit(lambda: forget_user(instance.pk))
+
+
+@receiver(pre_save, sender=Performance)
+def remember_reviewed_employee(sender, instance, raw=False, **kwargs):
+    instance._previous_employee_id = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_employee_id = (Performance.objects
+                                      .filter(pk=instance.pk)
+                                      .values_list("employee_id", flat=True)
+                                      .first())
+
+
+@receiver(post_save, sender=Performance)
+def performance_saved(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_previous_employee_id", None)
+    performance.refresh({instance.employee_id, previous} - {None})
+
+
+@receiver(performance_bulk_loaded)
+def performance_bulk_refresh(sender, employee_ids=None, **kwargs):
+    performance.refresh(employee_ids)
+
+
+@receiver(pre_save, sender=Employee)
+def remember_department(sender, instance, raw=False, **kwargs):
+    instance._previous_department_id = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_department_id = (Employee.objects
+                                        .filter(pk=instance.pk)
+                                        .values_list("department_id", flat=True)
+                                        .first())
+
+
+@receiver(post_save, sender=Employee)
+def employee_saved(sender, instance, created=False, raw=False, **kwargs):
+    if raw:
+        return
+    if created:
+        headcount.adjust(instance.department_id, 1)
+        return
+    old = getattr(instance, "_previous_department_id", None)
+    if old is not None and old != instance.department_id:
+        headcount.adjust(old, -1)
+        headcount.adjust(instance.department_id, 1)
+
+
+@receiver(post_delete, sender=Employee)
+def employee_deleted(sender, instance, **kwargs):
+    headcount.adjust(instance.department_id, -1)
+
+
+@receiver(employees_bulk_loaded)
+def employees_bulk_recount(sender, department_ids=None, **kwargs):
+    headcount.recount(department_ids)
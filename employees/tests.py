@@ -1,3 +1,653 @@
-from django.test import TestCase
+import csv
+import os
+import shutil
+import tempfile
+import time
+from datetime import date, timedelta
+from io import StringIO
+from types import SimpleNamespace
+from unittest import mock
 
-# Create your tests here.
+from django.contrib.auth import get_user_model
+from django.contrib.auth.models import Group
+from django.core.management import call_command
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from django.test.utils import CaptureQueriesContext
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import AccessToken, RefreshToken
+
+from attendance.models import Attendance
+from departments.models import Department
+from employee_project import fast_serializers, startup
+from jobs.models import ImportCheckpoint
+from employee_project.batch import BatchView
+from . import performance, search
+from .authentication import CachedJWTAuthentication, forget_user
+from .models import Employee, Performance, PerformanceSummary
+from .permissions import RBACPermission, get_roles
+from .management.commands import import_employees
+from .management.commands.startup_profile import parse_importtime
+from .views import EmployeeViewSet, PerformanceSummaryViewSet, PerformanceViewSet
+
+
+# Logging in hashes the password; the default PBKDF2 takes long enough for the
+# token request to be logged as slow (employee_project/instrumentation.py).
+fast_password_hashing = override_settings(PASSWORD_HASHERS=["django.contrib.auth.hashers.MD5PasswordHasher"])
+
+
+class FastListParityTests(TestCase):
+    """The .values() list path must render exactly the same JSON as the serializers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        eng = Department.objects.create(name="Engineering", description="Builds things")
+        hr = Department.objects.create(name="HR")
+        for i in range(25):
+            emp = Employee.objects.create(
+                name=f"Employee {i:02d}",
+                email=f"employee{i}@example.com",
+                phone_number="" if i % 3 else f"555-01{i:02d}",
+                address=f"{i} Main Street",
+                date_of_joining=date(2024, 1 + i % 12, 1 + i),
+                department=eng if i % 2 else hr,
+            )
+            Performance.objects.create(employee=emp, rating=1 + i % 5, review_date=date(2025, 1 + i % 12, 10))
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def assertSameBytes(self, viewset, url, params=None):
+        fast = self.client.get(url, params)
+        with mock.patch.object(viewset, "fast_list", False):
+            slow = self.client.get(url, params)
+        self.assertEqual(fast.status_code, 200)
+        self.assertEqual(fast.content, slow.content)
+
+    def test_employee_list(self):
+        self.assertSameBytes(EmployeeViewSet, "/api/v1/employees/")
+        self.assertSameBytes(EmployeeViewSet, "/api/v1/employees/", {"page": 2})
+        self.assertSameBytes(EmployeeViewSet, "/api/v1/employees/", {"ordering": "-date_of_joining"})
+        self.assertSameBytes(EmployeeViewSet, "/api/v1/employees/", {"search": "Employee 1"})
+        self.assertSameBytes(EmployeeViewSet, "/api/v1/employees/", {"fields": "id,name,department", "expand": ""})
+
+    def test_performance_list(self):
+        self.assertSameBytes(PerformanceViewSet, "/api/v1/performance/")
+        self.assertSameBytes(PerformanceViewSet, "/api/v1/performance/", {"rating__gte": 3})
+        self.assertSameBytes(PerformanceViewSet, "/api/v1/performance/", {"pagination": "cursor"})
+        self.assertSameBytes(PerformanceViewSet, "/api/v1/performance/", {"expand": "employee.department"})
+
+    def test_performance_summary_list(self):
+        url = "/api/v1/performance-summary/"
+        self.assertSameBytes(PerformanceSummaryViewSet, url)
+        self.assertSameBytes(PerformanceSummaryViewSet, url, {"ordering": "employee__department__name,rolling_avg"})
+        self.assertSameBytes(PerformanceSummaryViewSet, url, {"department": Department.objects.first().pk})
+
+
+class ConditionalGetTests(TestCase):
+    """ETag / Last-Modified validation on employee endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept = Department.objects.create(name="Engineering")
+        cls.employees = [
+            Employee.objects.create(
+                name=f"Employee {i}", email=f"e{i}@example.com",
+                date_of_joining=date(2024, 1, 1 + i), department=cls.dept,
+            )
+            for i in range(3)
+        ]
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_list_not_modified_in_one_query(self):
+        first = self.client.get("/api/v1/employees/")
+        self.assertIn("Last-Modified", first)
+        with self.assertNumQueries(1):
+            second = self.client.get("/api/v1/employees/", HTTP_IF_NONE_MATCH=first["ETag"])
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second.content, b"")
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_list_etag_tracks_changes(self):
+        etag = self.client.get("/api/v1/employees/")["ETag"]
+        self.assertNotEqual(self.client.get("/api/v1/employees/", {"page": 1})["ETag"], etag)
+
+        self.dept.name = "Platform"
+        self.dept.save()  # nested department data changed
+        renamed = self.client.get("/api/v1/employees/", HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(renamed.status_code, 200)
+
+        self.employees[0].delete()
+        deleted = self.client.get("/api/v1/employees/", HTTP_IF_NONE_MATCH=renamed["ETag"])
+        self.assertEqual(deleted.status_code, 200)
+
+    def test_list_etag_tracks_expanded_relations(self):
+        emp = self.employees[0]
+        Attendance.objects.create(employee=emp, date=date(2025, 3, 3), status=Attendance.STATUS_PRESENT)
+        Performance.objects.create(employee=emp, rating=4, review_date=date(2025, 1, 1))
+        for url, expand, changed in (("/api/v1/attendance/", "employee", emp),
+                                     ("/api/v1/performance/", "employee.department", self.dept)):
+            first = self.client.get(url, {"expand": expand})
+            self.assertEqual(self.client.get(url, {"expand": expand}, HTTP_IF_NONE_MATCH=first["ETag"]).status_code,
+                             304)
+            changed.name = "Renamed"
+            changed.save()
+            second = self.client.get(url, {"expand": expand}, HTTP_IF_NONE_MATCH=first["ETag"])
+            self.assertEqual(second.status_code, 200)
+            self.assertNotEqual(second["ETag"], first["ETag"])
+
+    def test_retrieve(self):
+        url = f"/api/v1/employees/{self.employees[1].pk}/"
+        first = self.client.get(url)
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 304)
+        self.assertEqual(self.client.get(url, HTTP_IF_MODIFIED_SINCE=first["Last-Modified"]).status_code, 304)
+
+        self.client.patch(url, {"name": "Renamed"}, format="json")
+        self.assertEqual(self.client.get(url, HTTP_IF_NONE_MATCH=first["ETag"]).status_code, 200)
+
+
+class SparseFieldsetTests(TestCase):
+    """?fields= and ?expand= trim the payload and the SQL behind it."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept = Department.objects.create(name="Engineering")
+        cls.emp = Employee.objects.create(name="Ada", email="ada@example.com",
+                                          date_of_joining=date(2024, 1, 1), department=cls.dept)
+        Performance.objects.create(employee=cls.emp, rating=4, review_date=date(2025, 1, 1))
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def get(self, url, params):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(url, params)
+        self.assertEqual(response.status_code, 200)
+        return response.json(), queries[-1]["sql"]
+
+    def test_list_and_retrieve(self):
+        default, sql = self.get("/api/v1/employees/", {})
+        self.assertEqual(default["results"][0]["department"]["name"], "Engineering")
+        self.assertIn("JOIN", sql)
+
+        sparse, sql = self.get("/api/v1/employees/", {"fields": "id,name,department", "expand": ""})
+        self.assertEqual(sparse["results"], [{"id": self.emp.pk, "name": "Ada", "department": self.dept.pk}])
+        self.assertNotIn("JOIN", sql)
+        self.assertNotIn("address", sql)
+
+        url = f"/api/v1/employees/{self.emp.pk}/"
+        self.assertEqual(self.get(url, {"fields": "name"})[0], {"name": "Ada"})
+        review = Performance.objects.get()
+        body, sql = self.get(f"/api/v1/performance/{review.pk}/", {"fields": "rating,employee", "expand": "employee"})
+        self.assertEqual((body["rating"], body["employee"]["name"], body["employee"]["department"]),
+                         (4, "Ada", self.dept.pk))
+        self.assertEqual(sql.count("JOIN"), 1)
+        self.assertNotIn("review_date", sql)
+
+    def test_unknown_names(self):
+        self.assertEqual(self.client.get("/api/v1/employees/", {"fields": "id,salary"}).status_code, 400)
+        self.assertEqual(self.client.get("/api/v1/departments/", {"expand": "employees"}).status_code, 400)
+
+
+class PerformanceSummaryTests(TestCase):
+    """Summaries follow Performance writes and match a full recompute."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept = Department.objects.create(name="Engineering")
+        cls.emps = [
+            Employee.objects.create(name=f"E{i}", email=f"s{i}@example.com", date_of_joining=date(2024, 1, 1),
+                                    department=cls.dept)
+            for i in range(2)
+        ]
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def test_rolling_metrics(self):
+        a, b = self.emps
+        for month, rating in enumerate([2, 4, 5, 3, 1], start=1):
+            Performance.objects.create(employee=a, rating=rating, review_date=date(2025, month, 1))
+        summary = PerformanceSummary.objects.get(employee=a)
+        # newest first: 1, 3, 5, 4, 2 -> avg(1, 3, 5, 4) = 3.25, previously avg(3, 5, 4, 2) = 3.5
+        self.assertEqual((summary.review_count, summary.latest_rating, summary.rolling_avg, summary.trend),
+                         (5, 1, 3.25, -0.25))
+
+        review = Performance.objects.filter(employee=a).first()
+        review.employee = b
+        review.save()
+        Performance.objects.filter(employee=a, rating=2).delete()
+        Performance.objects.filter(employee=a).last().delete()
+        incremental = sorted(PerformanceSummary.objects.values_list(
+            "employee_id", "review_count", "latest_rating", "rolling_avg", "trend"))
+        performance.refresh()
+        self.assertEqual(incremental, sorted(PerformanceSummary.objects.values_list(
+            "employee_id", "review_count", "latest_rating", "rolling_avg", "trend")))
+        self.assertEqual(PerformanceSummary.objects.get(employee=b).trend, None)
+
+    def test_filter_and_order(self):
+        a, b = self.emps
+        Performance.objects.create(employee=a, rating=5, review_date=date(2025, 1, 1))
+        Performance.objects.create(employee=b, rating=2, review_date=date(2025, 1, 1))
+        client = APIClient()
+        client.force_authenticate(self.user)
+        response = client.get("/api/v1/performance-summary/", {"department": self.dept.pk, "ordering": "rolling_avg"})
+        self.assertEqual([row["employee"] for row in response.json()["results"]], [b.pk, a.pk])
+        response = client.get("/api/v1/performance-summary/", {"min_avg": 3})
+        self.assertEqual([row["employee"] for row in response.json()["results"]], [a.pk])
+
+
+class CascadeDeleteTests(TestCase):
+    """Deleting an employee or department keeps Django's one-statement cascades."""
+
+    def employee(self, dept, name, days):
+        emp = Employee.objects.create(name=name, email=f"{name}@example.com", date_of_joining=date(2024, 1, 1),
+                                      department=dept)
+        Attendance.objects.bulk_create(
+            Attendance(employee=emp, date=date(2025, 1, 1) + timedelta(days=n), status=Attendance.STATUS_PRESENT)
+            for n in range(days)
+        )
+        Performance.objects.bulk_create(
+            Performance(employee=emp, rating=3, review_date=date(2025, 1, 1) + timedelta(days=n)) for n in range(days)
+        )
+        return emp
+
+    def count_queries(self, instance):
+        with CaptureQueriesContext(connection) as ctx:
+            instance.delete()
+        return len(ctx.captured_queries)
+
+    def test_query_count_does_not_grow_with_rows(self):
+        small = self.employee(Department.objects.create(name="Ops"), "small", 5)
+        large = self.employee(Department.objects.create(name="Sales"), "large", 200)
+        self.assertEqual(self.count_queries(small), self.count_queries(large))
+        self.assertFalse(Attendance.objects.exists() or Performance.objects.exists())
+
+        counts = []
+        for days in (5, 200):
+            dept = Department.objects.create(name=f"Dept {days}")
+            for i in range(3):
+                self.employee(dept, f"d{days}-{i}", days)
+            counts.append(self.count_queries(dept))
+        self.assertEqual(counts[0], counts[1])
+        self.assertFalse(Employee.objects.exists())
+
+
+@fast_password_hashing
+class BatchTests(TestCase):
+    """Several API calls through /api/v1/batch/ with one authentication pass."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dept = Department.objects.create(name="Engineering")
+        cls.emp = Employee.objects.create(name="Ada", email="ada@example.com",
+                                          date_of_joining=date(2024, 1, 1), department=cls.dept)
+        Performance.objects.create(employee=cls.emp, rating=4, review_date=date(2025, 1, 1))
+        get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def setUp(self):
+        self.client = APIClient()
+        token = self.client.post("/api/auth/token/", {"username": "admin", "password": "pw"}).json()["access"]
+        self.client.credentials(HTTP_AUTHORIZATION=f"Bearer {token}")
+
+    def batch(self, requests, **extra):
+        return self.client.post("/api/v1/batch/", {"requests": requests, **extra}, format="json")
+
+    def test_dashboard_batch(self):
+        etag = self.client.get(f"/api/v1/departments/{self.dept.pk}/")["ETag"]
+        with mock.patch.object(CachedJWTAuthentication, "authenticate", autospec=True,
+                               side_effect=CachedJWTAuthentication.authenticate) as authenticate:
+            response = self.batch([
+                {"id": "employee", "path": f"/api/v1/employees/{self.emp.pk}/"},
+                {"path": f"/api/v1/performance/?employee={self.emp.pk}"},
+                {"path": f"/api/v1/departments/{self.dept.pk}/", "headers": {"If-None-Match": etag}},
+                {"method": "PATCH", "path": f"/api/v1/employees/{self.emp.pk}/", "body": {"name": "Ada L."}},
+                {"path": "/api/v1/analytics/employees-per-department/"},  # async view
+                {"path": "/api/v1/nowhere/"},
+                {"path": "/admin/"},
+            ])
+        self.assertEqual(authenticate.call_count, 1)
+        results = response.json()["responses"]
+        self.assertEqual([r["status"] for r in results], [200, 200, 304, 200, 200, 404, 400])
+        self.assertEqual(results[0]["id"], "employee")
+        self.assertEqual(results[0]["body"]["name"], "Ada")
+        self.assertEqual(results[1]["body"]["count"], 1)
+        self.assertIsNone(results[2]["body"])
+        self.assertEqual(results[4]["body"]["labels"], ["Engineering"])
+        self.assertEqual(Employee.objects.get(pk=self.emp.pk).name, "Ada L.")
+
+    def test_atomic_rollback_and_limits(self):
+        response = self.batch([
+            {"method": "PATCH", "path": f"/api/v1/employees/{self.emp.pk}/", "body": {"name": "Changed"}},
+            {"method": "POST", "path": "/api/v1/performance/", "body": {"employee": self.emp.pk, "rating": 9}},
+            {"path": "/api/v1/departments/"},
+        ], atomic=True)
+        self.assertEqual([r["status"] for r in response.json()["responses"]], [200, 400, 424])
+        self.assertEqual(Employee.objects.get(pk=self.emp.pk).name, "Ada")
+
+        nested = self.batch([{"method": "POST", "path": "/api/v1/batch/", "body": {"requests": []}}])
+        self.assertEqual(nested.json()["responses"][0]["status"], 400)
+        too_many = [{"path": "/api/v1/departments/"}] * (BatchView.max_requests + 1)
+        self.assertEqual(self.batch(too_many).status_code, 400)
+        self.client.credentials()
+        self.assertEqual(self.batch([{"path": "/api/v1/departments/"}]).status_code, 401)
+
+
+class HealthTests(TestCase):
+    """/health/ is a plain liveness check; connection reuse is reported to staff only."""
+
+    url = "/api/v1/analytics/db-stats/"
+
+    def setUp(self):
+        admin = get_user_model().objects.create_user("staff", "staff@example.com", "pw", is_staff=True)
+        self.staff = {"HTTP_AUTHORIZATION": f"Bearer {AccessToken.for_user(admin)}"}
+
+    def test_health_is_liveness_only(self):
+        self.assertEqual(self.client.get("/health/").json(), {"status": "ok"})
+        self.assertEqual(self.client.get(self.url).status_code, 401)
+        clerk = get_user_model().objects.create_user("clerk", "clerk@example.com", "pw")
+        self.assertEqual(self.client.get(self.url, HTTP_AUTHORIZATION=f"Bearer {AccessToken.for_user(clerk)}")
+                         .status_code, 403)
+
+    def test_persistent_connections(self):
+        database = self.client.get(self.url, **self.staff).json()
+        self.assertEqual((database["mode"], database["conn_max_age"], database["health_checks"]),
+                         ("persistent", 60, True))
+
+    def test_pool_stats(self):
+        pool = mock.Mock(min_size=2, max_size=10)
+        pool.get_stats.return_value = {"pool_min": 2, "pool_max": 10, "pool_size": 4, "pool_available": 1,
+                                       "requests_waiting": 3, "requests_num": 8, "requests_wait_ms": 40}
+        with mock.patch.object(connection, "pool", pool, create=True):
+            database = self.client.get(self.url, **self.staff).json()
+        self.assertEqual((database["mode"], database["in_use"], database["idle"], database["waiting"]),
+                         ("pool", 3, 1, 3))
+        self.assertEqual((database["wait_ms_total"], database["wait_ms_avg"]), (40, 5.0))
+
+
+class StartupTests(TestCase):
+    """Warmup primes the URLconf, list plans and database before the first request."""
+
+    def test_warmup(self):
+        fast_serializers._compile.cache_clear()
+        conn = mock.MagicMock()  # the test database must stay open
+        with mock.patch.object(startup.connections, "all", return_value=[conn]):
+            timings = startup.warmup()
+        self.assertEqual(list(timings), ["urls", "serializers", "db"])
+        # employees, departments, attendance, both performance lists and the summaries
+        self.assertEqual(fast_serializers._compile.cache_info().currsize, 6)
+        with mock.patch.object(fast_serializers, "ValuesPlan") as compile_plan:
+            client = APIClient()
+            client.force_authenticate(get_user_model().objects.create_superuser("root", "r@example.com", "pw"))
+            self.assertEqual(client.get("/api/v1/employees/").status_code, 200)
+        compile_plan.assert_not_called()
+        conn.cursor.return_value.__enter__.return_value.execute.assert_called_once_with("SELECT 1")
+        conn.close.assert_called_once_with()
+
+    def test_parse_importtime(self):
+        output = ("import time: self [us] | cumulative | imported package\n"
+                  "import time:       120 |        120 |     yaml.error\n"
+                  "import time:       862 |        982 |   yaml\n")
+        self.assertEqual(parse_importtime(output), {"yaml.error": (120, 120), "yaml": (862, 982)})
+
+
+class SeedDataTests(TestCase):
+    """seed_data creates the requested volume in both modes, reproducibly with --seed."""
+
+    def weekdays(self, days):
+        today = timezone.now().date()
+        return sum((today - timedelta(days=n)).weekday() < 5 for n in range(days + 1))
+
+    def snapshot(self):
+        return (list(Employee.objects.order_by("pk").values_list("name", "email", "department__name")),
+                list(Attendance.objects.order_by("employee__email", "date").values_list("date", "status")),
+                list(Performance.objects.order_by("employee__email", "review_date", "rating")
+                     .values_list("rating", "review_date")))
+
+    def test_bulk_mode(self):
+        out = StringIO()
+        call_command("seed_data", "--bulk", "--employees", "12", "--days", "10", "--seed", "7",
+                     "--batch-size", "5", "--workers", "2", stdout=out)
+        self.assertIn("SQLite allows a single writer", out.getvalue())
+        self.assertEqual((Department.objects.count(), Employee.objects.count()), (7, 12))
+        self.assertEqual(Attendance.objects.count(), 12 * self.weekdays(10))
+        self.assertTrue(24 <= Performance.objects.count() <= 60)
+        for counts in Employee.objects.values_list("performance_summary__review_count", flat=True):
+            self.assertTrue(2 <= counts <= 5)
+
+        first = self.snapshot()
+        call_command("seed_data", "--employees", "1", stdout=out)  # already seeded: no-op
+        self.assertEqual(Employee.objects.count(), 12)
+        Employee.objects.all().delete()
+        call_command("seed_data", "--bulk", "--employees", "12", "--days", "10", "--seed", "7", stdout=out)
+        self.assertEqual(self.snapshot(), first)
+
+    def test_simple_mode(self):
+        call_command("seed_data", "--employees", "3", "--days", "6", stdout=StringIO())
+        self.assertEqual(Employee.objects.count(), 3)
+        self.assertEqual(Attendance.objects.count(), 3 * self.weekdays(6))
+        self.assertTrue(6 <= Performance.objects.count() <= 15)
+
+
+class ImportEmployeesTests(TestCase):
+    """import_employees reports bad rows once and resumes after the last committed chunk."""
+
+    ROWS = [
+        ("Ann", "ann@example.com"),
+        ("Bad", "not-an-email"),
+        ("Cid", "cid@example.com"),
+        ("Dee", "dee@example.com"),
+        ("Eve", "ANN@example.com"),  # duplicate of row 1
+        ("Fay", "fay@example.com"),
+    ]
+
+    def setUp(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        self.path = os.path.join(directory, "employees.csv")
+        with open(self.path, "w", newline="") as fh:
+            writer = csv.writer(fh)
+            writer.writerow(["name", "email", "date_of_joining", "department"])
+            writer.writerows([(name, email, "2024-01-01", "Ops") for name, email in self.ROWS])
+
+    def run_import(self, *args):
+        out = StringIO()
+        call_command("import_employees", self.path, "--create-departments", "--chunk-size", "2", *args, stdout=out)
+        return out.getvalue()
+
+    def error_report(self):
+        with open(f"{self.path}.errors.csv", newline="") as fh:
+            return [(row["line"], row["name"], row["error"]) for row in csv.DictReader(fh)]
+
+    def test_error_report(self):
+        self.assertIn("4 rows loaded, 2 rejected", self.run_import())
+        self.assertEqual(sorted(Employee.objects.values_list("name", flat=True)), ["Ann", "Cid", "Dee", "Fay"])
+        self.assertEqual(self.error_report(), [("3", "Bad", "invalid email 'not-an-email'"),
+                                               ("6", "Eve", "email ANN@example.com already exists")])
+        self.assertFalse(ImportCheckpoint.objects.exists())
+
+    def test_resume_after_crash(self):
+        load = import_employees.Command.load
+        calls = []
+
+        def crash_in_second_chunk(command, rows, opts):
+            load(command, rows, opts)
+            calls.append(rows)
+            if len(calls) == 2:
+                raise RuntimeError("worker killed")
+
+        with mock.patch.object(import_employees.Command, "load", crash_in_second_chunk):
+            with self.assertRaises(RuntimeError):
+                self.run_import()
+        # the second chunk and its checkpoint were rolled back together
+        self.assertEqual(list(Employee.objects.values_list("name", flat=True)), ["Ann"])
+        self.assertEqual(ImportCheckpoint.objects.get().state["rows"], 2)
+
+        output = self.run_import("--resume")
+        self.assertIn("Resuming after row 2", output)
+        self.assertIn("4 rows loaded, 2 rejected", output)
+        self.assertEqual(Employee.objects.count(), 4)
+        self.assertEqual([line for line, *_ in self.error_report()], ["3", "6"])
+        self.assertFalse(ImportCheckpoint.objects.exists())
+
+
+class SearchTests(TestCase):
+    """?search= on employees: prefix full-text matches plus substring matches on email and phone."""
+
+    @classmethod
+    def setUpTestData(cls):
+        eng = Department.objects.create(name="Engineering")
+        sales = Department.objects.create(name="Sales")
+        for name, email, phone, dept in [
+            ("Ada Lovelace", "ada.l@gmail.com", "5551234567", eng),
+            ("Adam Smith", "adam@corp.example", "5559876543", sales),
+            ("Grace Hopper", "grace@navy.example", "5550001111", eng),
+        ]:
+            Employee.objects.create(name=name, email=email, phone_number=phone, date_of_joining=date(2024, 1, 1),
+                                    department=dept)
+        cls.user = get_user_model().objects.create_superuser("admin", "admin@example.com", "pw")
+
+    def names(self, **params):
+        client = APIClient()
+        client.force_authenticate(self.user)
+        return [row["name"] for row in client.get("/api/v1/employees/", params).json()["results"]]
+
+    def test_search(self):
+        self.assertTrue(search.fts_available())
+        self.assertEqual(sorted(self.names(search="ada")), ["Ada Lovelace", "Adam Smith"])  # prefix, ranked
+        self.assertEqual(self.names(search="ada love"), ["Ada Lovelace"])            # every term
+        self.assertEqual(self.names(search="gmail"), ["Ada Lovelace"])               # inside the email
+        self.assertEqual(self.names(search="1234"), ["Ada Lovelace"])                # middle of the number
+        self.assertEqual(self.names(search="sales"), ["Adam Smith"])                 # department
+        self.assertEqual(self.names(search="engineering", ordering="-name"), ["Grace Hopper", "Ada Lovelace"])
+        self.assertEqual(self.names(search="zzz"), [])
+
+    def test_same_matches_without_index(self):
+        for term in ("ada", "gmail", "1234", "sales"):
+            indexed = self.names(search=term, ordering="name")
+            with mock.patch.object(search, "fts_available", return_value=False):
+                self.assertEqual(self.names(search=term, ordering="name"), indexed, term)
+
+
+@fast_password_hashing
+class RoleClaimTests(TestCase):
+    """The ``roles`` claim lives on access tokens only and is re-read on every refresh."""
+
+    def test_revoked_group_is_dropped_on_refresh(self):
+        user = get_user_model().objects.create_user("hr", "hr@example.com", "pw")
+        hr = Group.objects.create(name="HR")
+        user.groups.add(hr)
+        client = APIClient()
+        tokens = client.post("/api/auth/token/", {"username": "hr", "password": "pw"}, format="json").json()
+        self.assertEqual(AccessToken(tokens["access"])["roles"], ["HR"])
+        self.assertNotIn("roles", RefreshToken(tokens["refresh"]).payload)
+
+        user.groups.remove(hr)
+        refreshed = client.post("/api/auth/token/refresh/", {"refresh": tokens["refresh"]}, format="json")
+        self.assertEqual(refreshed.status_code, 200)
+        self.assertEqual(AccessToken(refreshed.json()["access"])["roles"], [])
+
+        def may_write(access):
+            fresh = get_user_model().objects.get(pk=user.pk)  # no memoised roles
+            request = SimpleNamespace(user=fresh, auth=AccessToken(access), method="POST")
+            return RBACPermission().has_permission(request, view=None)
+
+        with override_settings(RBAC_TRUST_TOKEN_ROLES=True):
+            self.assertTrue(may_write(tokens["access"]))              # old token: HR until it expires
+            self.assertFalse(may_write(refreshed.json()["access"]))
+
+    def test_roles_cache_needs_a_shared_backend(self):
+        users = get_user_model().objects
+        user = users.create_user("admin", "admin@example.com", "pw")
+        user.groups.add(Group.objects.create(name="Admin"))
+        memberships = get_user_model().groups.through.objects
+
+        # Local memory: another worker's change (no signal here) is seen by the next request
+        self.assertEqual(get_roles(users.get(pk=user.pk)), {"Admin"})
+        memberships.filter(user=user).delete()
+        self.assertEqual(get_roles(users.get(pk=user.pk)), set())
+
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        with override_settings(CACHES={"default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache", "LOCATION": location,
+        }}):
+            self.assertEqual(get_roles(users.get(pk=user.pk)), set())
+            next_request = users.get(pk=user.pk)
+            with self.assertNumQueries(0):  # served from the shared cache
+                self.assertEqual(get_roles(next_request), set())
+
+
+@fast_password_hashing
+class CachedJWTAuthenticationTests(TestCase):
+    """The cached user snapshot still enforces revocation, deactivation and group changes."""
+
+    url = "/api/v1/departments/"
+
+    def setUp(self):
+        self.users = get_user_model().objects
+        self.addCleanup(lambda: [forget_user(pk) for pk in self.users.values_list("pk", flat=True)])
+
+    def login(self, username):
+        self.users.create_user(username, f"{username}@example.com", "pw")
+        client = APIClient()
+        access = client.post("/api/auth/token/", {"username": username, "password": "pw"}, format="json").json()
+        client.credentials(HTTP_AUTHORIZATION=f"Bearer {access['access']}")
+        return client
+
+    def test_cached_user_skips_user_query(self):
+        client = self.login("cached")
+        self.assertEqual(client.get(self.url).status_code, 200)
+        with CaptureQueriesContext(connection) as ctx:
+            self.assertEqual(client.get(self.url).status_code, 200)
+        self.assertFalse([q for q in ctx.captured_queries if '"auth_user"' in q["sql"]])
+
+    def test_saves_in_this_process_apply_at_once(self):
+        client = self.login("revoked")
+        self.assertEqual(client.get(self.url).status_code, 200)
+        user = self.users.get(username="revoked")
+        user.set_password("new")  # revokes every token issued with the old password
+        user.save()
+        response = client.get(self.url)
+        self.assertEqual((response.status_code, response.json()["code"]), (401, "password_changed"))
+
+        client = self.login("deactivated")
+        self.assertEqual(client.get(self.url).status_code, 200)
+        user = self.users.get(username="deactivated")
+        user.is_active = False
+        user.save()
+        self.assertEqual(client.get(self.url).json()["code"], "user_inactive")
+
+    @override_settings(JWT_USER_CACHE_TTL=1)
+    def test_changes_elsewhere_apply_after_ttl(self):
+        # update() sends no signals, like a write made by another worker
+        revoked, deactivated = self.login("revoked"), self.login("deactivated")
+        for client in (revoked, deactivated):
+            self.assertEqual(client.get(self.url).status_code, 200)
+        user = self.users.get(username="revoked")
+        user.set_password("new")
+        self.users.filter(pk=user.pk).update(password=user.password)
+        self.users.filter(username="deactivated").update(is_active=False)
+        for client in (revoked, deactivated):
+            self.assertEqual(client.get(self.url).status_code, 200)  # still within the TTL
+
+        time.sleep(1.1)
+        self.assertEqual(revoked.get(self.url).json()["code"], "password_changed")
+        self.assertEqual(deactivated.get(self.url).json()["code"], "user_inactive")
+
+    def test_group_changes(self):
+        client = self.login("staff")
+        self.assertEqual(client.post("/api/v1/reports/rebuild-derived/").status_code, 403)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users.get(username="staff").groups.add(Group.objects.create(name="Admin"))
+        self.assertEqual(client.post("/api/v1/reports/rebuild-derived/").status_code, 202)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.users.get(username="staff").groups.clear()
+        self.assertEqual(client.post("/api/v1/reports/rebuild-derived/").status_code, 403)
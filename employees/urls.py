@@ -3,10 +3,11 @@ Defines API routes for Employees and Performance endpoints.
 """
 
 from rest_framework.routers import DefaultRouter
-from .views import EmployeeViewSet, PerformanceViewSet
+from .views import EmployeeViewSet, PerformanceSummaryViewSet, PerformanceViewSet
 
 router = DefaultRouter()
 router.register(r"employees", EmployeeViewSet, basename="employee")
 router.register(r"performance", PerformanceViewSet, basename="performance")
+router.register(r"performance-summary", PerformanceSummaryViewSet, basename="performance-summary")
 
 urlpatterns = router.urls
@@ -7,30 +7,58 @@ JWT authentication required for all endpoints.
 from rest_framework import viewsets, filters
 from rest_framework.permissions import IsAuthenticated
 from django_filters.rest_framework import DjangoFilterBackend
-from .models import Employee, Performance
-from .serializers import EmployeeSerializer, PerformanceSerializer
+from .filters import PerformanceSummaryFilter
+from .models import Employee, Performance, PerformanceSummary
+from .search import EmployeeSearchFilter
+from .serializers import (PERFORMANCE_EXPORT_FIELDS, EmployeeSerializer, PerformanceSerializer,
+                          PerformanceSummarySerializer)
+from employee_project.conditional import ConditionalGetMixin
+from employee_project.exports import StreamingExportMixin
+from employee_project.fast_serializers import FastListMixin
+from employee_project.instrumentation import InstrumentedViewMixin
+from employee_project.pagination import OptionalKeysetPagination
+from employee_project.sparse import SparseFieldsetMixin
 
 
-class EmployeeViewSet(viewsets.ModelViewSet):
-    """CRUD API for employees with advanced filtering and search."""
-    queryset = Employee.objects.all()
+class EmployeeViewSet(InstrumentedViewMixin, ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, viewsets.ModelViewSet):
+    """CRUD API for employees with advanced filtering, ranked full-text search and ?fields=/?expand=."""
+    queryset = Employee.objects.select_related("department").all()
     serializer_class = EmployeeSerializer
     permission_classes = [IsAuthenticated]
-    filter_backends = [DjangoFilterBackend, filters.SearchFilter, filters.OrderingFilter]
+    filter_backends = [DjangoFilterBackend, EmployeeSearchFilter, filters.OrderingFilter]
     filterset_fields = {
         "department": ["exact"],
         "date_of_joining": ["gte", "lte"],
     }
     search_fields = ["name", "email", "phone_number", "address", "department__name"]
     ordering_fields = ["name", "date_of_joining", "department__name"]
+    etag_related = ("department",)
+    default_expand = ("department",)
 
 
-class PerformanceViewSet(viewsets.ModelViewSet):
+class PerformanceViewSet(InstrumentedViewMixin, ConditionalGetMixin, SparseFieldsetMixin, FastListMixin, StreamingExportMixin,
+                         viewsets.ModelViewSet):
     """CRUD API for performance reviews."""
     queryset = Performance.objects.select_related("employee").all()
     serializer_class = PerformanceSerializer
     permission_classes = [IsAuthenticated]
+    pagination_class = OptionalKeysetPagination
     filter_backends = [DjangoFilterBackend, filters.OrderingFilter, filters.SearchFilter]
     filterset_fields = {"employee": ["exact"], "rating": ["gte", "lte"]}
     search_fields = ["employee__name", "employee__email"]
     ordering_fields = ["rating", "review_date"]
+    etag_related = ("employee",)  # employee_name
+    export_filename = "performance"
+    export_fields = PERFORMANCE_EXPORT_FIELDS
+
+
+class PerformanceSummaryViewSet(InstrumentedViewMixin, ConditionalGetMixin, FastListMixin, viewsets.ReadOnlyModelViewSet):
+    """Latest rating, rolling average of the last 4 reviews and trend per employee."""
+    queryset = PerformanceSummary.objects.select_related("employee", "employee__department").all()
+    serializer_class = PerformanceSummarySerializer
+    permission_classes = [IsAuthenticated]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = PerformanceSummaryFilter
+    ordering_fields = ["rolling_avg", "trend", "latest_rating", "latest_review_date", "review_count",
+                       "employee__name", "employee__department__name"]
+    etag_related = ("employee", "employee__department")  # employee_name, department_name
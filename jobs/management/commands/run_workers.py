@@ -0,0 +1,142 @@
+import os
+import signal
+import socket
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from datetime import timedelta
+from multiprocessing import get_context
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.utils import timezone
+
+from jobs import runner, worker
+from jobs.models import Job
+
+REQUEUE_EVERY = 60  # seconds between stale-job checks while polling
+
+
+class Command(BaseCommand):
+    help = (
+        "Run queued background jobs (report exports, analytics rebuilds) in a pool "
+        "of worker processes. Stop with Ctrl+C or SIGTERM; running jobs are finished first."
+    )
+    next_requeue = 0.0
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--processes", type=int, default=min(4, os.cpu_count() or 1),
+            help="Worker processes (default=min(4, CPUs)); 0 runs jobs in this process",
+        )
+        parser.add_argument("--poll", type=float, default=2.0, help="Seconds between queue checks (default=2)")
+        parser.add_argument("--once", action="store_true", help="Exit when the queue is empty")
+        parser.add_argument("--max-jobs", type=int, help="Exit after this many jobs")
+        parser.add_argument(
+            "--stale-after", type=int, default=900,
+            help="Re-queue running jobs without a heartbeat for this many seconds (default=900)",
+        )
+        parser.add_argument(
+            "--max-attempts", type=int, default=3,
+            help="Give up on a job after this many claims (default=3)",
+        )
+
+    def handle(self, *args, **opts):
+        if opts["processes"] < 0 or opts["poll"] <= 0:
+            raise CommandError("--processes must not be negative and --poll must be positive.")
+        self.opts = opts
+        self.name = f"{socket.gethostname()}:{os.getpid()}"
+        self.stopping = False
+        self.done = 0
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            signal.signal(sig, self.stop)
+
+        self.requeue_stale()
+        self.stdout.write(f"👷 Worker {self.name} started with {opts['processes'] or 'no'} process(es).")
+        if opts["processes"]:
+            self.run_pool(opts["processes"])
+        else:
+            self.run_inline()
+        self.stdout.write(self.style.SUCCESS(f"✅ Worker {self.name} stopped after {self.done} job(s)."))
+
+    def stop(self, signum, frame):
+        if not self.stopping:
+            self.stdout.write("🛑 Stopping after the running jobs...")
+        self.stopping = True
+
+    def requeue_stale(self):
+        """Give jobs of dead workers back to the queue, at start and then every REQUEUE_EVERY seconds."""
+        now = time.monotonic()
+        if now < self.next_requeue:
+            return
+        self.next_requeue = now + min(REQUEUE_EVERY, self.opts["stale_after"])
+        requeued, failed = runner.requeue_stale(timedelta(seconds=self.opts["stale_after"]), self.opts["max_attempts"])
+        if requeued or failed:
+            self.stdout.write(self.style.WARNING(f"⚠️  Stale jobs: {requeued} re-queued, {failed} failed."))
+
+    def want_more(self):
+        limit = self.opts["max_jobs"]
+        return not self.stopping and (limit is None or self.done < limit)
+
+    def report(self, job_id, status):
+        self.done += 1
+        style = self.style.SUCCESS if status == Job.STATUS_SUCCEEDED else self.style.ERROR
+        self.stdout.write(style(f"   {'✔' if status == Job.STATUS_SUCCEEDED else '✖'} job #{job_id} {status}"))
+
+    # -------------------------------
+    # In-process mode (--processes 0)
+    # -------------------------------
+    def run_inline(self):
+        while self.want_more():
+            self.requeue_stale()
+            claimed = runner.claim(self.name, 1)
+            if not claimed:
+                if self.opts["once"]:
+                    return
+                time.sleep(self.opts["poll"])
+                continue
+            self.stdout.write(f"   ▶ job #{claimed[0]}")
+            self.report(claimed[0], runner.execute(claimed[0]))
+
+    # -------------------------------
+    # Process pool
+    # -------------------------------
+    def run_pool(self, processes):
+        connections.close_all()  # nothing to hand over: the pool spawns fresh interpreters
+        settings_module = os.environ.get("DJANGO_SETTINGS_MODULE", "employee_project.settings")
+        running = {}
+        with ProcessPoolExecutor(max_workers=processes, mp_context=get_context("spawn"),
+                                 initializer=worker.init_process, initargs=(settings_module,)) as pool:
+            while running or self.want_more():
+                self.requeue_stale()
+                free = processes - len(running)
+                if free and self.want_more():
+                    limit = self.opts["max_jobs"]
+                    if limit is not None:
+                        free = min(free, limit - self.done - len(running))
+                    for job_id in runner.claim(self.name, free) if free > 0 else []:
+                        self.stdout.write(f"   ▶ job #{job_id}")
+                        running[pool.submit(worker.run_job, job_id)] = job_id
+                if not running:
+                    if self.opts["once"]:
+                        break
+                    time.sleep(self.opts["poll"])
+                    continue
+
+                finished, _ = wait(running, timeout=self.opts["poll"], return_when=FIRST_COMPLETED)
+                for future in finished:
+                    job_id = running.pop(future)
+                    try:
+                        status = future.result()
+                    except BrokenProcessPool:
+                        for lost in [job_id, *running.values()]:
+                            runner.fail(lost, "A worker process died while this job was running.")
+                        raise CommandError(f"A worker process died (running job #{job_id}); its jobs were failed.")
+                    except Exception as exc:
+                        runner.fail(job_id, f"Worker error: {exc!r}")
+                        status = Job.STATUS_FAILED
+                    self.report(job_id, status)
+                # Long steps may not report progress; keep their heartbeat fresh from here.
+                if running:
+                    Job.objects.filter(pk__in=list(running.values()), status=Job.STATUS_RUNNING).update(
+                        heartbeat_at=timezone.now())
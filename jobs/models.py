@@ -0,0 +1,87 @@
+"""
+Background jobs, queued in the database and run by ``manage.py run_workers``.
+
+A Job moves queued → running → succeeded / failed. Workers claim queued jobs
+with a conditional UPDATE (see jobs/runner.py), so no broker is needed and
+two workers never run the same job. Reports write their output to ``result``
+(a file under MEDIA_ROOT/reports/) and report ``progress`` (0-100) while
+they run; ``heartbeat_at`` moves with every progress update so jobs left
+behind by a crashed worker can be re-queued.
+"""
+
+from django.conf import settings
+from django.db import models
+from django.db.models.functions import Now
+from django.utils import timezone
+
+
+class Job(models.Model):
+    STATUS_QUEUED = "queued"
+    STATUS_RUNNING = "running"
+    STATUS_SUCCEEDED = "succeeded"
+    STATUS_FAILED = "failed"
+    STATUS_CHOICES = [
+        (STATUS_QUEUED, "Queued"),
+        (STATUS_RUNNING, "Running"),
+        (STATUS_SUCCEEDED, "Succeeded"),
+        (STATUS_FAILED, "Failed"),
+    ]
+
+    kind = models.CharField(max_length=50, help_text="Report name, see jobs/reports.py.")
+    params = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=10, choices=STATUS_CHOICES, default=STATUS_QUEUED)
+    progress = models.PositiveSmallIntegerField(default=0, help_text="Percent done.")
+    message = models.CharField(max_length=200, blank=True)
+    result = models.FileField(upload_to="reports/%Y/%m/", blank=True)
+    error = models.TextField(blank=True)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="jobs",
+    )
+    worker = models.CharField(max_length=100, blank=True, help_text="Worker that claimed the job.")
+    created_at = models.DateTimeField(auto_now_add=True)
+    started_at = models.DateTimeField(null=True, blank=True)
+    finished_at = models.DateTimeField(null=True, blank=True)
+    heartbeat_at = models.DateTimeField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True, db_default=Now())
+
+    class Meta:
+        ordering = ["-created_at", "-id"]
+        indexes = [
+            # the workers' claim query: oldest queued first
+            models.Index(fields=["status", "created_at"], name="idx_job_status_created"),
+        ]
+
+    def __str__(self):
+        return f"#{self.pk} {self.kind} ({self.status})"
+
+    @property
+    def finished(self):
+        return self.status in (self.STATUS_SUCCEEDED, self.STATUS_FAILED)
+
+    def set_progress(self, percent, message=None):
+        """Store progress (and refresh the heartbeat) without touching other fields."""
+        self.progress = max(0, min(100, int(percent)))
+        fields = {"progress": self.progress, "heartbeat_at": timezone.now(), "updated_at": Now()}
+        if message is not None:
+            self.message = fields["message"] = message[:200]
+        Job.objects.filter(pk=self.pk).update(**fields)
+
+
+class ImportCheckpoint(models.Model):
+    """
+    Progress of a CSV import (employee_project/imports.py), saved in the same
+    transaction as each chunk it describes, so ``--resume`` never re-reads a
+    committed chunk or skips an uncommitted one.
+    """
+
+    name = models.CharField(max_length=255, unique=True, help_text="Absolute path of the CSV, or --checkpoint.")
+    state = models.JSONField(default=dict)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name} ({self.state.get('rows', 0)} rows)"
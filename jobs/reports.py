@@ -0,0 +1,187 @@
+"""
+Reports that run as background jobs.
+
+Each Report subclass has a ``name`` (the job kind), a ``params_class``
+serializer that validates the parameters when the job is enqueued, and a
+``run(job, params)`` method executed by a worker with the validated params.
+``run`` reports progress through job.set_progress() and stores its output
+with save_result(). REPORTS maps every kind to its report.
+
+- attendance-export / performance-export: the same columns as the streaming
+  /export/ endpoints, as CSV or NDJSON, without the request timeout
+- attendance-matrix: the vectorized department report
+  (analytics/matrix.py) as a JSON file
+- rebuild-derived: recompute the rollups, packed calendar, performance
+  summaries and department headcounts (Admin only)
+"""
+
+import json
+import tempfile
+import time
+from datetime import timedelta
+
+from django.core.files import File
+from rest_framework import serializers
+
+from attendance.models import Attendance
+
+PROGRESS_EVERY = 5000  # rows between progress checks
+PROGRESS_INTERVAL = 1.0  # seconds between progress writes
+
+
+def save_result(job, filename, chunks):
+    """Write the text ``chunks`` to the job's result file under MEDIA_ROOT."""
+    with tempfile.TemporaryFile() as tmp:
+        for chunk in chunks:
+            tmp.write(chunk.encode("utf-8"))
+        tmp.seek(0)
+        job.result.save(filename, File(tmp), save=False)
+
+
+def track(job, rows, total, start=0, end=100):
+    """Yield ``rows`` while moving the job's progress from ``start`` to ``end``."""
+    last = time.monotonic()
+    for done, row in enumerate(rows, start=1):
+        yield row
+        if done % PROGRESS_EVERY == 0 and time.monotonic() - last >= PROGRESS_INTERVAL:
+            job.set_progress(start + (end - start) * done / max(total, 1), f"{done} of {total} rows")
+            last = time.monotonic()
+
+
+class Report:
+    name = None
+    params_class = serializers.Serializer
+    admin_only = False
+
+    def run(self, job, params):
+        raise NotImplementedError
+
+
+# -------------------------------
+# Exports
+# -------------------------------
+class ExportParams(serializers.Serializer):
+    format = serializers.ChoiceField(choices=["csv", "ndjson"], default="csv")
+    date_from = serializers.DateField(required=False)
+    date_to = serializers.DateField(required=False)
+    employee = serializers.IntegerField(required=False, min_value=1)
+    department = serializers.IntegerField(required=False, min_value=1)
+
+
+class AttendanceExportParams(ExportParams):
+    status = serializers.ChoiceField(choices=Attendance.STATUS_CHOICES, required=False)
+
+
+class PerformanceExportParams(ExportParams):
+    rating_min = serializers.IntegerField(required=False, min_value=1, max_value=5)
+    rating_max = serializers.IntegerField(required=False, min_value=1, max_value=5)
+
+
+class ExportReport(Report):
+    """Export the rows of a viewset's ``export_fields`` (employee_project/exports.py)."""
+
+    date_field = "date"
+    filters = {"employee": "employee_id", "department": "employee__department_id"}
+
+    def get_viewset(self):
+        raise NotImplementedError
+
+    def run(self, job, params):
+        viewset = self.get_viewset()()
+        queryset = viewset.get_queryset().order_by(self.date_field, "id")
+        if "date_from" in params:
+            queryset = queryset.filter(**{f"{self.date_field}__gte": params["date_from"]})
+        if "date_to" in params:
+            queryset = queryset.filter(**{f"{self.date_field}__lte": params["date_to"]})
+        queryset = queryset.filter(**{lookup: params[key] for key, lookup in self.filters.items() if key in params})
+
+        total = queryset.count()
+        job.set_progress(0, f"Exporting {total} rows")
+        lookups = [lookup for _, lookup in viewset.export_fields]
+        rows = track(job, queryset.values_list(*lookups).iterator(chunk_size=viewset.export_chunk_size), total)
+        fmt = params["format"]
+        stream = viewset.stream_csv(rows) if fmt == "csv" else viewset.stream_ndjson(rows)
+        save_result(job, f"{viewset.export_filename}.{fmt}", stream)
+        job.message = f"{total} rows"
+
+
+class AttendanceExport(ExportReport):
+    name = "attendance-export"
+    params_class = AttendanceExportParams
+    filters = {**ExportReport.filters, "status": "status"}
+
+    def get_viewset(self):
+        from attendance.views import AttendanceViewSet
+        return AttendanceViewSet
+
+
+class PerformanceExport(ExportReport):
+    name = "performance-export"
+    params_class = PerformanceExportParams
+    date_field = "review_date"
+    filters = {**ExportReport.filters, "rating_min": "rating__gte", "rating_max": "rating__lte"}
+
+    def get_viewset(self):
+        from employees.views import PerformanceViewSet
+        return PerformanceViewSet
+
+
+# -------------------------------
+# Analytics
+# -------------------------------
+class AttendanceMatrixParams(serializers.Serializer):
+    department = serializers.IntegerField(min_value=1)
+    start = serializers.DateField()
+    end = serializers.DateField()
+
+    def validate(self, attrs):
+        from analytics import matrix  # NumPy is imported on first use, not at startup
+
+        if not matrix.available():
+            raise serializers.ValidationError("NumPy is not installed on the server.")
+        if attrs["end"] < attrs["start"]:
+            raise serializers.ValidationError("end must not be before start.")
+        if attrs["end"] - attrs["start"] >= timedelta(days=366):
+            raise serializers.ValidationError("At most 366 days per report.")
+        return attrs
+
+
+class AttendanceMatrixReport(Report):
+    name = "attendance-matrix"
+    params_class = AttendanceMatrixParams
+
+    def run(self, job, params):
+        from analytics import matrix
+
+        report = matrix.department_report(params["department"], params["start"], params["end"])
+        save_result(job, f"attendance-matrix-{params['department']}.json", [json.dumps(report)])
+        job.message = f"{len(report['employees'])} employees over {report['days']} days"
+
+
+class RebuildDerived(Report):
+    """The rebuild_* / reconcile_headcounts commands in one job."""
+
+    name = "rebuild-derived"
+    admin_only = True
+
+    def run(self, job, params):
+        from analytics import rollups
+        from attendance import calendar
+        from departments import headcount
+        from employees import performance
+
+        steps = [
+            ("attendance rollups", rollups.rebuild),
+            ("attendance calendar", calendar.rebuild),
+            ("performance summaries", performance.refresh),
+            ("department headcounts", headcount.recount),
+        ]
+        for i, (label, step) in enumerate(steps):
+            job.set_progress(100 * i / len(steps), f"Rebuilding {label}")
+            step()
+        job.message = "Rebuilt " + ", ".join(label for label, _ in steps)
+
+
+REPORTS = {report.name: report for report in (
+    AttendanceExport(), PerformanceExport(), AttendanceMatrixReport(), RebuildDerived(),
+)}
@@ -0,0 +1,90 @@
+"""
+Enqueueing, claiming and executing jobs.
+
+claim() takes queued jobs with ``UPDATE ... WHERE id = ? AND status =
+'queued'``: only one worker's update matches a given row, on every database
+backend, so no row locks or broker are needed. execute() runs one claimed job
+and records the outcome; it is what each process of the run_workers pool
+calls. requeue_stale() gives jobs of a worker that died (no heartbeat for a
+while) back to the queue, up to a maximum number of attempts.
+"""
+
+import logging
+
+from django.db import close_old_connections
+from django.db.models import F
+from django.utils import timezone
+
+from .models import Job
+from .reports import REPORTS
+
+logger = logging.getLogger(__name__)
+
+
+def enqueue(kind, params=None, user=None):
+    """Queue a job of ``kind`` with already validated, JSON-ready ``params``."""
+    return Job.objects.create(kind=kind, params=params or {}, created_by_id=getattr(user, "pk", None))
+
+
+def claim(worker, limit):
+    """Claim up to ``limit`` queued jobs (oldest first) for ``worker``; returns their ids."""
+    claimed = []
+    candidates = (Job.objects
+                  .filter(status=Job.STATUS_QUEUED)
+                  .order_by("created_at", "id")
+                  .values_list("pk", flat=True)[:limit * 2])
+    for pk in candidates:
+        now = timezone.now()
+        won = Job.objects.filter(pk=pk, status=Job.STATUS_QUEUED).update(
+            status=Job.STATUS_RUNNING, worker=worker, started_at=now, heartbeat_at=now,
+            attempts=F("attempts") + 1, progress=0, error="", updated_at=now,
+        )
+        if won:
+            claimed.append(pk)
+            if len(claimed) == limit:
+                break
+    return claimed
+
+
+def execute(job_id):
+    """Run a claimed job; returns its final status."""
+    close_old_connections()
+    job = Job.objects.get(pk=job_id)
+    report = REPORTS.get(job.kind)
+    try:
+        if report is None:
+            raise ValueError(f"Unknown job kind {job.kind!r}.")
+        params = report.params_class(data=job.params)
+        params.is_valid(raise_exception=True)
+        report.run(job, params.validated_data)
+    except Exception as exc:
+        # The traceback goes to the log; clients polling the job only see the error
+        logger.exception("Job %s (%s) failed", job.pk, job.kind)
+        job.status, job.error = Job.STATUS_FAILED, f"{type(exc).__name__}: {exc}"
+    else:
+        job.status, job.progress = Job.STATUS_SUCCEEDED, 100
+    job.finished_at = job.heartbeat_at = timezone.now()
+    job.save(update_fields=["status", "progress", "message", "result", "error",
+                            "finished_at", "heartbeat_at", "updated_at"])
+    close_old_connections()
+    return job.status
+
+
+def fail(job_id, error):
+    """Mark a job as failed outside execute() (e.g. its worker process crashed)."""
+    now = timezone.now()
+    Job.objects.filter(pk=job_id, status=Job.STATUS_RUNNING).update(
+        status=Job.STATUS_FAILED, error=error, finished_at=now, heartbeat_at=now, updated_at=now,
+    )
+
+
+def requeue_stale(after, max_attempts):
+    """Re-queue running jobs whose heartbeat is older than ``after``; returns (requeued, failed)."""
+    now = timezone.now()
+    stale = Job.objects.filter(status=Job.STATUS_RUNNING, heartbeat_at__lt=now - after)
+    failed = stale.filter(attempts__gte=max_attempts).update(
+        status=Job.STATUS_FAILED, error="Worker lost; no attempts left.", finished_at=now, updated_at=now,
+    )
+    requeued = stale.update(status=Job.STATUS_QUEUED, worker="", updated_at=now)
+    return requeued, failed
+
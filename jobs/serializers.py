@@ -0,0 +1,37 @@
+"""
+Serializers for background jobs.
+"""
+
+from rest_framework import serializers
+from rest_framework.reverse import reverse
+
+from .models import Job
+
+
+class JobSerializer(serializers.ModelSerializer):
+    """A job as polled by clients; ``result_url`` is set once the result file exists."""
+
+    result_url = serializers.SerializerMethodField()
+
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "kind",
+            "params",
+            "status",
+            "progress",
+            "message",
+            "error",
+            "attempts",
+            "created_at",
+            "started_at",
+            "finished_at",
+            "result_url",
+        ]
+        read_only_fields = fields
+
+    def get_result_url(self, job):
+        if job.status != Job.STATUS_SUCCEEDED or not job.result:
+            return None
+        return reverse("job-result", args=[job.pk], request=self.context.get("request"))
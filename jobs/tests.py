@@ -0,0 +1,94 @@
+import shutil
+import tempfile
+from datetime import date, timedelta
+from io import StringIO
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from attendance.models import Attendance
+from departments.models import Department
+from employees.models import Employee
+from . import runner
+from .management.commands import run_workers
+from .models import Job
+
+
+class JobTests(TestCase):
+    """Reports are queued through the API and finished by run_workers."""
+
+    @classmethod
+    def setUpTestData(cls):
+        dept = Department.objects.create(name="Engineering")
+        emp = Employee.objects.create(name="Ada", email="ada@example.com",
+                                      date_of_joining=date(2024, 1, 1), department=dept)
+        for d in range(5):
+            Attendance.objects.create(employee=emp, date=date(2025, 3, 3) + timedelta(days=d),
+                                      status=Attendance.STATUS_PRESENT if d % 2 else Attendance.STATUS_LATE)
+        User = get_user_model()
+        cls.admin = User.objects.create_superuser("admin", "admin@example.com", "pw")
+        cls.user = User.objects.create_user("staff", "staff@example.com", "pw")
+
+    def setUp(self):
+        media = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media)
+        self.enterContext(override_settings(MEDIA_ROOT=media))
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def test_export_job(self):
+        response = self.client.post("/api/v1/reports/attendance-export/",
+                                    {"date_from": "2025-03-04", "status": "Late"}, format="json")
+        self.assertEqual(response.status_code, 202)
+        self.assertEqual(response.json()["status"], "queued")
+        poll = response["Location"]
+
+        call_command("run_workers", "--processes", "0", "--once", stdout=StringIO())
+        job = self.client.get(poll).json()
+        self.assertEqual((job["status"], job["progress"], job["message"]), ("succeeded", 100, "2 rows"))
+        download = self.client.get(job["result_url"])
+        lines = b"".join(download.streaming_content).decode().splitlines()
+        self.assertEqual(lines[0], "id,employee_id,employee_name,employee_email,department,date,status")
+        self.assertEqual([line.rsplit(",", 2)[1:] for line in lines[1:]],
+                         [["2025-03-05", "Late"], ["2025-03-07", "Late"]])
+
+    def test_access_and_claiming(self):
+        self.assertEqual(self.client.post("/api/v1/reports/rebuild-derived/").status_code, 403)
+        self.assertEqual(self.client.post("/api/v1/reports/attendance-export/", {"format": "xml"}).status_code, 400)
+        self.assertEqual(self.client.post("/api/v1/reports/nothing/").status_code, 404)
+
+        mine = runner.enqueue("attendance-export", {"format": "csv"}, self.user)
+        other = runner.enqueue("rebuild-derived", {}, self.admin)
+        self.assertEqual([j["id"] for j in self.client.get("/api/v1/jobs/").json()["results"]], [mine.pk])
+
+        self.assertEqual(runner.claim("w1", 1), [mine.pk])
+        self.assertEqual(runner.claim("w2", 5), [other.pk])  # never handed out twice
+        Job.objects.filter(pk=mine.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+        self.assertEqual(runner.requeue_stale(timedelta(minutes=15), max_attempts=3), (1, 0))
+        self.assertEqual(runner.execute(other.pk), Job.STATUS_SUCCEEDED)
+
+    def test_failure_hides_the_traceback(self):
+        job = runner.enqueue("nothing", {}, self.user)
+        runner.claim("w1", 1)
+        with self.assertLogs("jobs.runner", "ERROR") as logs:
+            self.assertEqual(runner.execute(job.pk), Job.STATUS_FAILED)
+        self.assertIn("Traceback", logs.output[0])
+        self.assertEqual(self.client.get(f"/api/v1/jobs/{job.pk}/").json()["error"],
+                         "ValueError: Unknown job kind 'nothing'.")
+
+    def test_stale_jobs_are_requeued_while_polling(self):
+        job = runner.enqueue("attendance-export", {}, self.user)
+        command = run_workers.Command(stdout=StringIO())
+        command.opts = {"stale_after": 900, "max_attempts": 3}
+        requeued = []
+        with mock.patch.object(run_workers.time, "monotonic", side_effect=[1000, 1030, 1061]):
+            for _ in range(3):
+                runner.claim("lost", 1)
+                Job.objects.filter(pk=job.pk).update(heartbeat_at=timezone.now() - timedelta(hours=1))
+                command.requeue_stale()
+                requeued.append(Job.objects.get(pk=job.pk).status)
+        self.assertEqual(requeued, [Job.STATUS_QUEUED, Job.STATUS_RUNNING, Job.STATUS_QUEUED])
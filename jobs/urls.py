@@ -0,0 +1,15 @@
+"""
+Defines API routes for background reports and their jobs.
+"""
+
+from django.urls import path
+from rest_framework.routers import DefaultRouter
+from .views import JobViewSet, ReportView
+
+router = DefaultRouter()
+router.register(r"jobs", JobViewSet, basename="job")
+
+urlpatterns = [
+    path("reports/", ReportView.as_view(), name="report-list"),
+    path("reports/<slug:kind>/", ReportView.as_view(), name="report-enqueue"),
+] + router.urls
@@ -0,0 +1,83 @@
+"""
+Report and job endpoints.
+
+POST /api/v1/reports/{kind}/      queue a report (body = its parameters), 202 + job
+GET  /api/v1/reports/             available report kinds
+GET  /api/v1/jobs/                your jobs (everyone's for Admins)
+GET  /api/v1/jobs/{id}/           poll status and progress
+GET  /api/v1/jobs/{id}/result/    download the result file
+"""
+
+import os
+
+from django.http import FileResponse
+from rest_framework import status, viewsets
+from rest_framework.decorators import action
+from rest_framework.exceptions import NotFound, PermissionDenied
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.reverse import reverse
+from rest_framework.views import APIView
+
+from employee_project.instrumentation import InstrumentedViewMixin
+from employees.permissions import in_group
+from . import runner
+from .models import Job
+from .reports import REPORTS
+from .serializers import JobSerializer
+
+
+def is_admin(user):
+    return user.is_superuser or in_group(user, "Admin")
+
+
+class ReportView(InstrumentedViewMixin, APIView):
+    """Queue a background report and return its job for polling."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, kind=None):
+        available = {name: report for name, report in REPORTS.items()
+                     if not report.admin_only or is_admin(request.user)}
+        if kind is not None and kind not in available:
+            raise NotFound(f"Unknown report {kind!r}.")
+        described = [
+            {"kind": name, "admin_only": report.admin_only, "params": list(report.params_class().fields)}
+            for name, report in available.items()
+            if kind in (None, name)
+        ]
+        return Response(described if kind is None else described[0])
+
+    def post(self, request, kind=None):
+        report = REPORTS.get(kind)
+        if report is None:
+            raise NotFound(f"Unknown report {kind!r}.")
+        if report.admin_only and not is_admin(request.user):
+            raise PermissionDenied("Only admins can run this report.")
+        params = report.params_class(data=request.data)
+        params.is_valid(raise_exception=True)
+        job = runner.enqueue(kind, params.data, request.user)
+        data = JobSerializer(job, context={"request": request}).data
+        location = reverse("job-detail", args=[job.pk], request=request)
+        return Response(data, status=status.HTTP_202_ACCEPTED, headers={"Location": location})
+
+
+class JobViewSet(InstrumentedViewMixin, viewsets.ReadOnlyModelViewSet):
+    """Background jobs of the current user, with progress and result download."""
+
+    serializer_class = JobSerializer
+    permission_classes = [IsAuthenticated]
+
+    def get_queryset(self):
+        jobs = Job.objects.all()
+        if not is_admin(self.request.user):
+            jobs = jobs.filter(created_by_id=self.request.user.pk)
+        return jobs
+
+    @action(detail=True, methods=["get"], url_path="result")
+    def result(self, request, pk=None):
+        """The result file of a finished job, as an attachment."""
+        job = self.get_object()
+        if job.status != Job.STATUS_SUCCEEDED or not job.result:
+            raise NotFound("This job has no result file (yet).")
+        return FileResponse(job.result.open("rb"), as_attachment=True, filename=os.path.basename(job.result.name))
@@ -0,0 +1,24 @@
+"""
+Entry points for run_workers' process pool.
+
+The pool spawns fresh interpreters (no inherited database sockets), which
+import this module before Django is set up, so it must not import models at
+module level.
+"""
+
+import os
+import signal
+
+
+def init_process(settings_module):
+    """Pool initializer: set up Django once per process."""
+    # Ctrl+C reaches the whole process group; the parent decides when to stop.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    os.environ.setdefault("DJANGO_SETTINGS_MODULE", settings_module)
+    import django
+    django.setup()
+
+
+def run_job(job_id):
+    from .runner import execute
+    return execute(job_id)